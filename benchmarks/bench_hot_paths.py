@@ -0,0 +1,284 @@
+"""
+Headless benchmarks for the widget, menu and settings hot paths.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_hot_paths                   # run and print results
+    python -m benchmarks.bench_hot_paths --save-baseline   # also store them as the baseline
+    python -m benchmarks.bench_hot_paths --compare         # flag regressions against the baseline
+
+Qt's offscreen platform is used unless QT_QPA_PLATFORM is already set. Settings writes
+go to a temporary copy of user_settings.json, never to the real file.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QIcon, QMouseEvent
+from PySide6.QtWidgets import QApplication
+
+from src.state.state_manager import StateManager
+from src.ui.menu_button_widget import MenuButtonWidget
+from src.ui.widget import FloatingWidget
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baselines", "baseline.json")
+
+LABELS = [
+    "Settings", "Quick Notes", "Clipboard Manager", "Screenshot", "Quick Timer", "Pomodoro",
+    "Stopwatch", "Calculator", "Weather", "Calendar", "Apps", "Files", "Folders",
+    "System Monitor", "Counter", "Currency", "Units",
+    "A considerably longer label that has to wrap onto two lines and then be cut",
+    "Supercalifragilisticexpialidocious", "x" * 120,
+    "Clipboard entry: the quick brown fox jumps over the lazy dog, again and again and again",
+]
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of this process in KiB (0 where getrusage is unavailable)."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def summarize(samples_ns: List[int]) -> Dict[str, float]:
+    samples_ms = sorted(ns / 1_000_000 for ns in samples_ns)
+
+    def percentile(p: float) -> float:
+        index = min(len(samples_ms) - 1, int(round(p / 100 * (len(samples_ms) - 1))))
+        return round(samples_ms[index], 4)
+
+    return {
+        "samples": len(samples_ms),
+        "mean_ms": round(statistics.fmean(samples_ms), 4),
+        "p50_ms": percentile(50),
+        "p90_ms": percentile(90),
+        "p99_ms": percentile(99),
+        "max_ms": round(samples_ms[-1], 4),
+    }
+
+
+def measure(func: Callable[[int], None], iterations: int, warmup: int = 3) -> List[int]:
+    """Calls func(i) iterations times after a short warm-up and returns per-call durations."""
+    for i in range(warmup):
+        func(i)
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        func(i)
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def mouse_move(widget, global_x: int, global_y: int) -> QMouseEvent:
+    local = widget.mapFromGlobal(QPointF(global_x, global_y))
+    return QMouseEvent(QEvent.MouseMove, local, QPointF(global_x, global_y),
+                       Qt.NoButton, Qt.LeftButton, Qt.NoModifier)
+
+
+class HotPathBenchmarks:
+    def __init__(self, app: QApplication, iterations: int) -> None:
+        self.app = app
+        self.iterations = iterations
+        self.state_manager = StateManager()
+        # Redirect settings writes to a scratch copy of user_settings.json
+        self.scratch_dir = tempfile.mkdtemp(prefix="chill_bench_")
+        settings_manager = self.state_manager.settings_manager
+        scratch_file = os.path.join(self.scratch_dir, "user_settings.json")
+        if os.path.exists(settings_manager.user_settings_file):
+            shutil.copy(settings_manager.user_settings_file, scratch_file)
+        settings_manager.user_settings_file = scratch_file
+
+    def close(self) -> None:
+        self.state_manager.settings_manager.flush()
+        shutil.rmtree(self.scratch_dir, ignore_errors=True)
+
+    def bench_widget_construction(self) -> List[int]:
+        widgets = []
+
+        def construct(_):
+            widget = FloatingWidget(state_manager=self.state_manager)
+            widgets.append(widget)
+
+        samples = measure(construct, self.iterations)
+        for widget in widgets:
+            widget.deleteLater()
+        QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        return samples
+
+    def bench_resize_drag(self, moves: int = 200) -> List[int]:
+        widget = FloatingWidget(state_manager=self.state_manager)
+        widget.show()
+        origin = widget.geometry().bottomRight()
+        widget.resizing = True
+        widget.resize_origin = origin
+        widget.original_size = widget.geometry()
+        span = widget.max_size - widget.min_size
+
+        def move(i):
+            offset = (i % span) - span // 2
+            widget.mouseMoveEvent(mouse_move(widget, origin.x() + offset, origin.y() + offset))
+
+        samples = measure(move, moves)
+        widget.resizing = False
+        widget.close()
+        return samples
+
+    def bench_drag_clamp(self, moves: int = 500) -> List[int]:
+        widget = FloatingWidget(state_manager=self.state_manager)
+        widget.show()
+        widget.dragging = True
+        widget.drag_offset = widget.rect().center()
+        screen_geom = widget.screen().availableGeometry()
+
+        def move(i):
+            # Sweep across the screen and past its edges so clamping kicks in
+            x = screen_geom.left() - 100 + (i * 37) % (screen_geom.width() + 200)
+            y = screen_geom.top() - 100 + (i * 23) % (screen_geom.height() + 200)
+            widget.mouseMoveEvent(mouse_move(widget, x, y))
+
+        samples = measure(move, moves)
+        widget.dragging = False
+        widget.close()
+        return samples
+
+    def bench_widget_paint(self, repaints: int = 500) -> List[int]:
+        widget = FloatingWidget(state_manager=self.state_manager)
+        widget.show()
+        self.app.processEvents()
+        handle_rect = widget._get_handle_rect()
+
+        def paint(i):
+            # Alternate full repaints with the handle-only repaints hover updates produce
+            if i % 2 and not handle_rect.isEmpty():
+                widget.repaint(handle_rect)
+            else:
+                widget.repaint()
+
+        samples = measure(paint, repaints)
+        widget.close()
+        return samples
+
+    def bench_toggle_menu(self, cycles: int = 100) -> List[int]:
+        widget = FloatingWidget(state_manager=self.state_manager)
+        widget.show()
+
+        def cycle(_):
+            widget.toggle_menu()
+            widget.toggle_menu()
+            self.app.processEvents()
+
+        samples = measure(cycle, cycles)
+        widget.close()
+        return samples
+
+    def bench_truncate_labels(self) -> List[int]:
+        button = MenuButtonWidget(QIcon(), "x")
+        font = button._text_label.font()
+
+        def truncate(_):
+            for label in LABELS:
+                button._truncate_to_two_lines(label, font, 80)
+
+        return measure(truncate, self.iterations * 10)
+
+    def bench_settings_burst(self, burst: int = 100) -> List[int]:
+        settings_manager = self.state_manager.settings_manager
+
+        def update_burst(i):
+            for j in range(burst):
+                settings_manager.update_setting("last_position", {"x": i, "y": j})
+
+        samples = measure(update_burst, max(5, self.iterations // 2), warmup=1)
+        settings_manager.flush()
+        return samples
+
+    def run(self) -> Dict[str, Dict[str, float]]:
+        benchmarks = {
+            "widget_construction": self.bench_widget_construction,
+            "resize_drag_move": self.bench_resize_drag,
+            "drag_clamp_move": self.bench_drag_clamp,
+            "widget_paint": self.bench_widget_paint,
+            "toggle_menu_cycle": self.bench_toggle_menu,
+            "truncate_label_corpus": self.bench_truncate_labels,
+            "settings_update_burst": self.bench_settings_burst,
+        }
+        results = {}
+        for name, bench in benchmarks.items():
+            results[name] = summarize(bench())
+            results[name]["peak_rss_kb"] = peak_rss_kb()
+            print(f"{name:<24} p50 {results[name]['p50_ms']:>9.3f} ms  p90 {results[name]['p90_ms']:>9.3f} ms"
+                  f"  p99 {results[name]['p99_ms']:>9.3f} ms  rss {results[name]['peak_rss_kb']:>8} KiB")
+        return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """Returns a message for every benchmark whose p50 or p90 got slower than the baseline allows."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for key in ("p50_ms", "p90_ms"):
+            if base[key] > 0 and result[key] > base[key] * (1 + threshold):
+                regressions.append(f"{name}: {key} {result[key]:.3f} ms vs baseline {base[key]:.3f} ms")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before a result counts as a regression (0.25 = 25%%)")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    benchmarks = HotPathBenchmarks(app, args.iterations)
+    try:
+        results = benchmarks.run()
+    finally:
+        benchmarks.close()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+    exit_code = 0
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print("No baseline found at", args.baseline)
+        else:
+            with open(args.baseline, "r") as f:
+                baseline = json.load(f)
+            regressions = compare(results, baseline, args.threshold)
+            for message in regressions:
+                print("REGRESSION", message)
+            exit_code = 1 if regressions else 0
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=4)
+        print("Baseline saved to", args.baseline)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""
+Pre-rendered icon atlas.
+
+Build it after changing assets or assets_config.json:
+
+    python -m src.core.asset_atlas [--output assets/build] [--dprs 1,2]
+
+Every image referenced by assets_config.json is rendered at the logical size the UI
+draws it at (the widget's max_widget_size for main icons, the resize handle's largest
+size, MenuButtonWidget.ICON_SIZE for everything else) times each device pixel ratio,
+converted to premultiplied ARGB32 and written back to back into atlas.bin. atlas.json
+indexes the entries and records the config hash and source file stats, so a stale
+atlas is detected with a few stat() calls and ignored.
+
+At runtime AssetAtlas memory-maps atlas.bin; an image is one slice of the map wrapped
+in a QImage and copied, with no PNG/JPEG decoding.
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import sys
+import tempfile
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QImageReader
+
+ATLAS_VERSION = 1
+INDEX_FILE = "atlas.json"
+DATA_FILE = "atlas.bin"
+ALIGNMENT = 16
+# Matches MenuButtonWidget.ICON_SIZE; not imported to keep this module free of QtWidgets
+MENU_ICON_SIZE = 48
+
+
+def _file_sha1(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _source_stat(path: str) -> List[int]:
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp.", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class AssetAtlas:
+    """Read-only view of a built atlas. Use open(), which returns None if the atlas is missing or stale."""
+
+    def __init__(self, build_dir: str, index: Dict[str, object]) -> None:
+        self.build_dir = build_dir
+        # key -> [(width, height, offset)], smallest first
+        self.entries: Dict[str, List[Tuple[int, int, int]]] = {
+            key: sorted((w, h, offset) for w, h, _dpr, offset in levels)
+            for key, levels in index["assets"].items()
+        }
+        self._file = open(os.path.join(build_dir, DATA_FILE), "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+    @classmethod
+    def open(cls, build_dir: str, assets_config_file: str) -> Optional["AssetAtlas"]:
+        index_path = os.path.join(build_dir, INDEX_FILE)
+        try:
+            with open(index_path, "r") as f:
+                index = json.load(f)
+            if index.get("version") != ATLAS_VERSION:
+                return None
+            if index.get("config_sha1") != _file_sha1(assets_config_file):
+                return None
+            for path, stat in index.get("sources", {}).items():
+                if _source_stat(path) != stat:
+                    return None
+            return cls(build_dir, index)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def close(self) -> None:
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def image(self, key: str, min_edge: Optional[int] = None) -> Optional[QImage]:
+        """
+        Returns the smallest pre-rendered level of key whose longer edge is at least
+        min_edge (the largest level if none is, or if min_edge is not given), or None
+        if key is not in the atlas.
+        """
+        levels = self.entries.get(key)
+        if not levels:
+            return None
+        width, height, offset = levels[-1]
+        if min_edge is not None:
+            for level in levels:
+                if max(level[0], level[1]) >= min_edge:
+                    width, height, offset = level
+                    break
+        data = self._view[offset:offset + width * height * 4]
+        # copy() detaches the image from the map, which may be closed on reload
+        return QImage(data, width, height, width * 4, QImage.Format_ARGB32_Premultiplied).copy()
+
+
+def icon_edges(app_config: Dict[str, object]) -> Dict[str, int]:
+    """Returns the logical edge each kind of icon is drawn at, keyed by asset key prefix."""
+    max_widget_size = app_config.get("max_widget_size", 200)
+    return {
+        "main_icon": max_widget_size,
+        "resize_icon": max(10, int(max_widget_size * app_config.get("resize_icon_scale_factor", 0.2))),
+    }
+
+
+def build(assets_config_file: str, output_dir: str, app_config: Dict[str, object],
+          dprs: Sequence[float] = (1.0, 2.0)) -> Dict[str, object]:
+    """Renders every asset in the config into output_dir/atlas.bin and writes the index."""
+    with open(assets_config_file, "r") as f:
+        assets_config: Dict[str, str] = json.load(f)
+    edges = icon_edges(app_config)
+    os.makedirs(output_dir, exist_ok=True)
+
+    chunks: List[bytes] = []
+    offset = 0
+    shared: Dict[Tuple[str, int, int], int] = {}  # identical renders are stored once
+    assets: Dict[str, List[List[float]]] = {}
+    sources: Dict[str, List[int]] = {}
+    for key, path in sorted(assets_config.items()):
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        source = reader.read()
+        if source.isNull():
+            print(f"Skipping {key}: cannot read {path}")
+            continue
+        sources[path] = _source_stat(path)
+        edge = next((size for prefix, size in edges.items() if key.startswith(prefix)), MENU_ICON_SIZE)
+        levels = []
+        for dpr in sorted(set(dprs)):
+            target = max(1, int(edge * dpr))
+            image = source
+            if max(image.width(), image.height()) > target:
+                image = image.scaled(target, target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+            width, height = image.width(), image.height()
+            render_key = (path, width, height)
+            if render_key not in shared:
+                data = bytes(image.constBits())[:width * height * 4]
+                padding = -len(data) % ALIGNMENT
+                chunks.append(data + b"\0" * padding)
+                shared[render_key] = offset
+                offset += len(data) + padding
+            if not any(level[0] == width and level[1] == height for level in levels):
+                levels.append([width, height, dpr, shared[render_key]])
+        assets[key] = levels
+
+    index = {
+        "version": ATLAS_VERSION,
+        "format": "ARGB32_Premultiplied",
+        "config_sha1": _file_sha1(assets_config_file),
+        "sources": sources,
+        "assets": assets,
+        "bytes": offset,
+    }
+    # Data first, so a reader never sees an index pointing into a shorter atlas
+    _write_atomic(os.path.join(output_dir, DATA_FILE), b"".join(chunks))
+    _write_atomic(os.path.join(output_dir, INDEX_FILE), json.dumps(index, indent=1).encode("utf-8"))
+    return index
+
+
+def main(argv=None) -> int:
+    from src.core.settings_manager import SettingsManager
+
+    settings_manager = SettingsManager()
+    app_config = settings_manager.app_config
+    parser = argparse.ArgumentParser(description="Pre-render the icons in assets_config.json into an atlas")
+    parser.add_argument("--config", default=settings_manager.assets_config_file)
+    parser.add_argument("--output", default=app_config.get("config_paths", {}).get("asset_atlas_dir", "assets/build"))
+    parser.add_argument("--dprs", default=",".join(str(d) for d in app_config.get("asset_atlas_dprs", [1, 2])),
+                        help="comma-separated device pixel ratios to render for")
+    args = parser.parse_args(argv)
+
+    index = build(args.config, args.output, app_config, [float(d) for d in args.dprs.split(",") if d])
+    entries = sum(len(levels) for levels in index["assets"].values())
+    print(f"Wrote {len(index['assets'])} assets ({entries} levels, {index['bytes'] / 1024:.0f} KiB) to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
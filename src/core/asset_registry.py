@@ -0,0 +1,175 @@
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+
+from src.core.asset_atlas import AssetAtlas
+
+
+class AssetRegistry:
+    """
+    Process-wide access to the images listed in assets_config.json.
+
+    The asset config is parsed once. Decoded source images (QImage) and scaled
+    pixmaps (QPixmap) are kept in a single LRU cache bounded by a byte budget.
+    Pixmaps are keyed by (asset key, logical size, device pixel ratio, theme), so
+    asking twice for the same icon never touches the disk or the PNG decoder again.
+
+    If an up-to-date atlas built by src.core.asset_atlas exists in atlas_dir, images are
+    taken from it instead of decoding the source files, at the pre-rendered size closest
+    to what is asked for.
+    """
+    _instance = None
+
+    DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(AssetRegistry, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, assets_config_file: str, budget_bytes: int = DEFAULT_BUDGET_BYTES, debug: bool = False,
+                 atlas_dir: str = "") -> None:
+        if hasattr(self, 'initialized'):
+            return
+        self.assets_config_file = assets_config_file
+        self.budget_bytes = budget_bytes
+        self.debug = debug
+        self.asset_config: Dict[str, str] = self._load_asset_config()
+        self.atlas_dir = atlas_dir
+        self.atlas: Optional[AssetAtlas] = self._open_atlas()
+
+        self._cache: "OrderedDict[Tuple[Hashable, ...], object]" = OrderedDict()
+        self._cache_sizes: Dict[Tuple[Hashable, ...], int] = {}
+        self.cache_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.decodes = 0
+        self.initialized = True
+
+    def _load_asset_config(self) -> Dict[str, str]:
+        if not os.path.exists(self.assets_config_file):
+            if self.debug:
+                print("Assets config file not found:", self.assets_config_file)
+            return {}
+        try:
+            with open(self.assets_config_file, "r") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            return {}
+
+    def _open_atlas(self) -> Optional[AssetAtlas]:
+        if not self.atlas_dir:
+            return None
+        atlas = AssetAtlas.open(self.atlas_dir, self.assets_config_file)
+        if atlas is None and self.debug:
+            print("Asset atlas missing or out of date, decoding source images:", self.atlas_dir)
+        return atlas
+
+    def reload(self) -> None:
+        """Re-reads assets_config.json (and the atlas) and drops every cached image."""
+        self.asset_config = self._load_asset_config()
+        if self.atlas is not None:
+            self.atlas.close()
+        self.atlas = self._open_atlas()
+        self.clear()
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._cache_sizes.clear()
+        self.cache_bytes = 0
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def path(self, key: str) -> str:
+        """Returns the file path for an asset key, or "" if it is unknown or missing on disk."""
+        icon_path = self.asset_config.get(key, "")
+        if not icon_path or not os.path.exists(icon_path):
+            return ""
+        return icon_path
+
+    def image(self, key: str) -> Optional[QImage]:
+        """Returns the decoded source image for an asset key (decoded at most once while cached)."""
+        cache_key = ("image", key)
+        cached = self._get(cache_key)
+        if cached is not None:
+            return cached
+
+        if self.atlas is not None and key in self.atlas:
+            # The largest level (the highest-DPR render); callers build their own scaled versions from it
+            image = self.atlas.image(key)
+            self._put(cache_key, image, image.sizeInBytes())
+            return image
+
+        icon_path = self.path(key)
+        if not icon_path:
+            if self.debug:
+                print("Icon path not found:", self.asset_config.get(key))
+            return None
+        reader = QImageReader(icon_path)
+        reader.setAutoTransform(True)
+        image = reader.read()
+        self.decodes += 1
+        if image.isNull():
+            if self.debug:
+                print("Failed to load image from:", icon_path)
+            return None
+        self._put(cache_key, image, image.sizeInBytes())
+        return image
+
+    def pixmap(self, key: str, size: int, dpr: float = 1.0, theme=None) -> Optional[QPixmap]:
+        """
+        Returns the asset scaled to fit a size x size logical box at the given device pixel ratio.
+        If a CompiledTheme is given, key is treated as a tool name and resolved to the
+        theme's icon variant.
+        """
+        cache_key = ("pixmap", key, size, round(dpr, 3), theme.name if theme is not None else None)
+        cached = self._get(cache_key)
+        if cached is not None:
+            return cached
+
+        asset_key = theme.icon_key(key) if theme is not None else key
+        target_size = max(1, int(size * dpr))
+        if self.atlas is not None and asset_key in self.atlas:
+            # The closest pre-rendered level; usually already the exact size
+            image = self.atlas.image(asset_key, target_size)
+        else:
+            image = self.image(asset_key)
+        if image is None:
+            return None
+        if max(image.width(), image.height()) == target_size:
+            scaled_image = image
+        else:
+            scaled_image = image.scaled(target_size, target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        pixmap = QPixmap.fromImage(scaled_image)
+        pixmap.setDevicePixelRatio(dpr)
+        self._put(cache_key, pixmap, scaled_image.sizeInBytes())
+        return pixmap
+
+    # ------------------------------------------------------------------
+    # LRU cache
+    # ------------------------------------------------------------------
+    def _get(self, cache_key: Tuple[Hashable, ...]):
+        value = self._cache.get(cache_key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(cache_key)
+        self.hits += 1
+        return value
+
+    def _put(self, cache_key: Tuple[Hashable, ...], value, size_in_bytes: int) -> None:
+        if cache_key in self._cache:
+            self.cache_bytes -= self._cache_sizes.pop(cache_key)
+            del self._cache[cache_key]
+        self._cache[cache_key] = value
+        self._cache_sizes[cache_key] = size_in_bytes
+        self.cache_bytes += size_in_bytes
+        # Evict least recently used entries, but always keep the one just added.
+        while self.cache_bytes > self.budget_bytes and len(self._cache) > 1:
+            old_key, _ = self._cache.popitem(last=False)
+            self.cache_bytes -= self._cache_sizes.pop(old_key)
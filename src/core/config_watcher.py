@@ -0,0 +1,116 @@
+import hashlib
+import os
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+
+class ConfigWatcher(QObject):
+    """
+    Watches the config files and reloads them when they change on disk.
+
+    A change is only acted on when a file's (mtime, size) differs and its content hash
+    differs too, and writes made by SettingsManager itself are recognised by their hash
+    and ignored. After a reload the changed keys are emitted through settingChanged and,
+    for the keys the UI cares about, through a typed signal so each widget can update
+    just the affected part.
+    """
+    settingChanged = Signal(str, object)
+    themeChanged = Signal(str)
+    menuSizeChanged = Signal(str)
+    widgetSizeChanged = Signal(int)
+    enabledToolsChanged = Signal(list)
+    themeColorsChanged = Signal()
+    assetsChanged = Signal()
+
+    TYPED_SIGNALS = {
+        "theme": "themeChanged",
+        "menu_size": "menuSizeChanged",
+        "last_widget_size": "widgetSizeChanged",
+        "enabled_tools": "enabledToolsChanged",
+    }
+
+    def __init__(self, state_manager, debounce_ms: int = 100, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        settings_manager = state_manager.settings_manager
+        self.debug: bool = settings_manager.app_config.get("debug", False)
+        self.settings_files = {settings_manager.user_settings_file, settings_manager.default_settings_file}
+        self.theme_colors_file = settings_manager.theme_colors_file
+        self.assets_config_file = settings_manager.assets_config_file
+        self.files = sorted(self.settings_files | {self.theme_colors_file, self.assets_config_file})
+
+        self.reloads = 0
+        self.skipped = 0
+        self._fingerprints: Dict[str, Tuple[int, int, str]] = {
+            path: self._fingerprint(path, None) for path in self.files
+        }
+
+        # Editors and our own atomic writes replace files, so watch the directories as well
+        self._watcher = QFileSystemWatcher(self)
+        directories = sorted({os.path.dirname(os.path.abspath(path)) for path in self.files})
+        self._watcher.addPaths(directories + [path for path in self.files if os.path.exists(path)])
+        self._watcher.fileChanged.connect(self._schedule_check)
+        self._watcher.directoryChanged.connect(self._schedule_check)
+
+        # Coalesce the bursts of notifications a single save produces
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self.check)
+
+    @staticmethod
+    def _fingerprint(path: str, previous: Optional[Tuple[int, int, str]]) -> Tuple[int, int, str]:
+        """Returns (mtime_ns, size, sha1); the file is only hashed if mtime or size moved."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return 0, -1, ""
+        if previous and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size:
+            return previous
+        try:
+            with open(path, "rb") as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            digest = ""
+        return stat.st_mtime_ns, stat.st_size, digest
+
+    def _schedule_check(self, _path: str = "") -> None:
+        self._debounce.start()
+
+    def check(self) -> None:
+        """Reloads whatever changed since the last check and emits the resulting signals."""
+        watched = set(self._watcher.files())
+        changed_files = set()
+        for path in self.files:
+            if path not in watched and os.path.exists(path):
+                self._watcher.addPath(path)
+            previous = self._fingerprints.get(path)
+            current = self._fingerprint(path, previous)
+            self._fingerprints[path] = current
+            if previous is None or current[2] != previous[2]:
+                changed_files.add(path)
+
+        own_write = self.state_manager.settings_manager.last_written_digest
+        user_settings_file = self.state_manager.settings_manager.user_settings_file
+        if user_settings_file in changed_files and self._fingerprints[user_settings_file][2] == own_write:
+            changed_files.discard(user_settings_file)
+
+        if not changed_files:
+            self.skipped += 1
+            return
+        self.reloads += 1
+        if self.debug:
+            print("Config changed on disk:", ", ".join(sorted(changed_files)))
+
+        if changed_files & self.settings_files:
+            for key, value in self.state_manager.reload_settings().items():
+                self.settingChanged.emit(key, value)
+                signal_name = self.TYPED_SIGNALS.get(key)
+                if signal_name and value is not None:
+                    getattr(self, signal_name).emit(value)
+        if self.theme_colors_file in changed_files:
+            self.themeColorsChanged.emit()
+        if self.assets_config_file in changed_files:
+            self.state_manager.asset_registry.reload()
+            self.assetsChanged.emit()
@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from src.core.unit_converter import UnitGraph
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp.", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class CurrencyRates(QObject):
+    """
+    Exchange rates that work offline.
+
+    Rates are read from cache_file (the last successful download), falling back to the
+    table bundled in seed_file. When a URL is configured and the cache is older than
+    max_age seconds, refresh() downloads new rates on a worker thread, writes them to
+    the cache and emits "updated"; without network the cached table simply stays in use.
+    The URL must return JSON of the form {"base": "EUR", "date": "...", "rates": {"USD": 1.08, ...}}.
+
+    Rates are kept as a one-category UnitGraph, so converting an amount into every
+    currency is the same single pass as for units.
+    """
+    updated = Signal()
+
+    def __init__(self, cache_file: str, seed_file: str, url: str = "", max_age: float = 86400.0,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.cache_file = cache_file
+        self.seed_file = seed_file
+        self.url = url
+        self.max_age = max_age
+        self.base = ""
+        self.date = ""
+        self.fetched_at = 0.0
+        self.error = ""
+        self.graph = UnitGraph(definitions={}, temperatures={})
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        if not self._apply(self._read(cache_file)):
+            self._apply(self._read(seed_file))
+
+    @staticmethod
+    def _read(path: str) -> Dict:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _apply(self, table: Dict) -> bool:
+        base = table.get("base")
+        rates = table.get("rates")
+        if not isinstance(base, str) or not isinstance(rates, dict):
+            return False
+        edges = [(code, 1.0 / float(rate), base) for code, rate in rates.items()
+                 if code != base and isinstance(rate, (int, float)) and rate > 0]
+        if not edges:
+            return False
+        graph = UnitGraph(definitions={"currency": edges}, temperatures={})
+        with self._lock:
+            self.graph = graph
+            self.base = base
+            self.date = str(table.get("date", ""))
+            self.fetched_at = float(table.get("fetched_at", 0.0))
+        return True
+
+    @property
+    def currencies(self) -> List[str]:
+        return sorted(self.graph.units.get("currency", []))
+
+    @property
+    def stale(self) -> bool:
+        return time.time() - self.fetched_at > self.max_age
+
+    def convert(self, amount: float, from_code: str, to_code: str) -> float:
+        return self.graph.convert(amount, from_code, to_code)
+
+    def convert_all(self, amount: float, from_code: str,
+                    targets: Optional[List[str]] = None) -> List[Tuple[str, float]]:
+        return self.graph.convert_all(amount, from_code, targets or self.currencies)
+
+    def refresh(self, force: bool = False) -> bool:
+        """Starts a download if a URL is configured and the rates are stale. Returns True if one started."""
+        if not self.url or (not force and not self.stale):
+            return False
+        if self._worker is not None and self._worker.is_alive():
+            return False
+        self._worker = threading.Thread(target=self._download, name="CurrencyRates", daemon=True)
+        self._worker.start()
+        return True
+
+    def _download(self) -> None:
+        try:
+            with urllib.request.urlopen(self.url, timeout=10) as response:
+                table = json.loads(response.read().decode("utf-8"))
+        except (OSError, ValueError) as e:
+            self.error = str(e)
+            return
+        table["fetched_at"] = time.time()
+        if not self._apply(table):
+            self.error = "Unexpected response from the rates service"
+            return
+        self.error = ""
+        os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+        write_atomic(self.cache_file, json.dumps(table).encode("utf-8"))
+        self.updated.emit()
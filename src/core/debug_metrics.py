@@ -0,0 +1,73 @@
+import json
+import os
+from typing import Dict
+
+
+class TimingStat:
+    """Count, total and worst case of a repeated operation, in milliseconds."""
+
+    __slots__ = ("count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"count": self.count, "total_ms": round(self.total_ms, 3),
+                "mean_ms": round(self.mean_ms, 4), "max_ms": round(self.max_ms, 3)}
+
+
+class DebugMetrics:
+    """
+    Process-wide named counters and timings for debug runs and benchmarks.
+
+    Recording is a dict lookup done once by the caller (keep the TimingStat) plus an
+    addition, so hot paths such as paintEvent can record unconditionally.
+    """
+    _instance = None
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, TimingStat] = {}
+        self.counters: Dict[str, int] = {}
+
+    @classmethod
+    def shared(cls) -> "DebugMetrics":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def timing(self, name: str) -> TimingStat:
+        """Returns the TimingStat for name, creating it on first use."""
+        stat = self.timings.get(name)
+        if stat is None:
+            stat = self.timings[name] = TimingStat()
+        return stat
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self) -> None:
+        self.timings.clear()
+        self.counters.clear()
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "timings": {name: stat.to_dict() for name, stat in sorted(self.timings.items())},
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def dump(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
@@ -0,0 +1,315 @@
+import ast
+import math
+import operator
+from collections import OrderedDict
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+Number = float
+Evaluator = Callable[[Mapping[str, Number]], Number]
+
+# Results larger than this are refused instead of computed (e.g. 9**9**9 would never finish)
+MAX_MAGNITUDE = 1e300
+MAX_EXPONENT = 10000
+MAX_FACTORIAL = 170
+MAX_LENGTH = 1000
+# Deeper expressions (e.g. 500 unary minus signs) are refused: both compiling and evaluating recurse per level
+MAX_DEPTH = 250
+
+CONSTANTS: Dict[str, Number] = {"pi": math.pi, "e": math.e, "tau": math.tau}
+
+FUNCTIONS: Dict[str, Callable[..., Number]] = {
+    "sqrt": math.sqrt, "cbrt": lambda x: math.copysign(abs(x) ** (1 / 3), x),
+    "abs": abs, "round": lambda x, digits=0: round(x, int(digits)), "floor": math.floor, "ceil": math.ceil,
+    "exp": math.exp, "ln": math.log, "log": math.log, "log10": math.log10, "log2": math.log2,
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "asin": math.asin, "acos": math.acos, "atan": math.atan, "atan2": math.atan2,
+    "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh,
+    "deg": math.degrees, "rad": math.radians, "hypot": math.hypot,
+    "min": min, "max": max,
+}
+
+
+class ExpressionError(ValueError):
+    """Raised for expressions that cannot be parsed, use something not allowed, or cannot be evaluated."""
+
+
+def _power(base: Number, exponent: Number) -> Number:
+    if abs(exponent) > MAX_EXPONENT and abs(base) > 1:
+        raise ExpressionError("Result is too large")
+    return base ** exponent
+
+
+def _factorial(value: Number) -> Number:
+    if value != int(value) or value < 0:
+        raise ExpressionError("Factorial needs a non-negative whole number")
+    if value > MAX_FACTORIAL:
+        raise ExpressionError("Result is too large")
+    return float(math.factorial(int(value)))
+
+
+BINARY_OPERATORS: Dict[type, Callable[[Number, Number], Number]] = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+    ast.Pow: _power,
+}
+UNARY_OPERATORS: Dict[type, Callable[[Number], Number]] = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+
+def normalize(text: str) -> str:
+    """Maps calculator notation onto Python's: ^ for powers, × and ÷ for * and /, n! for factorials."""
+    text = text.strip().replace("^", "**").replace("×", "*").replace("÷", "/").replace("−", "-")
+    if "!" in text:
+        text = _rewrite_factorials(text)
+    return text
+
+
+def _rewrite_factorials(text: str) -> str:
+    """Rewrites "5!", "(2+3)!" and "sqrt(4)!" as "fact(5)", "fact((2+3))" and "fact(sqrt(4))"."""
+    result = ""
+    for char in text:
+        if char != "!":
+            result += char
+            continue
+        end = len(result)
+        if result.endswith(")"):
+            depth, start = 0, end - 1
+            while start >= 0:
+                depth += {")": 1, "(": -1}.get(result[start], 0)
+                if depth == 0:
+                    break
+                start -= 1
+            # Include the name of a call, so "sqrt(4)!" wraps the whole call
+            while start > 0 and (result[start - 1].isalnum() or result[start - 1] == "_"):
+                start -= 1
+        else:
+            start = end
+            while start > 0 and (result[start - 1].isalnum() or result[start - 1] in "._"):
+                start -= 1
+        if start < 0 or start == end:
+            raise ExpressionError("Misplaced !")
+        result = result[:start] + "fact(" + result[start:end] + ")"
+    return result
+
+
+class Compiler:
+    """
+    Compiles an arithmetic expression into a tree of Python closures.
+
+    The text is parsed with ast.parse (the parser only; nothing is ever eval'ed) and
+    every node is checked against a whitelist: numbers, + - * / // % **, unary signs,
+    the names in CONSTANTS and calls to FUNCTIONS. Constant sub-expressions are folded
+    at compile time, so evaluating the result is one closure call per remaining node.
+    Names that are neither constants nor functions are variables, looked up in the
+    mapping passed at evaluation time (e.g. "ans").
+    """
+
+    def compile(self, text: str) -> Tuple[Evaluator, Tuple[str, ...]]:
+        """Returns (evaluator, variable names used)."""
+        if len(text) > MAX_LENGTH:
+            raise ExpressionError("Expression is too long")
+        self._variables = []
+        try:
+            tree = ast.parse(normalize(text), mode="eval")
+            node = self._compile(tree.body, 0)
+        except SyntaxError as e:
+            raise ExpressionError("Incomplete or invalid expression") from e
+        except (RecursionError, MemoryError):
+            raise ExpressionError("Expression is nested too deeply") from None
+        variables, self._variables = tuple(self._variables), []
+        if isinstance(node, float):
+            value = node
+            return (lambda _variables: value), variables
+
+        def evaluate(values, node=node):
+            try:
+                return node(values)
+            except (RecursionError, MemoryError):
+                raise ExpressionError("Expression is nested too deeply") from None
+        return evaluate, variables
+
+    def _compile(self, node: ast.AST, depth: int):
+        """Returns a float for constant sub-expressions, else an evaluator closure."""
+        if depth > MAX_DEPTH:
+            raise ExpressionError("Expression is nested too deeply")
+        depth += 1
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+                raise ExpressionError("Only numbers are allowed")
+            try:
+                return _finite(float(node.value))
+            except OverflowError:
+                raise ExpressionError("Number is too large") from None
+        if isinstance(node, ast.Name):
+            if node.id in CONSTANTS:
+                return CONSTANTS[node.id]
+            if node.id in FUNCTIONS or node.id == "fact":
+                raise ExpressionError(f"{node.id} is a function")
+            name = node.id
+            self._variables.append(name)
+
+            def variable(variables, name=name):
+                try:
+                    return variables[name]
+                except KeyError:
+                    raise ExpressionError(f"Unknown name: {name}") from None
+            return variable
+        if isinstance(node, ast.BinOp):
+            function = BINARY_OPERATORS.get(type(node.op))
+            if function is None:
+                raise ExpressionError("Operator not allowed")
+            return self._combine(function, [self._compile(node.left, depth), self._compile(node.right, depth)])
+        if isinstance(node, ast.UnaryOp):
+            function = UNARY_OPERATORS.get(type(node.op))
+            if function is None:
+                raise ExpressionError("Operator not allowed")
+            return self._combine(function, [self._compile(node.operand, depth)])
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.keywords:
+                raise ExpressionError("Only plain function calls are allowed")
+            name = node.func.id
+            function = _factorial if name == "fact" else FUNCTIONS.get(name)
+            if function is None:
+                raise ExpressionError(f"Unknown function: {name}")
+            return self._combine(function, [self._compile(arg, depth) for arg in node.args])
+        raise ExpressionError("Not allowed in an expression")
+
+    @staticmethod
+    def _combine(function: Callable[..., Number], operands):
+        if all(isinstance(operand, float) for operand in operands):
+            return _checked(function, operands)  # constant folding
+        evaluators = [operand if callable(operand) else (lambda _v, c=operand: c) for operand in operands]
+        if len(evaluators) == 1:
+            only = evaluators[0]
+            return lambda variables: _checked(function, (only(variables),))
+        if len(evaluators) == 2:
+            left, right = evaluators
+            return lambda variables: _checked(function, (left(variables), right(variables)))
+        return lambda variables: _checked(function, [evaluate(variables) for evaluate in evaluators])
+
+
+def _checked(function: Callable[..., Number], args) -> Number:
+    try:
+        result = function(*args)
+    except ZeroDivisionError:
+        raise ExpressionError("Division by zero") from None
+    except OverflowError:
+        raise ExpressionError("Result is too large") from None
+    except (ValueError, TypeError) as e:
+        if isinstance(e, ExpressionError):
+            raise
+        raise ExpressionError(f"Invalid argument: {e}") from None
+    if isinstance(result, complex):
+        raise ExpressionError("Result is not a real number")
+    return _finite(float(result))
+
+
+def _finite(value: Number) -> Number:
+    """Refuses values outside MAX_MAGNITUDE, which includes inf (e.g. the literal 1e400), and NaN."""
+    if value != value:
+        raise ExpressionError("Result is not a number")
+    if abs(value) > MAX_MAGNITUDE:
+        raise ExpressionError("Result is too large")
+    return value
+
+
+class ExpressionEngine:
+    """
+    Shared expression evaluation for the calculator and the converters.
+
+    Compiled expressions are kept in an LRU cache keyed by their text, so retyping or
+    deleting back to an earlier text costs a dict lookup. Failures are cached as well:
+    while the user types "3*(", every keystroke that leaves the text unparseable is
+    answered from the cache after the first time.
+    """
+    _instance = None
+
+    def __init__(self, cache_size: int = 256) -> None:
+        self.cache_size = cache_size
+        self._compiler = Compiler()
+        self._cache: "OrderedDict[str, object]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls) -> "ExpressionEngine":
+        """The engine shared by the calculator and the converters."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def compile(self, text: str) -> Tuple[Evaluator, Tuple[str, ...]]:
+        entry = self._cache.get(text)
+        if entry is not None:
+            self._cache.move_to_end(text)
+            self.hits += 1
+        else:
+            self.misses += 1
+            try:
+                entry = self._compiler.compile(text)
+            except ExpressionError as e:
+                entry = e
+            self._cache[text] = entry
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        if isinstance(entry, ExpressionError):
+            raise entry
+        return entry
+
+    def evaluate(self, text: str, variables: Optional[Mapping[str, Number]] = None) -> Number:
+        evaluator, _names = self.compile(text)
+        return evaluator(variables or {})
+
+
+class IncrementalEvaluator:
+    """
+    Evaluates a line as it is being typed.
+
+    update() only recompiles when the text changed and only re-evaluates when the text
+    or one of the variables it uses changed. While the text is incomplete ("2*(3+")
+    the last good value is kept and reported as stale, so a result display does not
+    flicker on every keystroke.
+    """
+
+    def __init__(self, engine: ExpressionEngine) -> None:
+        self.engine = engine
+        self.text = ""
+        self.value: Optional[Number] = None
+        self.error = ""
+        self.stale = False
+        self._inputs: Tuple[Number, ...] = ()
+
+    def update(self, text: str, variables: Optional[Mapping[str, Number]] = None) -> Optional[Number]:
+        variables = variables or {}
+        try:
+            evaluator, names = self.engine.compile(text)
+        except ExpressionError as e:
+            self.text, self.error, self.stale = text, str(e), self.value is not None
+            return self.value
+        inputs = tuple(variables.get(name, math.nan) for name in names)
+        if text == self.text and inputs == self._inputs and not self.error:
+            return self.value
+        self.text, self._inputs = text, inputs
+        try:
+            self.value = evaluator(variables)
+            self.error, self.stale = "", False
+        except ExpressionError as e:
+            self.error, self.stale = str(e), self.value is not None
+        return self.value
+
+    def reset(self) -> None:
+        self.text, self.value, self.error, self.stale, self._inputs = "", None, "", False, ()
+
+
+def format_number(value: Number, precision: int = 12) -> str:
+    """Formats a result without float noise: 0.1+0.2 shows as 0.3, large values use exponents."""
+    if value == 0:
+        return "0"
+    if math.isnan(value) or math.isinf(value):
+        return str(value)
+    text = f"{value:.{precision}g}"
+    if "e" in text:
+        mantissa, exponent = text.split("e")
+        if "." in mantissa:
+            mantissa = mantissa.rstrip("0").rstrip(".")
+        return f"{mantissa}e{int(exponent)}"
+    return text
@@ -0,0 +1,222 @@
+import itertools
+import time
+from typing import Callable, List, Optional, Set
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+
+class ScheduledCall:
+    """A callback registered with the Scheduler. Keep it to cancel the call or read the time left."""
+
+    __slots__ = ("callback", "deadline", "interval", "seq", "tick", "level", "slot", "active")
+
+    def __init__(self, callback: Callable[[], None], deadline: float, interval: float, seq: int) -> None:
+        self.callback = callback
+        self.deadline = deadline  # monotonic seconds
+        self.interval = interval  # seconds, 0 for a one-shot call
+        self.seq = seq
+        self.tick = 0
+        self.level = -1
+        self.slot = -1
+        self.active = True
+
+    def remaining_ms(self) -> float:
+        return max(0.0, (self.deadline - time.monotonic()) * 1000.0) if self.active else 0.0
+
+
+class Scheduler(QObject):
+    """
+    One hierarchical timer wheel shared by every time-based tool, driven by a single QTimer.
+
+    Time is divided into ticks of granularity_ms; calls due within the same tick fire
+    together, so many timers cost one wakeup. Each of the LEVELS wheels has 64 slots and
+    covers 64 times the span of the one below; far-off calls sit in a coarse wheel and
+    are cascaded down as their time approaches. The QTimer is armed for the next tick
+    that has work (a due slot or a cascade) and is stopped entirely when nothing is
+    scheduled. Ticks are always derived from time.monotonic(), and repeating calls are
+    rescheduled from their previous deadline rather than from when they ran, so late
+    wakeups never accumulate into drift.
+    """
+
+    SLOT_BITS = 6
+    SLOTS = 1 << SLOT_BITS
+    SLOT_MASK = SLOTS - 1
+    LEVELS = 4
+
+    def __init__(self, granularity_ms: int = 50, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.granularity = max(1, granularity_ms) / 1000.0
+        self._origin = time.monotonic()
+        self._tick = 0
+        self._wheels: List[List[Set[ScheduledCall]]] = [
+            [set() for _ in range(self.SLOTS)] for _ in range(self.LEVELS)
+        ]
+        # Calls too far away for the top wheel; re-placed at each top-level boundary
+        self._overflow: Set[ScheduledCall] = set()
+        self._seq = itertools.count()
+        self.pending = 0
+        self.wakeups = 0
+        self.fired = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def call_later(self, delay_ms: float, callback: Callable[[], None]) -> ScheduledCall:
+        """Runs callback once, delay_ms from now (rounded up to the granularity)."""
+        return self._add(time.monotonic() + delay_ms / 1000.0, 0.0, callback)
+
+    def call_at(self, deadline: float, callback: Callable[[], None]) -> ScheduledCall:
+        """Runs callback once at the given time.monotonic() deadline."""
+        return self._add(deadline, 0.0, callback)
+
+    def call_every(self, interval_ms: float, callback: Callable[[], None],
+                   first_delay_ms: Optional[float] = None) -> ScheduledCall:
+        """Runs callback every interval_ms until cancelled; missed periods are skipped, not replayed."""
+        interval = max(interval_ms / 1000.0, self.granularity)
+        delay = interval if first_delay_ms is None else first_delay_ms / 1000.0
+        return self._add(time.monotonic() + delay, interval, callback)
+
+    def cancel(self, call: Optional[ScheduledCall]) -> None:
+        if call is None or not call.active:
+            return
+        call.active = False
+        self._unlink(call)
+        if not self.pending:
+            self._timer.stop()
+
+    # ------------------------------------------------------------------
+    # Wheel
+    # ------------------------------------------------------------------
+    def _now_tick(self) -> int:
+        return int((time.monotonic() - self._origin) / self.granularity)
+
+    def _add(self, deadline: float, interval: float, callback: Callable[[], None]) -> ScheduledCall:
+        call = ScheduledCall(callback, deadline, interval, next(self._seq))
+        self._sync_tick()
+        self._place(call)
+        self.pending += 1
+        self._arm()
+        return call
+
+    def _sync_tick(self) -> None:
+        """Catches the wheel up with the clock before placing a call relative to it."""
+        if not self.pending:
+            # Nothing to cascade, so the wheel can jump straight to now
+            self._tick = max(self._tick, self._now_tick())
+        else:
+            self._advance(self._now_tick(), fire=False)
+
+    def _place(self, call: ScheduledCall) -> None:
+        # Round up so a call never fires before its deadline
+        offset = (call.deadline - self._origin) / self.granularity
+        call.tick = max(self._tick, int(offset) + (offset > int(offset)))
+        for level in range(self.LEVELS):
+            shift = self.SLOT_BITS * (level + 1)
+            if call.tick >> shift == self._tick >> shift:
+                call.level = level
+                call.slot = (call.tick >> (self.SLOT_BITS * level)) & self.SLOT_MASK
+                self._wheels[level][call.slot].add(call)
+                return
+        call.level = self.LEVELS
+        self._overflow.add(call)
+
+    def _unlink(self, call: ScheduledCall) -> None:
+        if call.level < 0:
+            # Already taken off the wheel to be fired
+            return
+        if call.level == self.LEVELS:
+            self._overflow.discard(call)
+        else:
+            self._wheels[call.level][call.slot].discard(call)
+        call.level = -1
+        self.pending -= 1
+
+    def _next_event_tick(self) -> Optional[int]:
+        """Returns the next tick with calls to fire or to cascade, or None if the wheel is empty."""
+        if not self.pending:
+            return None
+        tick = self._tick
+        for level in range(self.LEVELS):
+            shift = self.SLOT_BITS * level
+            wheel = self._wheels[level]
+            # Level 0 may have calls due at the current tick; higher levels only ahead of it
+            start = ((tick >> shift) & self.SLOT_MASK) + (1 if level else 0)
+            for index in range(start, self.SLOTS):
+                if wheel[index]:
+                    block = (tick >> (shift + self.SLOT_BITS)) << (shift + self.SLOT_BITS)
+                    return block | (index << shift)
+        top_span = self.SLOT_BITS * self.LEVELS
+        return ((tick >> top_span) + 1) << top_span
+
+    def _advance(self, target: int, fire: bool = True) -> List[ScheduledCall]:
+        """Moves the wheel to target, cascading on the way; returns the calls that became due."""
+        due: List[ScheduledCall] = []
+        while True:
+            next_tick = self._next_event_tick()
+            if next_tick is None or next_tick > target:
+                self._tick = max(self._tick, target)
+                return due
+            self._tick = next_tick
+            self._cascade(next_tick)
+            slot = self._wheels[0][next_tick & self.SLOT_MASK]
+            if not fire:
+                # Leave due calls in place for the next timeout, just stop scanning past them
+                if slot:
+                    return due
+                continue
+            for call in slot:
+                call.level = -1
+            due.extend(slot)
+            self.pending -= len(slot)
+            slot.clear()
+            if next_tick == target:
+                return due
+
+    def _cascade(self, tick: int) -> None:
+        top_span = self.SLOT_BITS * self.LEVELS
+        if self._overflow and tick & ((1 << top_span) - 1) == 0:
+            calls, self._overflow = self._overflow, set()
+            for call in calls:
+                self._place(call)
+        for level in range(self.LEVELS - 1, 0, -1):
+            shift = self.SLOT_BITS * level
+            if tick & ((1 << shift) - 1):
+                continue
+            slot = self._wheels[level][(tick >> shift) & self.SLOT_MASK]
+            if slot:
+                calls = list(slot)
+                slot.clear()
+                for call in calls:
+                    self._place(call)
+
+    def _arm(self) -> None:
+        next_tick = self._next_event_tick()
+        if next_tick is None:
+            self._timer.stop()
+            return
+        wait = self._origin + next_tick * self.granularity - time.monotonic()
+        self._timer.start(max(0, int(wait * 1000.0 + 0.999)))
+
+    def _on_timeout(self) -> None:
+        self.wakeups += 1
+        due = self._advance(self._now_tick())
+        now = time.monotonic()
+        for call in sorted(due, key=lambda c: (c.deadline, c.seq)):
+            if not call.active:
+                continue
+            if call.interval:
+                # Next deadline on the original grid; skip periods we slept through
+                missed = int((now - call.deadline) / call.interval) + 1
+                call.deadline += max(1, missed) * call.interval
+                self._place(call)
+                self.pending += 1
+            else:
+                call.active = False
+            self.fired += 1
+            call.callback()
+        self._arm()
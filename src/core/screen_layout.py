@@ -0,0 +1,108 @@
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRect
+from PySide6.QtGui import QGuiApplication, QScreen
+
+
+class ScreenLayout(QObject):
+    """
+    Cached screen geometries for code that asks "which screen is this point on?" at
+    mouse-move rate.
+
+    Screen rects are kept sorted by their left edge, so a lookup is a bisect plus a
+    few integer comparisons, and the screen found last is checked first because a drag
+    almost always stays on the same monitor. The cache is dropped when Qt reports a
+    screen added or removed, a new primary screen, or a geometry change, and it is
+    rebuilt on the next lookup.
+    """
+    _instance = None
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        # (left, top, right, bottom) of each screen's full geometry, sorted by left
+        self._bounds: List[Tuple[int, int, int, int]] = []
+        self._lefts: List[int] = []
+        self._screens: List[QScreen] = []
+        self._available: List[QRect] = []
+        self._primary: Optional[QRect] = None
+        self._last = -1
+        self.valid = False
+        self.rebuilds = 0
+
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self.invalidate)
+        app.primaryScreenChanged.connect(self.invalidate)
+        for screen in QGuiApplication.screens():
+            self._watch(screen)
+
+    @classmethod
+    def shared(cls) -> "ScreenLayout":
+        """Returns the process-wide instance; the QGuiApplication must exist."""
+        if cls._instance is None:
+            cls._instance = cls(QGuiApplication.instance())
+        return cls._instance
+
+    def _watch(self, screen: QScreen) -> None:
+        screen.geometryChanged.connect(self.invalidate)
+        screen.availableGeometryChanged.connect(self.invalidate)
+
+    def _on_screen_added(self, screen: QScreen) -> None:
+        self._watch(screen)
+        self.invalidate()
+
+    def invalidate(self, *_args) -> None:
+        self.valid = False
+
+    def _rebuild(self) -> None:
+        entries = []
+        for screen in QGuiApplication.screens():
+            geometry = screen.geometry()
+            entries.append(((geometry.left(), geometry.top(), geometry.right(), geometry.bottom()),
+                            screen, QRect(screen.availableGeometry())))
+        entries.sort(key=lambda entry: entry[0])
+        self._bounds = [entry[0] for entry in entries]
+        self._lefts = [bounds[0] for bounds in self._bounds]
+        self._screens = [entry[1] for entry in entries]
+        self._available = [entry[2] for entry in entries]
+        primary = QGuiApplication.primaryScreen()
+        self._primary = QRect(primary.availableGeometry()) if primary else QRect()
+        self._last = -1
+        self.valid = True
+        self.rebuilds += 1
+
+    def _index_at(self, x: int, y: int) -> int:
+        if not self.valid:
+            self._rebuild()
+        last = self._last
+        if last >= 0:
+            left, top, right, bottom = self._bounds[last]
+            if left <= x <= right and top <= y <= bottom:
+                return last
+        # Only screens starting at or left of x can contain it
+        for index in range(bisect_right(self._lefts, x) - 1, -1, -1):
+            left, top, right, bottom = self._bounds[index]
+            if x <= right and top <= y <= bottom:
+                self._last = index
+                return index
+        return -1
+
+    def screen_at(self, x: int, y: int) -> Optional[QScreen]:
+        """Cached equivalent of QGuiApplication.screenAt(QPoint(x, y))."""
+        index = self._index_at(x, y)
+        return self._screens[index] if index >= 0 else None
+
+    def available_geometry_at(self, x: int, y: int, fallback: Optional[QScreen] = None) -> QRect:
+        """
+        Returns the available geometry of the screen containing (x, y). Off-screen points
+        get the fallback screen's geometry, or the primary screen's.
+        """
+        index = self._index_at(x, y)
+        if index >= 0:
+            return self._available[index]
+        if fallback is not None:
+            for candidate, available in zip(self._screens, self._available):
+                if candidate is fallback:
+                    return available
+        return self._primary
@@ -1,5 +1,10 @@
+import hashlib
 import json
 import os
+import tempfile
+import threading
+import time
+from typing import Optional
 
 
 class SettingsManager:
@@ -13,6 +18,11 @@ class SettingsManager:
 
     It merges the default settings with the user settings so that any missing keys
     in the user settings are filled in with the defaults.
+
+    When "settings_write_delay_ms" in app_config.json is greater than zero, updates are
+    written behind: rapid calls to update_setting() are coalesced into a single atomic
+    write on a worker thread once no update has arrived for that long. Call flush()
+    before exiting to persist anything still pending.
     """
 
     def __init__(self, config_dir='src/config'):
@@ -28,6 +38,8 @@ class SettingsManager:
                                                       os.path.join(config_dir, 'default_settings.json'))
         self.assets_config_file = config_paths.get("assets_config", os.path.join(config_dir, 'assets_config.json'))
         self.theme_colors_file = config_paths.get("theme_colors", os.path.join(config_dir, 'theme_colors.json'))
+        # Where tools keep their own data (clipboard history, notes, ...)
+        self.data_dir = config_paths.get("data_dir", "data")
 
         # Load default and user settings
         self.default_settings = self.load_json(self.default_settings_file)
@@ -36,6 +48,19 @@ class SettingsManager:
         # Merge default settings with user settings (user settings override defaults)
         self.settings = self.merge_settings(self.default_settings, self.user_settings)
 
+        # Write-behind persistence state
+        self.write_delay = self.app_config.get("settings_write_delay_ms", 0) / 1000.0
+        self.writes_requested = 0
+        self.writes_performed = 0
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._pending = {}  # Updates not yet written, re-applied if the file is reloaded meanwhile
+        self._deadline = 0.0
+        self._writer_thread: Optional[threading.Thread] = None
+        # SHA-1 of the last user_settings.json we wrote, so file watchers can ignore our own writes
+        self.last_written_digest = ""
+
     def load_json(self, filepath):
         """Loads a JSON file from the given path; returns an empty dict if not found or error."""
         if os.path.exists(filepath):
@@ -73,22 +98,114 @@ class SettingsManager:
         """
         Updates a specific setting.
         This updates both the in-memory merged settings and the user_settings.
-        The change is then saved back to the user_settings.json file.
+        The change is then saved back to the user_settings.json file, either right away
+        or, in write-behind mode, after the configured quiet period.
         """
-        self.settings[key] = value
-        self.user_settings[key] = value
+        with self._condition:
+            self.settings[key] = value
+            self.user_settings[key] = value
+            self.writes_requested += 1
+            if self.write_delay > 0:
+                self._dirty = True
+                self._pending[key] = value
+                self._deadline = time.monotonic() + self.write_delay
+                self._ensure_writer_thread()
+                self._condition.notify()
+                return
         self.save_user_settings()
 
     def save_user_settings(self):
         """Saves the user settings back to the user_settings.json file."""
-        with open(self.user_settings_file, 'w') as f:
-            json.dump(self.user_settings, f, indent=4)
+        self._write_snapshot(only_if_dirty=False)
+
+    def flush(self):
+        """
+        Writes pending user settings to disk now. Safe to call when nothing is pending.
+        Also waits for a write the background writer may have in flight, so once this
+        returns everything updated so far is on disk.
+        """
+        self._write_snapshot(only_if_dirty=True)
+
+    def _write_snapshot(self, only_if_dirty):
+        """
+        Serializes the user settings and writes them, all under _write_lock, so writes
+        land on disk in the order their snapshots were taken and an older snapshot can
+        never overwrite a newer one. Returns False if only_if_dirty and nothing was pending.
+        """
+        # Lock order: _write_lock, then _condition
+        with self._write_lock:
+            with self._condition:
+                if only_if_dirty and not self._dirty:
+                    return False
+                self._dirty = False
+                self._pending.clear()
+                data = json.dumps(self.user_settings, indent=4)
+            self._write_atomic(data)
+        return True
+
+    def _write_atomic(self, data):
+        """
+        Writes to a temp file next to user_settings.json and renames it over the original.
+        The caller holds _write_lock.
+        """
+        directory = os.path.dirname(os.path.abspath(self.user_settings_file))
+        payload = data.encode("utf-8")
+        fd, tmp_path = tempfile.mkstemp(prefix=".user_settings.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.user_settings_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.last_written_digest = hashlib.sha1(payload).hexdigest()
+        self.writes_performed += 1
+
+    def _ensure_writer_thread(self):
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._writer_loop, name="SettingsWriter", daemon=True)
+            self._writer_thread.start()
+
+    def _writer_loop(self):
+        """Waits for updates to go quiet for write_delay seconds, then writes them in one go."""
+        while True:
+            with self._condition:
+                while not self._dirty:
+                    self._condition.wait()
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+            # Snapshot and write under _write_lock (taken before _condition, see _write_snapshot);
+            # if a flush() got there first there is nothing left to do
+            try:
+                self._write_snapshot(only_if_dirty=True)
+            except OSError as e:
+                print("Failed to save user settings:", e)
 
     def reload(self):
-        """Reloads all settings from disk."""
-        self.default_settings = self.load_json(self.default_settings_file)
-        self.user_settings = self.load_json(self.user_settings_file)
-        self.settings = self.merge_settings(self.default_settings, self.user_settings)
+        """
+        Reloads all settings from disk and returns the merged settings that changed,
+        as a dict of key -> new value (None for keys that no longer exist).
+        Updates still waiting to be written are kept on top of what was read.
+        """
+        default_settings = self.load_json(self.default_settings_file)
+        user_settings = self.load_json(self.user_settings_file)
+        with self._condition:
+            user_settings.update(self._pending)
+            old_settings = self.settings
+            self.default_settings = default_settings
+            self.user_settings = user_settings
+            self.settings = self.merge_settings(self.default_settings, self.user_settings)
+        missing = object()
+        return {
+            key: self.settings.get(key)
+            for key in set(old_settings) | set(self.settings)
+            if old_settings.get(key, missing) != self.settings.get(key, missing)
+        }
 
     def get_app_config(self):
         """Returns the app configuration."""
@@ -1 +1,203 @@
-# Manages user shortcuts
\ No newline at end of file
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QEvent, QObject, Qt, Signal
+from PySide6.QtGui import QKeySequence
+
+# Keys that only ever act as modifiers; pressing them alone never advances a chord
+MODIFIER_KEYS = {Qt.Key_Control, Qt.Key_Shift, Qt.Key_Alt, Qt.Key_Meta, Qt.Key_AltGr,
+                 Qt.Key_CapsLock, Qt.Key_NumLock, Qt.Key_ScrollLock}
+IGNORED_MODIFIERS = Qt.KeypadModifier | Qt.GroupSwitchModifier
+
+
+class _TrieNode:
+    __slots__ = ("children", "action")
+
+    def __init__(self) -> None:
+        self.children: Dict[int, "_TrieNode"] = {}
+        self.action: Optional[str] = None
+
+
+class ShortcutManager(QObject):
+    """
+    Dispatches the key sequences from the "shortcuts" setting to named actions.
+
+    Bindings, including multi-chord sequences such as "Ctrl+K, Ctrl+C", are compiled into
+    a trie keyed by the combined key code of each chord. A key press is a single dict
+    lookup in the current node, however many bindings exist. Conflicts (two actions on
+    the same sequence, or one sequence being a prefix of another) are detected as
+    bindings are added; the binding that came first wins and the rest are reported in
+    `conflicts`. On a settings change only the actions whose sequence changed are
+    removed and re-inserted.
+
+    Shortcuts are seen through an application event filter, so they work while any of
+    the app's windows has focus. They are not OS-wide hotkeys.
+    """
+    activated = Signal(str)
+
+    CHORD_TIMEOUT_MS = 1000
+
+    def __init__(self, state_manager, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.debug: bool = state_manager.app_config.get("debug", False)
+        self.actions: Dict[str, Callable[[], None]] = {}
+        self.bindings: Dict[str, str] = {}
+        self.conflicts: List[Tuple[str, str, str]] = []
+        self._sequences: Dict[str, Tuple[int, ...]] = {}
+        self._root = _TrieNode()
+        self._node = self._root
+        self._chord_timeout = None
+
+    # ------------------------------------------------------------------
+    # Actions and bindings
+    # ------------------------------------------------------------------
+    def register_action(self, name: str, callback: Callable[[], None]) -> None:
+        """Makes callback run when the sequence bound to name is typed."""
+        self.actions[name] = callback
+
+    def unregister_action(self, name: str) -> None:
+        self.actions.pop(name, None)
+
+    def load(self, bindings: Optional[Dict[str, str]] = None) -> None:
+        """Applies a {action: "Ctrl+Shift+M"} mapping, by default the "shortcuts" setting."""
+        if bindings is None:
+            bindings = self.state_manager.settings_manager.get_setting("shortcuts", {})
+        bindings = {name: text for name, text in (bindings or {}).items() if isinstance(text, str)}
+        for name in [name for name in self.bindings if bindings.get(name) != self.bindings[name]]:
+            self._remove(name)
+        for name, text in bindings.items():
+            if self.bindings.get(name) != text:
+                self._insert(name, text)
+        self._recheck_conflicts()
+        self._reset_chord()
+
+    def sequence(self, name: str) -> str:
+        """Returns the sequence bound to an action, in the native format for display."""
+        keys = self._sequences.get(name)
+        return QKeySequence(*keys).toString(QKeySequence.NativeText) if keys else ""
+
+    @staticmethod
+    def _parse(text: str) -> Tuple[int, ...]:
+        sequence = QKeySequence(text, QKeySequence.PortableText)
+        return tuple(sequence[i].toCombined() for i in range(sequence.count()))
+
+    def _insert(self, name: str, text: str) -> None:
+        self.bindings[name] = text
+        keys = self._parse(text)
+        if not keys:
+            if self.debug:
+                print("Invalid shortcut for", name + ":", text)
+            return
+        node = self._root
+        path = [node]
+        for key in keys:
+            node = node.children.get(key) or node.children.setdefault(key, _TrieNode())
+            path.append(node)
+        # Refuse sequences that collide with an existing one instead of overwriting it
+        clash = node.action or next((n.action for n in path[1:-1] if n.action), None)
+        if clash is None and node.children:
+            clash = self._first_action(node)
+        if clash is not None:
+            self._prune(keys)
+            self.conflicts.append((name, text, clash))
+            if self.debug:
+                print(f"Shortcut conflict: {name} ({text}) clashes with {clash}")
+            return
+        node.action = name
+        self._sequences[name] = keys
+
+    def _remove(self, name: str) -> None:
+        self.bindings.pop(name, None)
+        keys = self._sequences.pop(name, None)
+        if keys is None:
+            return
+        node = self._root
+        for key in keys:
+            node = node.children[key]
+        node.action = None
+        self._prune(keys)
+
+    def _prune(self, keys: Tuple[int, ...]) -> None:
+        """Removes the nodes along keys that no longer lead to any action."""
+        path = [self._root]
+        for key in keys:
+            child = path[-1].children.get(key)
+            if child is None:
+                break
+            path.append(child)
+        for depth in range(len(path) - 1, 0, -1):
+            node = path[depth]
+            if node.action or node.children:
+                break
+            del path[depth - 1].children[keys[depth - 1]]
+
+    @staticmethod
+    def _first_action(node: _TrieNode) -> Optional[str]:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.action:
+                return current.action
+            stack.extend(current.children.values())
+        return None
+
+    def _recheck_conflicts(self) -> None:
+        """Retries bindings that lost a conflict, in case the binding they clashed with changed."""
+        previous, self.conflicts = self.conflicts, []
+        for name, text, _clash in previous:
+            if self.bindings.get(name) == text and name not in self._sequences:
+                self._insert(name, text)
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+    def install(self, app) -> None:
+        app.installEventFilter(self)
+
+    def bind_config_watcher(self, watcher) -> None:
+        watcher.settingChanged.connect(self._on_setting_changed)
+
+    def _on_setting_changed(self, key: str, value) -> None:
+        if key == "shortcuts":
+            self.load(value if isinstance(value, dict) else {})
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() != QEvent.KeyPress or event.isAutoRepeat():
+            return False
+        key = event.key()
+        if key in MODIFIER_KEYS or key == Qt.Key_unknown:
+            return False
+        combined = (event.keyCombination().toCombined()) & ~IGNORED_MODIFIERS.value
+        node = self._node.children.get(combined)
+        if node is None and self._node is not self._root:
+            # A chord that leads nowhere cancels the pending sequence; try it as a fresh start
+            self._reset_chord()
+            node = self._root.children.get(combined)
+        if node is None:
+            return False
+        if node.action:
+            self._reset_chord()
+            self._trigger(node.action)
+        else:
+            self._node = node
+            self._restart_chord_timeout()
+        return True
+
+    def _trigger(self, name: str) -> None:
+        callback = self.actions.get(name)
+        if callback is None:
+            if self.debug:
+                print("No action registered for shortcut:", name)
+            return
+        self.activated.emit(name)
+        callback()
+
+    def _restart_chord_timeout(self) -> None:
+        scheduler = self.state_manager.scheduler
+        scheduler.cancel(self._chord_timeout)
+        self._chord_timeout = scheduler.call_later(self.CHORD_TIMEOUT_MS, self._reset_chord)
+
+    def _reset_chord(self) -> None:
+        self._node = self._root
+        self.state_manager.scheduler.cancel(self._chord_timeout)
+        self._chord_timeout = None
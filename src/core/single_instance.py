@@ -0,0 +1,204 @@
+import errno
+import hashlib
+import json
+import os
+import socket
+import sys
+import time
+from typing import Callable, List, Optional
+
+PIPE_PREFIX = "\\\\.\\pipe\\"
+
+
+def instance_name(config_dir: str = "src/config") -> str:
+    """
+    The name of the running instance's socket: one per user and per config directory,
+    since the instance that owns the settings files is the one to talk to.
+    """
+    # getpass and tempfile are avoided here: importing them costs more than the whole forward
+    user = str(os.getuid()) if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    config_hash = hashlib.sha1(os.path.abspath(config_dir).encode("utf-8")).hexdigest()[:10]
+    return f"chill-assistant-{user}-{config_hash}"
+
+
+def _temp_dir() -> str:
+    """
+    Where the lock file and socket live. On POSIX that is $XDG_RUNTIME_DIR (private to the
+    user, mode 0700) when there is one, so other users cannot take or squat on the names;
+    the shared temp dir is only the fallback.
+    """
+    if sys.platform == "win32":
+        return os.environ.get("TEMP") or os.environ.get("TMP") or "."
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return runtime_dir
+    return os.environ.get("TMPDIR") or "/tmp"
+
+
+def server_address(name: str) -> str:
+    """What QLocalServer listens on: a socket file in the runtime dir on POSIX, a named pipe on Windows."""
+    if sys.platform == "win32":
+        return name
+    return os.path.join(_temp_dir(), name)
+
+
+class InstanceLock:
+    """
+    An exclusive lock on <runtime dir>/<name>.lock, held for the life of the process.
+
+    Whoever holds it is the instance, and owns the socket address and the settings
+    files; the operating system releases it when the process exits, even after a crash.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.path = os.path.join(_temp_dir(), name + ".lock")
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> bool:
+        """Tries to take the lock without waiting. Returns True if this process now holds it."""
+        if self._fd is not None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)  # closing the descriptor drops the lock
+            self._fd = None
+
+
+def claim(name: str, command: str, args: Optional[List[str]] = None,
+          wait: float = 10.0) -> Optional[InstanceLock]:
+    """
+    Decides whether this process becomes the instance. Returns the held InstanceLock if
+    it does, or None once the command has been handed to the instance that owns the
+    lock (or that instance did not start listening within wait seconds); the caller
+    then exits. Call it before loading any settings.
+    """
+    lock = InstanceLock(name)
+    deadline = time.monotonic() + wait
+    while True:
+        if forward(name, command, args):
+            return None
+        if lock.acquire():
+            return lock
+        # Another launch holds the lock but is still starting up: wait for its server
+        if time.monotonic() >= deadline:
+            print("Another instance is starting but not responding; exiting.", file=sys.stderr)
+            return None
+        time.sleep(0.02)
+
+
+def address_is_stale(name: str) -> bool:
+    """True if nothing is listening on the address: connecting is refused or the socket file is gone."""
+    if sys.platform == "win32":
+        return False  # a named pipe disappears with its server; there is nothing to clean up
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(server_address(name))
+        except OSError as e:
+            return e.errno in (errno.ECONNREFUSED, errno.ENOENT)
+    return False
+
+
+def forward(name: str, command: str, args: Optional[List[str]] = None, timeout: float = 1.0) -> bool:
+    """
+    Sends a command to the running instance, if there is one, and returns True once it
+    has been accepted. Uses only the socket module (no Qt), so a second launch can hand
+    over its command and exit in about a millisecond.
+    """
+    message = (json.dumps({"command": command, "args": args or []}) + "\n").encode("utf-8")
+    if sys.platform == "win32":
+        try:
+            with open(PIPE_PREFIX + name, "r+b", buffering=0) as pipe:
+                pipe.write(message)
+                return pipe.readline().strip() == b"ok"
+        except OSError:
+            return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(server_address(name))
+            client.sendall(message)
+            reply = b""
+            while not reply.endswith(b"\n"):
+                chunk = client.recv(64)
+                if not chunk:
+                    break
+                reply += chunk
+            return reply.strip() == b"ok"
+    except OSError:  # no server (or a stale socket file), refused, or timed out
+        return False
+
+
+class InstanceServer:
+    """
+    The running instance's end of the single-instance socket.
+
+    Every connection sends JSON lines of the form {"command": ..., "args": [...]}; each
+    one is passed to handler(command, args) and acknowledged with "ok". Qt is imported
+    here rather than at module level so forward() stays free of it.
+    """
+
+    def __init__(self, name: str, handler: Callable[[str, List[str]], None], parent=None) -> None:
+        from PySide6.QtNetwork import QLocalServer
+        self.name = name
+        self.handler = handler
+        self.server = QLocalServer(parent)
+        # Only this user may connect
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self._on_new_connection)
+        self._buffers = {}
+
+    def listen(self) -> bool:
+        from PySide6.QtNetwork import QLocalServer
+        address = server_address(self.name)
+        if self.server.listen(address):
+            return True
+        # Only clear the address if nobody answers on it: a socket file left by a crashed
+        # instance, never one a live instance is listening on
+        if not address_is_stale(self.name):
+            return False
+        QLocalServer.removeServer(address)
+        return self.server.listen(address)
+
+    def close(self) -> None:
+        self.server.close()
+
+    def _on_new_connection(self) -> None:
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            self._buffers[connection] = b""
+            connection.readyRead.connect(lambda c=connection: self._on_ready_read(c))
+            connection.disconnected.connect(lambda c=connection: self._on_disconnected(c))
+
+    def _on_ready_read(self, connection) -> None:
+        data = self._buffers.get(connection, b"") + bytes(connection.readAll())
+        *lines, rest = data.split(b"\n")
+        self._buffers[connection] = rest
+        for line in lines:
+            try:
+                message = json.loads(line.decode("utf-8"))
+                command = str(message["command"])
+                args = [str(arg) for arg in message.get("args", [])]
+            except (ValueError, KeyError, TypeError, AttributeError):
+                connection.write(b"error\n")
+                continue
+            connection.write(b"ok\n")
+            connection.flush()
+            self.handler(command, args)
+
+    def _on_disconnected(self, connection) -> None:
+        self._buffers.pop(connection, None)
+        connection.deleteLater()
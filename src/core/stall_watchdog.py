@@ -0,0 +1,144 @@
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+
+class StallRecord:
+    """One stall of the GUI thread: when it started, how long it lasted and where it was stuck."""
+
+    __slots__ = ("started", "duration_ms", "stack", "site")
+
+    def __init__(self, started: float, duration_ms: float, stack: List[str], site: str) -> None:
+        self.started = started  # wall-clock time
+        self.duration_ms = duration_ms
+        self.stack = stack
+        self.site = site
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"started": self.started, "duration_ms": round(self.duration_ms, 1),
+                "site": self.site, "stack": self.stack}
+
+
+class StallWatchdog(QObject):
+    """
+    Detects when the GUI thread stops processing events for longer than threshold_ms.
+
+    A QTimer on the GUI thread stamps a heartbeat every heartbeat_ms. A daemon thread
+    checks the stamp; once it is more than threshold_ms late, the thread grabs the GUI
+    thread's Python stack with sys._current_frames() while the stall is still going on.
+    When the heartbeat resumes, the stall's duration is known and a StallRecord goes
+    into a rolling log of the last log_size stalls. Per call site counts and total
+    durations are kept for the whole session. Intended for debug runs only.
+    """
+
+    def __init__(self, threshold_ms: int = 50, log_size: int = 100, heartbeat_ms: int = 0,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000.0
+        self.heartbeat = (heartbeat_ms or max(5, threshold_ms // 4)) / 1000.0
+        self.records: Deque[StallRecord] = deque(maxlen=log_size)
+        self.counts: Counter = Counter()
+        self.total_ms: Counter = Counter()
+        self.stalls = 0
+        self.longest_ms = 0.0
+
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Set by the watcher thread while a stall is in progress
+        self._stall_stack: Optional[List[str]] = None
+        self._stall_started = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(int(self.heartbeat * 1000))
+        self._timer.timeout.connect(self._beat)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._last_beat = time.monotonic()
+        self._timer.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    # ------------------------------------------------------------------
+    # GUI thread
+    # ------------------------------------------------------------------
+    def _beat(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            stack, started = self._stall_stack, self._stall_started
+            self._stall_stack = None
+            self._last_beat = now
+        if stack is not None:
+            self._record(started, (now - started) * 1000.0, stack)
+
+    def _record(self, started: float, duration_ms: float, stack: List[str]) -> None:
+        site = stack[-1].splitlines()[0].strip() if stack else "<unknown>"
+        record = StallRecord(time.time() - (time.monotonic() - started), duration_ms, stack, site)
+        self.records.append(record)
+        self.stalls += 1
+        self.counts[site] += 1
+        self.total_ms[site] += duration_ms
+        self.longest_ms = max(self.longest_ms, duration_ms)
+        print(f"GUI thread stalled for {duration_ms:.0f} ms at {site}")
+
+    # ------------------------------------------------------------------
+    # Watcher thread
+    # ------------------------------------------------------------------
+    def _watch(self) -> None:
+        poll = min(self.heartbeat, self.threshold / 4)
+        while not self._stop.wait(poll):
+            with self._lock:
+                late = time.monotonic() - self._last_beat - self.heartbeat
+                if late <= self.threshold or self._stall_stack is not None:
+                    continue
+            # Capture outside the lock; the GUI thread is stuck, so its frame stays put
+            frame = sys._current_frames().get(self._gui_thread_id)
+            stack = traceback.format_stack(frame) if frame is not None else []
+            del frame
+            with self._lock:
+                # Only keep it if the heartbeat did not resume in the meantime
+                if time.monotonic() - self._last_beat - self.heartbeat > self.threshold:
+                    self._stall_stack = stack
+                    # The stall began when the missed heartbeat was due
+                    self._stall_started = self._last_beat + self.heartbeat
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def summary(self) -> List[Dict[str, object]]:
+        """Returns one entry per call site, the sites with the most stall time first."""
+        return [{"site": site, "count": self.counts[site], "total_ms": round(total, 1)}
+                for site, total in self.total_ms.most_common()]
+
+    def dump(self, path: str) -> None:
+        """Writes the summary and the rolling log as JSON."""
+        report = {
+            "threshold_ms": self.threshold * 1000.0,
+            "stalls": self.stalls,
+            "longest_ms": round(self.longest_ms, 1),
+            "sites": self.summary(),
+            "recent": [record.to_dict() for record in self.records],
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
@@ -0,0 +1,181 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+
+class ImportTimer:
+    """
+    Records how long each module takes to import, in the spirit of `python -X importtime`.
+
+    It sits at the front of sys.meta_path, lets the regular finders locate each module
+    and wraps the loader's exec_module() to time it. Self time excludes the time spent
+    importing nested modules; cumulative time includes it. Built-in and frozen modules
+    are not timed.
+    """
+
+    def __init__(self) -> None:
+        self.entries: List[Dict[str, Any]] = []
+        self._stack: List[List[int]] = []
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return spec
+        self._wrap(loader, fullname)
+        return spec
+
+    def _wrap(self, loader, fullname: str) -> None:
+        exec_module = loader.exec_module
+        had_own_attribute = "exec_module" in getattr(loader, "__dict__", {})
+        timer = self
+
+        def timed_exec_module(module):
+            timer._stack.append([time.perf_counter_ns(), 0])
+            try:
+                exec_module(module)
+            finally:
+                start, children = timer._stack.pop()
+                cumulative = time.perf_counter_ns() - start
+                if timer._stack:
+                    timer._stack[-1][1] += cumulative
+                timer.entries.append({
+                    "module": fullname,
+                    "self_us": (cumulative - children) // 1000,
+                    "cumulative_us": cumulative // 1000,
+                    "depth": len(timer._stack),
+                })
+                # Restore the original so the wrapper does not outlive the import
+                if had_own_attribute:
+                    loader.exec_module = exec_module
+                else:
+                    del loader.exec_module
+
+        try:
+            loader.exec_module = timed_exec_module
+        except AttributeError:
+            pass  # Loaders with __slots__ are simply not timed
+
+
+class StartupProfiler:
+    """
+    Timestamps the phases of a cold start with a monotonic clock.
+
+    Phases are recorded relative to the moment the profiler was created (as early in
+    main() as possible). The report also carries the CPU time the interpreter had
+    already spent before that point, the time to the first paint of the floating
+    widget and, optionally, per-module import costs.
+    """
+
+    def __init__(self, report_path: Optional[str] = None, capture_imports: bool = False) -> None:
+        self.start_ns = time.perf_counter_ns()
+        self.cpu_before_start = time.process_time()
+        self.report_path = report_path
+        self.phases: List[Dict[str, Any]] = []
+        self.marks: Dict[str, float] = {}
+        self.import_timer: Optional[ImportTimer] = None
+        if capture_imports:
+            self.import_timer = ImportTimer()
+            self.import_timer.install()
+
+    def _elapsed_ms(self, ns: int) -> float:
+        return (ns - self.start_ns) / 1_000_000
+
+    @contextmanager
+    def phase(self, name: str):
+        """Times the body of a with-block as one named phase."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.phases.append({
+                "name": name,
+                "start_ms": round(self._elapsed_ms(start), 3),
+                "duration_ms": round((end - start) / 1_000_000, 3),
+            })
+
+    def mark(self, name: str) -> None:
+        """Records a point in time (only the first occurrence of a name is kept)."""
+        if name not in self.marks:
+            self.marks[name] = round(self._elapsed_ms(time.perf_counter_ns()), 3)
+
+    def watch_first_paint(self, widget, on_first_paint=None) -> None:
+        """
+        Marks "first_paint" when the widget receives its first paint event and
+        "first_paint_done" once that paint has been handled by the event loop.
+        """
+        from PySide6.QtCore import QEvent, QObject, QTimer
+
+        profiler = self
+
+        class _FirstPaintFilter(QObject):
+            def eventFilter(self, watched, event):
+                if watched is widget and event.type() == QEvent.Paint:
+                    profiler.mark("first_paint")
+                    widget.removeEventFilter(self)
+                    QTimer.singleShot(0, _done)
+                return False
+
+        def _done():
+            profiler.mark("first_paint_done")
+            if on_first_paint:
+                on_first_paint()
+
+        # Keep a reference on the widget so the filter is not garbage collected
+        widget._startup_paint_filter = _FirstPaintFilter(widget)
+        widget.installEventFilter(widget._startup_paint_filter)
+
+    def report(self) -> Dict[str, Any]:
+        report: Dict[str, Any] = {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "qt_qpa_platform": os.environ.get("QT_QPA_PLATFORM", ""),
+            "cpu_before_main_ms": round(self.cpu_before_start * 1000, 3),
+            "total_ms": round(self._elapsed_ms(time.perf_counter_ns()), 3),
+            "phases": self.phases,
+            "marks": self.marks,
+        }
+        if self.import_timer is not None:
+            report["imports"] = self.import_timer.entries
+        return report
+
+    def finish(self) -> Dict[str, Any]:
+        """Stops import timing, prints a summary and writes the JSON report if a path was given."""
+        if self.import_timer is not None:
+            self.import_timer.uninstall()
+        report = self.report()
+        for entry in self.phases:
+            print(f"[startup] {entry['name']:<24} {entry['duration_ms']:>9.2f} ms")
+        for name, at_ms in self.marks.items():
+            print(f"[startup] {name:<24} at {at_ms:>6.2f} ms")
+        if self.import_timer is not None:
+            slowest = sorted(self.import_timer.entries, key=lambda e: e["cumulative_us"], reverse=True)[:10]
+            for entry in slowest:
+                print(f"[startup] import {entry['module']:<32} {entry['cumulative_us'] / 1000:>9.2f} ms")
+        if self.report_path:
+            with open(self.report_path, "w") as f:
+                json.dump(report, f, indent=4)
+            print("[startup] report written to", self.report_path)
+        return report
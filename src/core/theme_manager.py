@@ -1 +1,139 @@
-# Handles theming
\ No newline at end of file
+import glob
+import os
+import weakref
+from typing import Dict, Optional
+
+from PySide6.QtGui import QColor, QPalette
+
+# Used for any color a theme does not define
+FALLBACK_COLORS = {
+    "background": "#333333",
+    "foreground": "#FFFFFF",
+    "text": "#FFFFFF",
+    "button_background": "#333333",
+    "button_text": "#FFFFFF",
+    "border_color": "#444444",
+    "hover": "#444444",
+    "active": "#007BFF",
+}
+
+
+class CompiledTheme:
+    """
+    A theme resolved into ready-to-use Qt objects: QColors, a QPalette, stylesheets and
+    the icon variant ("dark" or "light") to use with it. Built once per theme.
+    """
+
+    def __init__(self, name: str, colors: Dict[str, str]) -> None:
+        self.name = name
+        self.colors: Dict[str, str] = dict(FALLBACK_COLORS)
+        self.colors.update(colors)
+        self.qcolors: Dict[str, QColor] = {key: QColor(value) for key, value in self.colors.items()}
+
+        # Light backgrounds get the light icon set, dark backgrounds the dark one
+        self.is_light: bool = self.qcolors["background"].lightnessF() > 0.5
+        self.icon_variant: str = "light" if self.is_light else "dark"
+
+        self.palette = QPalette()
+        self.palette.setColor(QPalette.Window, self.qcolors["background"])
+        self.palette.setColor(QPalette.WindowText, self.qcolors["text"])
+        self.palette.setColor(QPalette.Base, self.qcolors["background"])
+        self.palette.setColor(QPalette.Text, self.qcolors["text"])
+        self.palette.setColor(QPalette.Button, self.qcolors["button_background"])
+        self.palette.setColor(QPalette.ButtonText, self.qcolors["button_text"])
+        self.palette.setColor(QPalette.Highlight, self.qcolors["active"])
+
+        c = self.colors
+        self.stylesheets: Dict[str, str] = {
+            "menu": f"background-color: {c['background']};",
+            "menu_button_text": f"color: {c['text']}; background: transparent;",
+            "tool_window": (
+                f"QWidget {{ background-color: {c['background']}; color: {c['text']}; }}"
+                f"QPushButton {{ background-color: {c['button_background']}; color: {c['button_text']};"
+                f" border: 1px solid {c['border_color']}; padding: 4px; }}"
+                f"QPushButton:hover {{ background-color: {c['hover']}; }}"
+                f"QLineEdit, QTextEdit, QPlainTextEdit, QListWidget {{ border: 1px solid {c['border_color']}; }}"
+            ),
+        }
+
+    def color(self, key: str) -> QColor:
+        return self.qcolors.get(key, self.qcolors["foreground"])
+
+    def icon_key(self, tool_name: str) -> str:
+        """Returns the assets_config.json key of a tool icon in this theme's variant."""
+        return f"{tool_name}_icon_{self.icon_variant}"
+
+
+class ThemeManager:
+    """
+    Loads theme_colors.json and src/themes/*.json once and serves compiled themes.
+
+    Widgets that implement apply_theme(theme) register themselves; set_theme() then
+    restyles all of them in a single pass without rebuilding anything.
+    """
+
+    def __init__(self, settings_manager) -> None:
+        self.settings_manager = settings_manager
+        self.themes_dir = settings_manager.app_config.get("config_paths", {}).get("themes_dir", "src/themes")
+        self.theme_colors: Dict[str, Dict[str, str]] = {}
+        self._compiled: Dict[str, CompiledTheme] = {}
+        self._widgets = weakref.WeakSet()
+        self.current_name: str = settings_manager.get_setting("theme", "dark-1")
+        self.load()
+
+    def load(self) -> None:
+        """Reads the theme files; entries in src/themes/<name>.json override theme_colors.json."""
+        themes: Dict[str, Dict[str, str]] = {}
+        theme_colors = self.settings_manager.load_json(self.settings_manager.theme_colors_file)
+        for name, colors in theme_colors.items():
+            if isinstance(colors, dict):
+                themes[name] = dict(colors)
+        for path in sorted(glob.glob(os.path.join(self.themes_dir, "*.json"))):
+            theme_file = self.settings_manager.load_json(path)
+            name = theme_file.pop("name", os.path.splitext(os.path.basename(path))[0])
+            themes.setdefault(name, {}).update(theme_file)
+        self.theme_colors = themes
+        self._compiled.clear()
+
+    def reload(self) -> None:
+        """Re-reads the theme files and re-applies the current theme to all registered widgets."""
+        self.load()
+        self._apply_all()
+
+    def theme_names(self):
+        return list(self.theme_colors)
+
+    def theme(self, name: Optional[str] = None) -> CompiledTheme:
+        """Returns the compiled theme (the current one by default), compiling it on first use."""
+        name = name or self.current_name
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            compiled = CompiledTheme(name, self.theme_colors.get(name, {}))
+            self._compiled[name] = compiled
+        return compiled
+
+    def register(self, widget) -> None:
+        """Applies the current theme to the widget now and on every later theme switch."""
+        self._widgets.add(widget)
+        widget.apply_theme(self.theme())
+
+    def unregister(self, widget) -> None:
+        self._widgets.discard(widget)
+
+    def set_theme(self, name: str, persist: bool = False) -> None:
+        """Switches every registered widget to the named theme."""
+        if persist:
+            self.settings_manager.update_setting("theme", name)
+        if name == self.current_name:
+            return
+        self.current_name = name
+        self._apply_all()
+
+    def _apply_all(self) -> None:
+        theme = self.theme()
+        for widget in list(self._widgets):
+            try:
+                widget.apply_theme(theme)
+            except RuntimeError:
+                # The underlying Qt object is gone
+                self._widgets.discard(widget)
@@ -0,0 +1,140 @@
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# (unit, factor, other unit): 1 unit = factor * other unit. Units are linked to whichever
+# unit they are naturally defined by; the graph works out every other conversion.
+LINEAR_UNITS: Dict[str, List[Tuple[str, float, str]]] = {
+    "length": [
+        ("km", 1000, "m"), ("cm", 0.01, "m"), ("mm", 0.001, "m"), ("um", 0.001, "mm"),
+        ("nm", 0.001, "um"), ("in", 2.54, "cm"), ("ft", 12, "in"), ("yd", 3, "ft"),
+        ("mi", 1760, "yd"), ("nmi", 1852, "m"),
+    ],
+    "mass": [
+        ("kg", 1000, "g"), ("mg", 0.001, "g"), ("t", 1000, "kg"), ("lb", 0.45359237, "kg"),
+        ("oz", 1 / 16, "lb"), ("st", 14, "lb"),
+    ],
+    "time": [
+        ("min", 60, "s"), ("ms", 0.001, "s"), ("h", 60, "min"), ("day", 24, "h"), ("week", 7, "day"),
+        ("year", 365.25, "day"),
+    ],
+    "area": [
+        ("m2", 1e6, "mm2"), ("cm2", 100, "mm2"), ("km2", 1e6, "m2"), ("ha", 10000, "m2"),
+        ("in2", 6.4516, "cm2"), ("ft2", 144, "in2"), ("acre", 43560, "ft2"),
+    ],
+    "volume": [
+        ("l", 1000, "ml"), ("m3", 1000, "l"), ("cm3", 1, "ml"), ("tsp", 4.92892159375, "ml"),
+        ("tbsp", 3, "tsp"), ("floz", 2, "tbsp"), ("cup", 8, "floz"), ("pt", 2, "cup"),
+        ("qt", 2, "pt"), ("gal", 4, "qt"),
+    ],
+    "speed": [
+        ("km/h", 1 / 3.6, "m/s"), ("mph", 1.609344, "km/h"), ("kn", 1.852, "km/h"),
+    ],
+    "data": [
+        ("B", 8, "bit"), ("KB", 1000, "B"), ("MB", 1000, "KB"), ("GB", 1000, "MB"), ("TB", 1000, "GB"),
+        ("KiB", 1024, "B"), ("MiB", 1024, "KiB"), ("GiB", 1024, "MiB"), ("TiB", 1024, "GiB"),
+    ],
+}
+
+# Affine units: kelvin = value * scale + offset
+TEMPERATURE_UNITS: Dict[str, Tuple[float, float]] = {
+    "K": (1.0, 0.0),
+    "C": (1.0, 273.15),
+    "F": (5 / 9, 273.15 - 32 * 5 / 9),
+}
+
+
+class UnitGraph:
+    """
+    Unit conversions of one or more categories, resolved once at construction.
+
+    Each category is a graph whose edges are the definitions above. A breadth-first
+    walk from the unit the first definition refers to (the shortest chain of definitions, so the
+    fewest multiplications and the least rounding) stores every unit's factor relative
+    to that root; a conversion is then value * factor[from] / factor[to], and
+    converting into every unit of the category is a single pass over a prepared list.
+    Temperatures are affine (scale and offset) and handled alongside.
+    """
+    _instance = None
+
+    def __init__(self, definitions: Optional[Dict[str, Sequence[Tuple[str, float, str]]]] = None,
+                 temperatures: Optional[Dict[str, Tuple[float, float]]] = None) -> None:
+        self.factors: Dict[str, float] = {}
+        self.category_of: Dict[str, str] = {}
+        self.units: Dict[str, List[str]] = {}
+        self.affine: Dict[str, Tuple[float, float]] = {}
+        for category, edges in (LINEAR_UNITS if definitions is None else definitions).items():
+            self.add_category(category, edges)
+        temperatures = TEMPERATURE_UNITS if temperatures is None else temperatures
+        if temperatures:
+            self.affine.update(temperatures)
+            self.units["temperature"] = list(temperatures)
+            for unit in temperatures:
+                self.category_of[unit] = "temperature"
+
+    @classmethod
+    def shared(cls) -> "UnitGraph":
+        """The graph of the built-in units, built on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def add_category(self, category: str, edges: Sequence[Tuple[str, float, str]]) -> None:
+        """Adds (or replaces) a category of linear units, given as (unit, factor, other unit) definitions."""
+        neighbours: Dict[str, List[Tuple[str, float]]] = {}
+        for unit, factor, other in edges:
+            neighbours.setdefault(unit, []).append((other, factor))
+            neighbours.setdefault(other, []).append((unit, 1.0 / factor))
+        if not neighbours:
+            return
+        for unit in self.units.get(category, []):
+            self.factors.pop(unit, None)
+            self.category_of.pop(unit, None)
+        root = edges[0][2]
+        factors = {root: 1.0}
+        queue = deque([root])
+        while queue:
+            unit = queue.popleft()
+            for other, factor in neighbours[unit]:
+                if other not in factors:
+                    # 1 other = factors[unit] / factor root, since 1 unit = factor * other
+                    factors[other] = factors[unit] / factor
+                    queue.append(other)
+        unreachable = set(neighbours) - set(factors)
+        if unreachable:
+            raise ValueError(f"Units not connected to {root} in {category}: {sorted(unreachable)}")
+        for unit, factor in factors.items():
+            if self.category_of.get(unit, category) != category:
+                raise ValueError(f"Unit {unit} is defined in both {self.category_of[unit]} and {category}")
+            self.factors[unit] = factor
+            self.category_of[unit] = category
+        self.units[category] = sorted(factors, key=factors.get)
+
+    def category(self, unit: str) -> str:
+        try:
+            return self.category_of[unit]
+        except KeyError:
+            raise ValueError(f"Unknown unit: {unit}") from None
+
+    def convert(self, value: float, from_unit: str, to_unit: str) -> float:
+        category = self.category(from_unit)
+        if self.category(to_unit) != category:
+            raise ValueError(f"Cannot convert {from_unit} to {to_unit}")
+        if category == "temperature":
+            scale, offset = self.affine[from_unit]
+            to_scale, to_offset = self.affine[to_unit]
+            return (value * scale + offset - to_offset) / to_scale
+        return value * self.factors[from_unit] / self.factors[to_unit]
+
+    def convert_all(self, value: float, from_unit: str,
+                    targets: Optional[Sequence[str]] = None) -> List[Tuple[str, float]]:
+        """Converts value into every unit of its category (or the given targets), in one pass."""
+        category = self.category(from_unit)
+        units = self.units[category] if targets is None else targets
+        if category == "temperature":
+            scale, offset = self.affine[from_unit]
+            kelvin = value * scale + offset
+            return [(unit, (kelvin - self.affine[unit][1]) / self.affine[unit][0]) for unit in units]
+        base = value * self.factors[from_unit]
+        factors = self.factors
+        return [(unit, base / factors[unit]) for unit in units]
+
@@ -1,21 +1,179 @@
 # src/main.py
 
+import argparse
+import os
 import sys
-from PySide6.QtWidgets import QApplication
-from src.state.state_manager import StateManager
-from src.ui.widget import FloatingWidget
+from contextlib import nullcontext
+
+
+def parse_args(argv):
+    """Parses our own flags; anything unknown is left for QApplication."""
+    parser = argparse.ArgumentParser(description="Chill Floating Assistant")
+    parser.add_argument("--profile-startup", nargs="?", const="startup_profile.json", default=None,
+                        metavar="REPORT", help="time each startup phase and write a JSON report")
+    parser.add_argument("--profile-imports", action="store_true",
+                        help="with --profile-startup, also record per-module import times")
+    parser.add_argument("--offscreen", action="store_true",
+                        help="use Qt's offscreen platform (headless environments)")
+    parser.add_argument("--exit-after-startup", action="store_true",
+                        help="quit as soon as the widget has been painted for the first time")
+    parser.add_argument("--show", action="store_true",
+                        help="show the widget (the default when another instance is already running)")
+    parser.add_argument("--toggle-menu", action="store_true", help="open or close the menu")
+    parser.add_argument("--open-tool", metavar="NAME", default=None, help="open the named tool")
+    parser.add_argument("--new-instance", action="store_true",
+                        help="start a separate instance even if one is already running")
+    return parser.parse_known_args(argv[1:])
+
+
+def requested_command(args):
+    """Returns (command, args) to run in the single running instance."""
+    if args.open_tool:
+        return "open_tool", [args.open_tool]
+    if args.toggle_menu:
+        return "toggle_menu", []
+    return "show", []
+
+
+def run_command(command, command_args, state_manager, widget):
+    """Runs a command forwarded by a second launch (or given to the first one)."""
+    if command == "show":
+        widget.show()
+        widget.raise_()
+        widget.activateWindow()
+    elif command == "toggle_menu":
+        widget.toggle_menu()
+    elif command == "open_tool" and command_args:
+        state_manager.tool_registry.activate(command_args[0], state_manager)
+
+
+def take_screenshot(state_manager):
+    """Shortcut action: captures the screen if the screenshot tool is enabled."""
+    if not state_manager.tool_registry.is_enabled("screenshot_tool"):
+        return
+    from src.tools.screenshot_tool.capture_pipeline import get_pipeline
+    get_pipeline(state_manager).capture()
+
 
 def main():
+    args, qt_args = parse_args(sys.argv)
+    command, command_args = requested_command(args)
+
+    # If an instance is already running, hand the command over and exit before any Qt import.
+    # Profiling and benchmark runs always start their own instance.
+    # Becoming the instance means taking its lock file first, before any settings are loaded,
+    # so two launches in quick succession cannot both start.
+    single_instance = not (args.new_instance or args.profile_startup or args.exit_after_startup)
+    instance_lock = None
+    if single_instance:
+        from src.core.single_instance import claim, instance_name
+        instance_lock = claim(instance_name(), command, command_args)
+        if instance_lock is None:
+            return
+
+    profiler = None
+    if args.profile_startup:
+        from src.core.startup_profiler import StartupProfiler
+        profiler = StartupProfiler(args.profile_startup, capture_imports=args.profile_imports)
+
+    def phase(name):
+        return profiler.phase(name) if profiler else nullcontext()
+
+    if args.offscreen:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    with phase("import_pyside6"):
+        from PySide6.QtCore import QTimer
+        from PySide6.QtWidgets import QApplication
+    with phase("import_app_modules"):
+        from src.core.config_watcher import ConfigWatcher
+        from src.core.shortcut_manager import ShortcutManager
+        from src.state.state_manager import StateManager
+        from src.ui.widget import FloatingWidget
+
     # Initialize the PySide6 application
-    app = QApplication(sys.argv)
-    
+    with phase("qapplication"):
+        app = QApplication(sys.argv[:1] + qt_args)
+
     # Load configuration and initialize the state manager
-    state_manager = StateManager()
-    
+    with phase("state_manager"):
+        state_manager = StateManager()
+    # Persist any settings still waiting in the write-behind queue
+    app.aboutToQuit.connect(state_manager.settings_manager.flush)
+
     # Create and show the floating widget
-    widget = FloatingWidget(state_manager=state_manager)
-    widget.show()
-    
+    with phase("floating_widget"):
+        widget = FloatingWidget(state_manager=state_manager)
+
+    # Keyboard shortcuts from the "shortcuts" setting
+    shortcut_manager = ShortcutManager(state_manager, parent=app)
+    shortcut_manager.register_action("open_menu", widget.toggle_menu)
+    shortcut_manager.register_action("take_screenshot", lambda: take_screenshot(state_manager))
+    shortcut_manager.load()
+    shortcut_manager.install(app)
+
+    # Pick up config edits made on disk while running
+    if state_manager.app_config.get("watch_config", True):
+        config_watcher = ConfigWatcher(state_manager, parent=app)
+        config_watcher.themeChanged.connect(state_manager.theme_manager.set_theme)
+        config_watcher.themeColorsChanged.connect(state_manager.theme_manager.reload)
+        widget.bind_config_watcher(config_watcher)
+        shortcut_manager.bind_config_watcher(config_watcher)
+
+    if profiler or args.exit_after_startup:
+        finished = []
+
+        def on_first_paint():
+            if finished:
+                return
+            finished.append(True)
+            if profiler:
+                profiler.finish()
+            if args.exit_after_startup:
+                app.quit()
+
+        if profiler:
+            profiler.watch_first_paint(widget, on_first_paint)
+        else:
+            QTimer.singleShot(0, on_first_paint)
+        # Still report (and quit) if no paint ever arrives, e.g. on a platform without a backing store
+        QTimer.singleShot(10000, on_first_paint)
+
+    with phase("widget_show"):
+        widget.show()
+
+    # Later launches forward their command here instead of starting another instance
+    if single_instance:
+        from src.core.single_instance import InstanceServer
+        instance_server = InstanceServer(
+            instance_name(), lambda name, values: run_command(name, values, state_manager, widget), parent=app)
+        if instance_server.listen():
+            app.aboutToQuit.connect(instance_server.close)
+            app.aboutToQuit.connect(instance_lock.release)
+        else:
+            # Nobody can reach this instance, so do not make later launches wait on its lock
+            print("Single-instance server could not listen:", instance_server.server.errorString(),
+                  file=sys.stderr)
+            instance_lock.release()
+    if command != "show":
+        QTimer.singleShot(0, lambda: run_command(command, command_args, state_manager, widget))
+
+    # Debug runs log every stall of the GUI thread and dump the collected metrics on exit
+    if state_manager.app_config.get("debug", False):
+        from src.core.debug_metrics import DebugMetrics
+        from src.core.stall_watchdog import StallWatchdog
+        watchdog = StallWatchdog(threshold_ms=state_manager.app_config.get("stall_threshold_ms", 50),
+                                 log_size=state_manager.app_config.get("stall_log_size", 100), parent=app)
+        data_dir = state_manager.settings_manager.data_dir
+        app.aboutToQuit.connect(watchdog.stop)
+        app.aboutToQuit.connect(lambda: watchdog.dump(os.path.join(data_dir, "stall_log.json")))
+        # Paint counts and timings, among others
+        app.aboutToQuit.connect(lambda: DebugMetrics.shared().dump(os.path.join(data_dir, "debug_metrics.json")))
+        QTimer.singleShot(0, watchdog.start)
+
+    # Background services of enabled tools start once the event loop is running
+    QTimer.singleShot(0, lambda: state_manager.tool_registry.start_services(state_manager))
+
     # Run the application event loop
     sys.exit(app.exec())
 
@@ -1,4 +1,8 @@
+from src.core.asset_registry import AssetRegistry
+from src.core.scheduler import Scheduler
 from src.core.settings_manager import SettingsManager
+from src.core.theme_manager import ThemeManager
+from src.tools.tool_registry import ToolRegistry
 
 class StateManager:
     _instance = None
@@ -16,11 +20,24 @@ class StateManager:
         self.settings = self.settings_manager.settings
         self.current_theme = self.settings.get('theme', 'dark-1')
         self.last_position = self.settings.get('last_position', {'x': 100, 'y': 100})
+        self.asset_registry = AssetRegistry(
+            self.settings_manager.assets_config_file,
+            budget_bytes=self.app_config.get('asset_cache_budget_mb', 64) * 1024 * 1024,
+            debug=self.app_config.get('debug', False),
+            atlas_dir=self.app_config.get('config_paths', {}).get('asset_atlas_dir', 'assets/build')
+            if self.app_config.get('use_asset_atlas', True) else '',
+        )
+        self.theme_manager = ThemeManager(self.settings_manager)
+        self.tool_registry = ToolRegistry(self.settings_manager)
+        # One timer wheel for every time-based tool
+        self.scheduler = Scheduler(granularity_ms=self.app_config.get('scheduler_granularity_ms', 50))
         self.menu_open = False  # New flag to track if the menu is open
         self.initialized = True
 
     def reload_settings(self):
-        self.settings_manager.reload()
+        """Reloads settings from disk and returns the changed keys (see SettingsManager.reload)."""
+        changes = self.settings_manager.reload()
         self.settings = self.settings_manager.settings
         self.current_theme = self.settings.get('theme', 'dark-1')
         self.last_position = self.settings.get('last_position', {'x': 100, 'y': 100})
+        return changes
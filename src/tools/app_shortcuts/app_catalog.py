@@ -0,0 +1,304 @@
+import json
+import os
+import re
+import shlex
+import shutil
+import tempfile
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CATALOG_VERSION = 2
+# Exec field codes that stand for files/URLs passed in; a launcher passes none
+FIELD_CODES = {"%f", "%F", "%u", "%U", "%d", "%D", "%n", "%N", "%i", "%c", "%k", "%v", "%m"}
+FIELD_CODE_RE = re.compile(r"%(.)", re.DOTALL)
+
+
+def application_dirs() -> List[str]:
+    """The XDG application directories, highest precedence first."""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    data_dirs = (os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share").split(":")
+    dirs = [data_home] + data_dirs + [os.path.expanduser("~/.local/share/flatpak/exports/share"),
+                                      "/var/lib/flatpak/exports/share"]
+    seen, result = set(), []
+    for directory in dirs:
+        path = os.path.join(directory, "applications")
+        if directory and path not in seen:
+            seen.add(path)
+            result.append(path)
+    return result
+
+
+def parse_exec(value: str) -> List[str]:
+    """
+    Splits a desktop entry Exec value into argv, removing field codes, also those inside
+    an argument ("--file=%f" becomes "--file="). Arguments left empty are dropped.
+    """
+    try:
+        args = shlex.split(value)
+    except ValueError:
+        return []
+    argv = []
+    for arg in args:
+        expanded = FIELD_CODE_RE.sub(_expand_field_code, arg)
+        if expanded or not arg:
+            argv.append(expanded)
+    return argv
+
+
+def _expand_field_code(match: "re.Match") -> str:
+    code = match.group(0)
+    if code == "%%":
+        return "%"
+    return "" if code in FIELD_CODES else code
+
+
+def parse_desktop_file(path: str) -> Optional[Dict[str, object]]:
+    """Returns the launchable fields of a .desktop file, or None if it should not be listed."""
+    fields: Dict[str, str] = {}
+    in_entry = False
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("["):
+                    if in_entry:
+                        break  # only the main group matters
+                    in_entry = line == "[Desktop Entry]"
+                    continue
+                if in_entry and "=" in line:
+                    key, value = line.split("=", 1)
+                    # Unlocalized keys only; Name[de]=... and friends are skipped
+                    fields.setdefault(key.strip(), value.strip())
+    except OSError:
+        return None
+    if fields.get("Type") != "Application" or fields.get("NoDisplay") == "true" or fields.get("Hidden") == "true":
+        return None
+    argv = parse_exec(fields.get("Exec", ""))
+    if not argv or "Name" not in fields:
+        return None
+    return {
+        "name": fields["Name"],
+        "exec": argv,
+        "icon": fields.get("Icon", ""),
+        "comment": fields.get("Comment", "") or fields.get("GenericName", ""),
+        "keywords": [k for k in fields.get("Keywords", "").split(";") if k],
+        "terminal": fields.get("Terminal") == "true",
+        "try_exec": fields.get("TryExec", ""),
+    }
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp.", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class AppEntry:
+    __slots__ = ("id", "name", "exec", "icon", "comment", "terminal", "pinned", "search_text")
+
+    def __init__(self, entry_id: str, name: str, argv: List[str], icon: str = "", comment: str = "",
+                 keywords: Sequence[str] = (), terminal: bool = False, pinned: bool = False) -> None:
+        self.id = entry_id
+        self.name = name
+        self.exec = argv
+        self.icon = icon
+        self.comment = comment
+        self.terminal = terminal
+        self.pinned = pinned
+        self.search_text = " ".join([name] + list(keywords)).lower()
+
+
+class AppCatalog:
+    """
+    Launchable applications: the .desktop entries of the XDG application directories plus
+    the executables pinned in the "pinned_apps" setting.
+
+    The parsed entries are cached in cache_file together with the mtime of each directory
+    (and of every vendor subdirectory below it) and of each file. On load, a directory
+    whose mtimes are all unchanged is not listed again, and a
+    file whose (mtime, size) is unchanged is not parsed again, so a warm start is one
+    read of the cache plus a stat() per file. The cache is rewritten only if something
+    changed.
+    """
+
+    def __init__(self, cache_file: str, dirs: Optional[Sequence[str]] = None) -> None:
+        self.cache_file = cache_file
+        self.dirs = list(dirs) if dirs is not None else application_dirs()
+        self.entries: List[AppEntry] = []
+        self.parsed = 0  # desktop files parsed during the last load
+
+    def load(self, pinned: Sequence[str] = ()) -> List[AppEntry]:
+        cache = self._read_cache()
+        cached_dirs: Dict[str, List[object]] = cache.get("dirs", {})
+        cached_files: Dict[str, List[object]] = cache.get("files", {})
+        dirs: Dict[str, List[object]] = {}
+        files: Dict[str, List[object]] = {}
+        changed = False
+        self.parsed = 0
+
+        for directory in self.dirs:
+            if not os.path.isdir(directory):
+                changed |= directory in cached_dirs
+                continue
+            cached = cached_dirs.get(directory)
+            if cached is not None and self._mtimes_unchanged(directory, cached[0]):
+                mtimes, names = cached
+            else:
+                mtimes, names = self._list_desktop_files(directory)
+                changed = True
+            dirs[directory] = [mtimes, names]
+            for relative in names:
+                path = os.path.join(directory, relative)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    changed = True
+                    continue
+                previous = cached_files.get(path)
+                if previous is not None and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size:
+                    files[path] = previous
+                else:
+                    files[path] = [stat.st_mtime_ns, stat.st_size, parse_desktop_file(path)]
+                    self.parsed += 1
+                    changed = True
+
+        if changed or cache.get("version") != CATALOG_VERSION:
+            data = {"version": CATALOG_VERSION, "dirs": dirs, "files": files}
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+            write_atomic(self.cache_file, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+        self.entries = self._build_entries(dirs, files, pinned)
+        return self.entries
+
+    def _read_cache(self) -> Dict[str, object]:
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if cache.get("version") == CATALOG_VERSION else {}
+
+    @staticmethod
+    def _mtimes_unchanged(directory: str, mtimes: Dict[str, int]) -> bool:
+        for relative, mtime in mtimes.items():
+            try:
+                if os.stat(os.path.join(directory, relative)).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    @staticmethod
+    def _list_desktop_files(directory: str) -> Tuple[Dict[str, int], List[str]]:
+        """
+        Returns the mtime of directory and of each subdirectory below it, and the .desktop
+        files below it, both relative to directory (subdirectories form vendor prefixes).
+        """
+        mtimes: Dict[str, int] = {}
+        names = []
+        for current, subdirs, filenames in os.walk(directory):
+            subdirs.sort()
+            try:
+                mtimes[os.path.relpath(current, directory)] = os.stat(current).st_mtime_ns
+            except OSError:
+                continue
+            for filename in sorted(filenames):
+                if filename.endswith(".desktop"):
+                    names.append(os.path.relpath(os.path.join(current, filename), directory))
+        return mtimes, names
+
+    @staticmethod
+    def _build_entries(dirs: Dict[str, List[object]], files: Dict[str, List[object]],
+                       pinned: Sequence[str]) -> List[AppEntry]:
+        entries: List[AppEntry] = []
+        seen_ids = set()
+        pinned_set = set(pinned)
+        # Directories are in precedence order; the first file with a given desktop id wins
+        for directory, (_mtimes, names) in dirs.items():
+            for relative in names:
+                desktop_id = relative.replace(os.sep, "-")
+                if desktop_id in seen_ids:
+                    continue
+                seen_ids.add(desktop_id)
+                record = files.get(os.path.join(directory, relative))
+                fields = record[2] if record else None
+                if not fields:
+                    continue
+                if fields["try_exec"] and not shutil.which(fields["try_exec"]):
+                    continue
+                entries.append(AppEntry(desktop_id, fields["name"], fields["exec"], fields["icon"],
+                                        fields["comment"], fields["keywords"], fields["terminal"],
+                                        pinned=desktop_id in pinned_set))
+        known = {entry.id for entry in entries}
+        for item in pinned:
+            if item in known:
+                continue
+            # A pinned executable (or script) path
+            path = os.path.expanduser(item)
+            name = os.path.splitext(os.path.basename(path))[0]
+            entries.append(AppEntry(item, name, [path], pinned=True))
+        entries.sort(key=lambda entry: (not entry.pinned, entry.name.lower()))
+        return entries
+
+    def search(self, query: str, limit: int = 50) -> List[AppEntry]:
+        """Fuzzy search: name prefixes beat word prefixes beat substrings beat in-order subsequences."""
+        query = query.strip().lower()
+        if not query:
+            return self.entries[:limit]
+        scored: List[Tuple[float, int, AppEntry]] = []
+        for position, entry in enumerate(self.entries):
+            score = self._score(query, entry.search_text)
+            if score > 0:
+                if entry.pinned:
+                    score += 5
+                scored.append((-score, position, entry))
+        scored.sort()
+        return [entry for _score, _position, entry in scored[:limit]]
+
+    @staticmethod
+    def _score(query: str, text: str) -> float:
+        if text.startswith(query):
+            return 100.0
+        index = text.find(query)
+        if index > 0:
+            return 80.0 if text[index - 1] == " " else 60.0
+        # Subsequence; tighter spans score higher
+        start = position = text.find(query[0])
+        if start < 0:
+            return 0.0
+        for char in query[1:]:
+            position = text.find(char, position + 1)
+            if position < 0:
+                return 0.0
+        return 40.0 * len(query) / (position - start + 1)
+
+
+def launch_command(entry: AppEntry) -> List[str]:
+    """Returns the argv to start entry, wrapped in a terminal emulator if it asks for one."""
+    argv = list(entry.exec)
+    if entry.terminal:
+        terminal = os.environ.get("TERMINAL") or shutil.which("x-terminal-emulator") or shutil.which("xterm")
+        if terminal:
+            argv = [terminal, "-e"] + argv
+    return argv
+
+
+def launch(entry: AppEntry) -> bool:
+    """
+    Starts entry as a detached process and returns at once. The child is never waited on;
+    it is re-parented away from this process, so it is also never left as a zombie.
+    """
+    from PySide6.QtCore import QProcess
+
+    argv = launch_command(entry)
+    if not argv:
+        return False
+    started, _pid = QProcess.startDetached(argv[0], argv[1:], os.path.expanduser("~"))
+    return started
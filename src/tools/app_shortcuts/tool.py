@@ -0,0 +1,135 @@
+import os
+from typing import Dict, Optional
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import (QFileDialog, QHBoxLayout, QLabel, QLineEdit, QListWidget, QListWidgetItem,
+                               QPushButton, QVBoxLayout, QWidget)
+
+from src.tools.app_shortcuts.app_catalog import AppCatalog, AppEntry, launch
+
+
+class AppShortcutsWidget(QWidget):
+    """
+    Application launcher. Icons are resolved only for the rows being shown, and each
+    icon once per session.
+    """
+
+    def __init__(self, state_manager, catalog: AppCatalog, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.catalog = catalog
+        self._icons: Dict[str, QIcon] = {}
+        self._entries: Dict[str, AppEntry] = {}
+        self.setWindowTitle("Apps")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.resize(420, 460)
+
+        self.search_box = QLineEdit(self)
+        self.search_box.setPlaceholderText("Search applications...")
+        self.result_list = QListWidget(self)
+        self.status_label = QLabel("", self)
+        self.pin_button = QPushButton("Pin / Unpin", self)
+        add_button = QPushButton("Add program...", self)
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.pin_button)
+        buttons.addWidget(add_button)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.search_box)
+        layout.addWidget(self.result_list)
+        layout.addLayout(buttons)
+        layout.addWidget(self.status_label)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(50)
+        self._search_timer.timeout.connect(self.refresh_results)
+        self.search_box.textChanged.connect(self._search_timer.start)
+        self.search_box.returnPressed.connect(self.launch_selected)
+        self.result_list.itemActivated.connect(self.launch_selected)
+        self.pin_button.clicked.connect(self.toggle_pin)
+        add_button.clicked.connect(self.add_program)
+
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def _pinned(self):
+        return list(self.state_manager.settings_manager.get_setting("pinned_apps", []))
+
+    def reload_catalog(self) -> None:
+        self.catalog.load(self._pinned())
+        self.refresh_results()
+
+    def _icon(self, entry: AppEntry) -> QIcon:
+        icon = self._icons.get(entry.icon)
+        if icon is None:
+            if not entry.icon:
+                icon = QIcon()
+            elif os.path.isabs(entry.icon):
+                icon = QIcon(entry.icon)
+            else:
+                icon = QIcon.fromTheme(entry.icon)
+            self._icons[entry.icon] = icon
+        return icon
+
+    def refresh_results(self) -> None:
+        self.result_list.clear()
+        self._entries.clear()
+        for entry in self.catalog.search(self.search_box.text(), limit=50):
+            item = QListWidgetItem(self._icon(entry), ("* " if entry.pinned else "") + entry.name)
+            item.setData(Qt.UserRole, entry.id)
+            if entry.comment:
+                item.setToolTip(entry.comment)
+            self._entries[entry.id] = entry
+            self.result_list.addItem(item)
+        if self.result_list.count():
+            self.result_list.setCurrentRow(0)
+        self.status_label.setText(f"{len(self.catalog.entries)} applications")
+
+    def _selected(self) -> Optional[AppEntry]:
+        item = self.result_list.currentItem()
+        return self._entries.get(item.data(Qt.UserRole)) if item else None
+
+    def launch_selected(self, *_args) -> None:
+        entry = self._selected()
+        if entry is None:
+            return
+        if launch(entry):
+            self.hide()
+        else:
+            self.status_label.setText(f"Could not start {entry.name}")
+
+    def toggle_pin(self) -> None:
+        entry = self._selected()
+        if entry is None:
+            return
+        pinned = self._pinned()
+        if entry.id in pinned:
+            pinned.remove(entry.id)
+        else:
+            pinned.append(entry.id)
+        self.state_manager.settings_manager.update_setting("pinned_apps", pinned)
+        self.reload_catalog()
+
+    def add_program(self) -> None:
+        path, _filter = QFileDialog.getOpenFileName(self, "Pin a program", os.path.expanduser("~"))
+        if not path:
+            return
+        pinned = self._pinned()
+        if path not in pinned:
+            pinned.append(path)
+            self.state_manager.settings_manager.update_setting("pinned_apps", pinned)
+        self.reload_catalog()
+
+    def showEvent(self, event) -> None:
+        # Validating the cache is a stat() per desktop file, so re-check on every show
+        self.reload_catalog()
+        self.search_box.setFocus()
+        super().showEvent(event)
+
+
+def create_tool(state_manager, parent=None) -> AppShortcutsWidget:
+    catalog = AppCatalog(os.path.join(state_manager.settings_manager.data_dir, "app_catalog.json"))
+    return AppShortcutsWidget(state_manager, catalog, parent)
@@ -0,0 +1,80 @@
+from typing import Dict, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QLabel, QLineEdit, QListWidget, QVBoxLayout, QWidget
+
+from src.core.expression_engine import ExpressionEngine, IncrementalEvaluator, format_number
+
+HISTORY_SIZE = 50
+
+
+class CalculatorWidget(QWidget):
+    """
+    Expression calculator. The result updates as the user types; Enter moves the line
+    into the history and makes its value available as "ans".
+    """
+
+    def __init__(self, state_manager, engine: ExpressionEngine, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.evaluator = IncrementalEvaluator(engine)
+        self.variables: Dict[str, float] = {"ans": 0.0}
+        self.setWindowTitle("Calculator")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.resize(320, 360)
+
+        self.input = QLineEdit(self)
+        self.input.setPlaceholderText("e.g. 2^10 / 3 + sqrt(ans)")
+        self.result_label = QLabel("", self)
+        self.result_label.setAlignment(Qt.AlignRight)
+        font = QFont(self.result_label.font())
+        font.setPointSize(20)
+        self.result_label.setFont(font)
+        self.error_label = QLabel("", self)
+        self.history = QListWidget(self)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.input)
+        layout.addWidget(self.result_label)
+        layout.addWidget(self.error_label)
+        layout.addWidget(self.history)
+
+        self.input.textChanged.connect(self._on_text_changed)
+        self.input.returnPressed.connect(self.commit)
+        self.history.itemActivated.connect(lambda item: self.input.setText(item.data(Qt.UserRole)))
+
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def _on_text_changed(self, text: str) -> None:
+        if not text.strip():
+            self.evaluator.reset()
+            self.result_label.setText("")
+            self.error_label.setText("")
+            return
+        value = self.evaluator.update(text, self.variables)
+        self.result_label.setText("" if value is None else format_number(value))
+        self.result_label.setEnabled(not self.evaluator.stale)
+        self.error_label.setText(self.evaluator.error if self.evaluator.stale or value is None else "")
+
+    def commit(self) -> None:
+        text = self.input.text().strip()
+        if not text or self.evaluator.error:
+            return
+        value = self.evaluator.value
+        self.variables["ans"] = value
+        self.history.insertItem(0, f"{text} = {format_number(value)}")
+        self.history.item(0).setData(Qt.UserRole, text)
+        while self.history.count() > HISTORY_SIZE:
+            self.history.takeItem(self.history.count() - 1)
+        self.input.clear()
+
+    def showEvent(self, event) -> None:
+        self.input.setFocus()
+        super().showEvent(event)
+
+
+def create_tool(state_manager, parent=None) -> CalculatorWidget:
+    return CalculatorWidget(state_manager, ExpressionEngine.shared(), parent)
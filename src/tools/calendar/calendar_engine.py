@@ -0,0 +1,363 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from src.tools.calendar.ics_parser import parse_events
+from src.tools.calendar.interval_tree import IntervalTree
+from src.tools.calendar.recurrence import RecurrenceRule
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+CACHE_VERSION = 2
+WALL_FORMAT = "%Y%m%dT%H%M%S"
+FOREVER = float("inf")
+
+
+def resolve_tz(name: str) -> Optional[tzinfo]:
+    """Returns the tzinfo for a TZID; None means floating (local) time."""
+    if not name:
+        return None
+    if name == "UTC":
+        return timezone.utc
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo(name)
+        except (KeyError, ValueError, OSError):
+            pass
+    return None  # unknown TZIDs (e.g. Windows names) are treated as local time
+
+
+def local_tz_key() -> str:
+    """Identifies the local time zone; cached epochs of floating times are only valid within it."""
+    return f"{time.timezone}/{time.altzone}/{'/'.join(time.tzname)}"
+
+
+def to_epoch(wall: datetime, tz: Optional[tzinfo]) -> float:
+    return (wall.replace(tzinfo=tz) if tz is not None else wall).timestamp()
+
+
+def from_epoch(timestamp: float, tz: Optional[tzinfo]) -> datetime:
+    """The wall-clock time in tz (local time if None) of an epoch timestamp, as a naive datetime."""
+    if tz is None:
+        return datetime.fromtimestamp(timestamp)
+    return datetime.fromtimestamp(timestamp, tz).replace(tzinfo=None)
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp.", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class Occurrence:
+    """One concrete occurrence of an event, with local start and end times."""
+
+    __slots__ = ("start", "end", "summary", "location", "all_day", "uid")
+
+    def __init__(self, start: float, end: float, event: "CalendarEvent") -> None:
+        self.start = datetime.fromtimestamp(start)
+        self.end = datetime.fromtimestamp(end)
+        self.summary = event.summary
+        self.location = event.location
+        self.all_day = event.all_day
+        self.uid = event.uid
+
+
+class CalendarEvent:
+    """An event from an ICS file; recurring events keep their rule and are expanded on query."""
+
+    __slots__ = ("uid", "summary", "location", "all_day", "tz", "start_wall", "start", "duration",
+                 "rule", "until", "exdates")
+
+    def __init__(self, record: Dict[str, object]) -> None:
+        start = record["start"]
+        self.uid: str = record.get("uid", "")
+        self.summary: str = record.get("summary", "(No title)")
+        self.location: str = record.get("location", "")
+        self.all_day: bool = start["date"]
+        resolved = record.get("resolved")
+        if resolved is not None and not record.get("rrule") and not record.get("exdates") \
+                and "recurrence_id" not in record:
+            # A one-off event needs only its epoch times, resolved when the file was parsed
+            self.start, self.duration = resolved
+            self.tz = None
+            self.start_wall = None
+            self.rule = None
+            self.until = None
+            self.exdates = set()
+            return
+        self.tz = resolve_tz(start["tz"])
+        self.start_wall = datetime.strptime(start["wall"], WALL_FORMAT)
+        self.start = to_epoch(self.start_wall, self.tz)
+        end = record.get("end")
+        if end is not None:
+            self.duration = max(0.0, to_epoch(datetime.strptime(end["wall"], WALL_FORMAT),
+                                              resolve_tz(end["tz"])) - self.start)
+        elif record.get("duration") is not None:
+            self.duration = float(record["duration"])
+        else:
+            self.duration = 86400.0 if self.all_day else 0.0
+        self.rule: Optional[RecurrenceRule] = None
+        self.until: Optional[datetime] = None
+        rrule = record.get("rrule")
+        if rrule and "recurrence_id" not in record:
+            rule = RecurrenceRule(rrule)
+            if rule.valid:
+                self.rule = rule
+                if rule.until:
+                    self.until = self._until_wall(rule.until)
+        self.exdates: Set[datetime] = {
+            self._wall_in_own_tz(item) for item in record.get("exdates", [])
+        }
+
+    def _wall_in_own_tz(self, value: Dict[str, object]) -> datetime:
+        wall = datetime.strptime(value["wall"], WALL_FORMAT)
+        if value["date"]:
+            return datetime.combine(wall.date(), self.start_wall.time())
+        return from_epoch(to_epoch(wall, resolve_tz(value["tz"])), self.tz)
+
+    def _until_wall(self, until: str) -> datetime:
+        if len(until) == 8:
+            return datetime.strptime(until, "%Y%m%d") + timedelta(days=1) - timedelta(seconds=1)
+        if until.endswith("Z"):
+            return from_epoch(to_epoch(datetime.strptime(until[:-1], WALL_FORMAT), timezone.utc), self.tz)
+        return datetime.strptime(until, WALL_FORMAT)
+
+    def span(self) -> Tuple[float, float]:
+        """The time range this event can occupy, for the interval tree."""
+        if self.rule is None:
+            return self.start, self.start + max(self.duration, 1.0)
+        if self.until is not None:
+            return self.start, to_epoch(self.until, self.tz) + self.duration + 1.0
+        return self.start, FOREVER
+
+    def occurrences(self, window_start: float, window_end: float):
+        """Yields (start, end) epoch pairs of the occurrences overlapping [window_start, window_end)."""
+        if self.rule is None:
+            yield self.start, self.start + self.duration
+            return
+        skip_to = from_epoch(window_start - self.duration, self.tz)
+        for wall in self.rule.occurrences(self.start_wall, self.until, skip_to):
+            start = to_epoch(wall, self.tz)
+            if start >= window_end:
+                return
+            if start + max(self.duration, 1.0) > window_start and wall not in self.exdates:
+                yield start, start + self.duration
+
+
+class CalendarEngine(QObject):
+    """
+    Events of the .ics files in the "calendar_files" setting.
+
+    Files are parsed on a worker thread while streaming through them, and the parsed
+    events are cached in cache_dir under the SHA-1 of the file content (a path -> (mtime,
+    size, sha1) map avoids even hashing files that did not change), with the epoch start
+    and duration of one-off events already resolved. If every file's (mtime, size, sha1)
+    matches the last load, nothing is rebuilt at all. Events go into an
+    IntervalTree; recurring events are stored once, spanning until their UNTIL (or
+    forever), and only expanded for the window being asked for. "loaded" is emitted
+    once the new events are in place.
+    """
+    loaded = Signal()
+
+    def __init__(self, cache_dir: str, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.hashes_file = os.path.join(cache_dir, "files.json")
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._tree: IntervalTree = IntervalTree([])
+        self._recurring: List[CalendarEvent] = []
+        self._worker: Optional[threading.Thread] = None
+        self._pending: Optional[List[str]] = None
+        self._signature: Optional[List[List[object]]] = None  # [path, mtime, size, sha1] per loaded file
+        self.errors: List[str] = []
+        self.event_count = 0
+        self.load_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def load(self, paths: Sequence[str]) -> None:
+        """(Re)loads the given files in the background; a load requested meanwhile runs after the current one."""
+        with self._lock:
+            self._pending = [os.path.expanduser(path) for path in paths]
+            if self._worker is not None:
+                return  # the running worker picks up _pending before it exits
+            self._worker = threading.Thread(target=self._load_loop, name="CalendarLoader", daemon=True)
+            self._worker.start()
+
+    def _load_loop(self) -> None:
+        while True:
+            with self._lock:
+                paths, self._pending = self._pending, None
+                if paths is None:
+                    # Cleared under the lock, so a load() from now on starts a new worker
+                    self._worker = None
+                    return
+            try:
+                self._load_files(paths)
+            except Exception:
+                print("Failed to load calendars:")
+                traceback.print_exc()
+
+    def _load_files(self, paths: List[str]) -> None:
+        started = time.perf_counter()
+        hashes = self._read_json(self.hashes_file)
+        errors = []
+        signature: List[List[object]] = []
+        for path in paths:
+            try:
+                signature.append([path] + self._digest(path, hashes))
+            except OSError as e:
+                errors.append(f"{path}: {e}")
+        if signature == self._signature:
+            return  # nothing changed since the last load
+        write_atomic(self.hashes_file, json.dumps(hashes).encode("utf-8"))
+
+        records: List[Dict[str, object]] = []
+        for path, _mtime, _size, digest in signature:
+            try:
+                records.extend(self._records(path, digest))
+            except OSError as e:
+                errors.append(f"{path}: {e}")
+
+        events, recurring = self._build_events(records)
+        tree = IntervalTree([(*event.span(), event) for event in events])
+        with self._lock:
+            self._tree = tree
+            self._recurring = recurring
+            self.errors = errors
+            self.event_count = len(events)
+            self.load_seconds = time.perf_counter() - started
+        self._signature = signature if not errors else None
+        self.loaded.emit()
+
+    @staticmethod
+    def _digest(path: str, hashes: Dict[str, List[object]]) -> List[object]:
+        """Returns [mtime, size, sha1] of path, hashing the content only if mtime or size changed."""
+        stat = os.stat(path)
+        known = hashes.get(path)
+        if known and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+            return known
+        sha1 = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha1.update(chunk)
+        hashes[path] = [stat.st_mtime_ns, stat.st_size, sha1.hexdigest()]
+        return hashes[path]
+
+    def _records(self, path: str, digest: str) -> List[Dict[str, object]]:
+        cache_file = os.path.join(self.cache_dir, digest + ".json")
+        cached = self._read_json(cache_file)
+        local_tz = local_tz_key()
+        if cached.get("version") == CACHE_VERSION and cached.get("local_tz") == local_tz:
+            return cached["events"]
+        with open(path, "rb") as f:
+            records = list(parse_events(f))
+        for record in records:
+            if record.get("rrule") or record.get("exdates") or "recurrence_id" in record:
+                continue
+            try:
+                event = CalendarEvent(record)
+            except (KeyError, ValueError):
+                continue  # malformed times; dropped again when the events are built
+            record["resolved"] = [event.start, event.duration]
+        write_atomic(cache_file, json.dumps({"version": CACHE_VERSION, "local_tz": local_tz, "events": records},
+                                            separators=(",", ":")).encode("utf-8"))
+        return records
+
+    @staticmethod
+    def _read_json(path: str) -> Dict:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _build_events(records: List[Dict[str, object]]) -> Tuple[List[CalendarEvent], List[CalendarEvent]]:
+        events: List[CalendarEvent] = []
+        overrides: List[Tuple[CalendarEvent, Dict[str, object]]] = []
+        for record in records:
+            if record.get("status") == "CANCELLED" and "recurrence_id" not in record:
+                continue
+            try:
+                event = CalendarEvent(record)
+            except (KeyError, ValueError):
+                continue  # malformed times
+            if "recurrence_id" in record:
+                overrides.append((event, record))
+            else:
+                events.append(event)
+        # A RECURRENCE-ID event replaces (or, if cancelled, removes) one occurrence of its series
+        masters = {event.uid: event for event in events if event.rule is not None}
+        for event, record in overrides:
+            master = masters.get(event.uid)
+            if master is not None:
+                master.exdates.add(master._wall_in_own_tz(record["recurrence_id"]))
+            if record.get("status") != "CANCELLED":
+                events.append(event)
+        recurring = [event for event in events if event.rule is not None and event.until is None]
+        return events, recurring
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def between(self, start: datetime, end: datetime) -> List[Occurrence]:
+        """Returns the occurrences overlapping [start, end) (local naive datetimes), ordered by start."""
+        window_start, window_end = start.timestamp(), end.timestamp()
+        with self._lock:
+            events = self._tree.overlapping(window_start, window_end)
+        result = []
+        for event in events:
+            for occurrence_start, occurrence_end in event.occurrences(window_start, window_end):
+                result.append((occurrence_start, occurrence_end, event))
+        result.sort(key=lambda item: item[0])
+        return [Occurrence(s, e, event) for s, e, event in result]
+
+    def next_event(self, after: Optional[datetime] = None) -> Optional[Occurrence]:
+        """Returns the first occurrence starting after the given time (now by default)."""
+        moment = (after or datetime.now()).timestamp()
+        best: Optional[Tuple[float, float, CalendarEvent]] = None
+        with self._lock:
+            tree = self._tree
+            recurring = self._recurring
+        # One-off events: the first start after moment is a bisect away. Bounded series met on
+        # the way start before it and may still win; unbounded ones are all in `recurring`.
+        series = [event for event in tree.overlapping(moment, moment + 1.0)
+                  if event.rule is not None and event.until is not None]
+        index = tree.first_starting_after(moment)
+        while index < len(tree):
+            event = tree.values[index]
+            if event.rule is None:
+                best = (event.start, event.start + event.duration, event)
+                break
+            if event.until is not None:
+                series.append(event)
+            index += 1
+        # Series: the next occurrence of each, stopping at the best start found so far
+        for event in recurring + series:
+            limit = best[0] if best else FOREVER
+            for occurrence_start, occurrence_end in event.occurrences(moment, limit):
+                if occurrence_start > moment:
+                    best = (occurrence_start, occurrence_end, event)
+                    break
+        return Occurrence(*best) if best else None
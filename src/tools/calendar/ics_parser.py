@@ -0,0 +1,123 @@
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+DURATION_RE = re.compile(r"^([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+
+
+def unfold(lines: Iterable[bytes]) -> Iterator[str]:
+    """Yields logical content lines: continuation lines (leading space or tab) are joined to the previous one."""
+    current: Optional[bytes] = None
+    for raw in lines:
+        raw = raw.rstrip(b"\r\n")
+        if raw[:1] in (b" ", b"\t"):
+            if current is not None:
+                current += raw[1:]
+            continue
+        if current is not None:
+            yield current.decode("utf-8", errors="replace")
+        current = raw
+    if current is not None:
+        yield current.decode("utf-8", errors="replace")
+
+
+def split_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    """Splits "NAME;PARAM=x;PARAM2=y:value" into (NAME, {PARAM: x, ...}, value)."""
+    # The value starts at the first colon outside a quoted parameter value
+    in_quotes = False
+    for index, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ":" and not in_quotes:
+            head, value = line[:index], line[index + 1:]
+            break
+    else:
+        return line.upper(), {}, ""
+    parts = head.split(";")
+    params = {}
+    for part in parts[1:]:
+        if "=" in part:
+            key, param_value = part.split("=", 1)
+            params[key.upper()] = param_value.strip('"')
+    return parts[0].upper(), params, value
+
+
+def unescape(value: str) -> str:
+    return (value.replace("\\n", "\n").replace("\\N", "\n").replace("\\,", ",")
+            .replace("\\;", ";").replace("\\\\", "\\"))
+
+
+def parse_duration(value: str) -> Optional[int]:
+    """Returns an ICS DURATION in seconds, or None if it cannot be parsed."""
+    match = DURATION_RE.match(value.strip())
+    if not match:
+        return None
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    total = ((int(weeks or 0) * 7 + int(days or 0)) * 86400 + int(hours or 0) * 3600
+             + int(minutes or 0) * 60 + int(seconds or 0))
+    return -total if sign == "-" else total
+
+
+def _time_value(params: Dict[str, str], value: str) -> Dict[str, object]:
+    """A DTSTART/DTEND/RECURRENCE-ID value as {"wall": "YYYYMMDDTHHMMSS", "tz": ..., "date": bool}."""
+    value = value.strip()
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return {"wall": value[:8] + "T000000", "tz": "", "date": True}
+    if value.endswith("Z"):
+        return {"wall": value[:-1], "tz": "UTC", "date": False}
+    return {"wall": value, "tz": params.get("TZID", ""), "date": False}
+
+
+def parse_events(lines: Iterable[bytes]) -> Iterator[Dict[str, object]]:
+    """
+    Streams the VEVENTs of an ICS file as plain dicts, one event at a time, so a large
+    file is never held in memory as a whole. Only the properties the calendar uses are
+    kept; times stay in their wall-clock form with their TZID, to be resolved later.
+    """
+    event: Optional[Dict[str, object]] = None
+    depth = 0  # nested components inside the VEVENT (VALARM, ...)
+    for line in unfold(lines):
+        name, params, value = split_line(line)
+        if name == "BEGIN":
+            if value.upper() == "VEVENT" and event is None:
+                event = {"exdates": []}
+            elif event is not None:
+                depth += 1
+            continue
+        if name == "END":
+            if event is not None and depth:
+                depth -= 1
+            elif event is not None and value.upper() == "VEVENT":
+                if "start" in event:
+                    yield event
+                event = None
+            continue
+        if event is None or depth:
+            continue
+        if name == "DTSTART":
+            event["start"] = _time_value(params, value)
+        elif name == "DTEND":
+            event["end"] = _time_value(params, value)
+        elif name == "DURATION":
+            event["duration"] = parse_duration(value)
+        elif name == "SUMMARY":
+            event["summary"] = unescape(value)
+        elif name == "LOCATION":
+            event["location"] = unescape(value)
+        elif name == "UID":
+            event["uid"] = value
+        elif name == "RRULE":
+            event["rrule"] = value
+        elif name == "RECURRENCE-ID":
+            event["recurrence_id"] = _time_value(params, value)
+        elif name == "EXDATE":
+            tz_params = params
+            for item in value.split(","):
+                if item:
+                    event["exdates"].append(_time_value(tz_params, item))
+        elif name == "STATUS":
+            event["status"] = value.upper()
+
+
+def parse_file(path: str) -> List[Dict[str, object]]:
+    with open(path, "rb") as f:
+        return list(parse_events(f))
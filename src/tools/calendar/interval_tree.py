@@ -0,0 +1,58 @@
+from bisect import bisect_right
+from typing import Generic, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalTree(Generic[T]):
+    """
+    Static interval tree over half-open [start, end) intervals.
+
+    Intervals are sorted by start and viewed as an implicit balanced binary tree (the
+    middle element of each index range is the node); every node stores the largest end
+    in its subtree. An overlap query prunes subtrees whose largest end is before the
+    window and right subtrees whose node starts after it, so it costs O(log n + k).
+    Built once per load; the calendar rebuilds it when its files change.
+    """
+
+    def __init__(self, intervals: Sequence[Tuple[float, float, T]]) -> None:
+        ordered = sorted(intervals, key=lambda item: (item[0], item[1]))
+        self.starts: List[float] = [item[0] for item in ordered]
+        self.ends: List[float] = [item[1] for item in ordered]
+        self.values: List[T] = [item[2] for item in ordered]
+        self._max_end: List[float] = [0.0] * len(ordered)
+        self._build(0, len(ordered))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _build(self, lo: int, hi: int) -> float:
+        if lo >= hi:
+            return float("-inf")
+        mid = (lo + hi) // 2
+        max_end = max(self.ends[mid], self._build(lo, mid), self._build(mid + 1, hi))
+        self._max_end[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: float, end: float) -> List[T]:
+        """Returns the values of all intervals overlapping [start, end), ordered by start."""
+        result: List[Tuple[int, T]] = []
+        stack = [(0, len(self.starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                continue  # nothing in this subtree reaches the window
+            stack.append((lo, mid))
+            if self.starts[mid] < end:
+                if self.ends[mid] > start:
+                    result.append((mid, self.values[mid]))
+                stack.append((mid + 1, hi))
+        result.sort(key=lambda item: item[0])
+        return [value for _index, value in result]
+
+    def first_starting_after(self, moment: float) -> int:
+        """Returns the index of the first interval starting after moment (len(self) if none)."""
+        return bisect_right(self.starts, moment)
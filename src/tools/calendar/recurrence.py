@@ -0,0 +1,133 @@
+import calendar
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+# Give up on a rule after this many periods in a row without an occurrence (e.g. BYMONTHDAY=30 in February only)
+MAX_EMPTY_PERIODS = 1000
+
+
+class RecurrenceRule:
+    """
+    The supported subset of an RRULE: FREQ (DAILY, WEEKLY, MONTHLY, YEARLY), INTERVAL,
+    COUNT, UNTIL, BYDAY (with ordinals such as 2TU or -1FR for MONTHLY and YEARLY),
+    BYMONTHDAY and BYMONTH. Anything else is ignored.
+    """
+
+    def __init__(self, text: str) -> None:
+        parts: Dict[str, str] = {}
+        for part in text.split(";"):
+            if "=" in part:
+                key, value = part.split("=", 1)
+                parts[key.upper()] = value
+        self.freq = parts.get("FREQ", "").upper()
+        self.interval = max(1, int(parts.get("INTERVAL", "1") or 1))
+        self.count: Optional[int] = int(parts["COUNT"]) if "COUNT" in parts else None
+        self.until: Optional[str] = parts.get("UNTIL")  # raw; resolved by the caller's time zone
+        self.by_day: List[Tuple[int, int]] = []  # (ordinal or 0, weekday)
+        for item in filter(None, parts.get("BYDAY", "").split(",")):
+            weekday = WEEKDAYS.get(item[-2:].upper())
+            if weekday is not None:
+                self.by_day.append((int(item[:-2]) if item[:-2] else 0, weekday))
+        self.by_month_day = [int(d) for d in parts.get("BYMONTHDAY", "").split(",") if d]
+        self.by_month = [int(m) for m in parts.get("BYMONTH", "").split(",") if m]
+
+    @property
+    def valid(self) -> bool:
+        return self.freq in ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+
+    # ------------------------------------------------------------------
+    # Expansion
+    # ------------------------------------------------------------------
+    def occurrences(self, dtstart: datetime, until: Optional[datetime] = None,
+                    skip_to: Optional[datetime] = None) -> Iterator[datetime]:
+        """
+        Yields occurrence start times (in dtstart's wall-clock time) in order, lazily.
+
+        skip_to lets the expansion jump straight to the period containing that time
+        instead of walking every period since dtstart. It is ignored for COUNT rules,
+        which have to be counted from the start (and are bounded by COUNT anyway).
+        """
+        if not self.valid:
+            yield dtstart
+            return
+        first_period = 0
+        if skip_to is not None and self.count is None and skip_to > dtstart:
+            first_period = self._period_of(dtstart, skip_to)
+        emitted = 0
+        empty = 0
+        period = first_period
+        while True:
+            found = False
+            for day in self._days_in_period(dtstart, period):
+                occurrence = datetime.combine(day, dtstart.time())
+                if occurrence < dtstart:
+                    continue
+                if until is not None and occurrence > until:
+                    return
+                found = True
+                yield occurrence
+                emitted += 1
+                if self.count is not None and emitted >= self.count:
+                    return
+            empty = 0 if found else empty + 1
+            if empty > MAX_EMPTY_PERIODS:
+                return
+            period += 1
+
+    def _period_of(self, dtstart: datetime, moment: datetime) -> int:
+        """Returns the index of the period (counted in INTERVALs from dtstart) that contains moment."""
+        if self.freq == "DAILY":
+            units = (moment.date() - dtstart.date()).days
+        elif self.freq == "WEEKLY":
+            week_start = dtstart.date() - timedelta(days=dtstart.weekday())
+            units = (moment.date() - week_start).days // 7
+        elif self.freq == "MONTHLY":
+            units = (moment.year - dtstart.year) * 12 + moment.month - dtstart.month
+        else:
+            units = moment.year - dtstart.year
+        return max(0, units // self.interval)
+
+    def _days_in_period(self, dtstart: datetime, period: int) -> List[date]:
+        start = dtstart.date()
+        if self.freq == "DAILY":
+            day = start + timedelta(days=period * self.interval)
+            if self.by_day and day.weekday() not in {weekday for _n, weekday in self.by_day}:
+                return []
+            if self.by_month and day.month not in self.by_month:
+                return []
+            return [day]
+        if self.freq == "WEEKLY":
+            week_start = start - timedelta(days=start.weekday()) + timedelta(weeks=period * self.interval)
+            weekdays = sorted({weekday for _n, weekday in self.by_day}) or [start.weekday()]
+            return [week_start + timedelta(days=weekday) for weekday in weekdays]
+        if self.freq == "MONTHLY":
+            month_index = start.month - 1 + period * self.interval
+            year, month = start.year + month_index // 12, month_index % 12 + 1
+            if self.by_month and month not in self.by_month:
+                return []
+            return self._days_in_month(year, month, start.day)
+        year = start.year + period * self.interval
+        days: List[date] = []
+        for month in (self.by_month or [start.month]):
+            days.extend(self._days_in_month(year, month, start.day))
+        return sorted(days)
+
+    def _days_in_month(self, year: int, month: int, default_day: int) -> List[date]:
+        last = calendar.monthrange(year, month)[1]
+        days = set()
+        for month_day in self.by_month_day:
+            day = month_day if month_day > 0 else last + 1 + month_day
+            if 1 <= day <= last:
+                days.add(day)
+        for ordinal, weekday in self.by_day:
+            first = (weekday - calendar.weekday(year, month, 1)) % 7 + 1
+            candidates = list(range(first, last + 1, 7))
+            if ordinal == 0:
+                days.update(candidates)
+            elif -len(candidates) <= ordinal <= len(candidates) and ordinal:
+                days.add(candidates[ordinal - 1 if ordinal > 0 else ordinal])
+        if not self.by_month_day and not self.by_day and default_day <= last:
+            # Months without that day (e.g. the 31st) are skipped, as RFC 5545 requires
+            days.add(default_day)
+        return [date(year, month, day) for day in sorted(days)]
@@ -0,0 +1,137 @@
+import os
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (QFileDialog, QHBoxLayout, QLabel, QListWidget, QListWidgetItem, QPushButton,
+                               QVBoxLayout, QWidget)
+
+from src.tools.calendar.calendar_engine import CalendarEngine, Occurrence
+
+
+def format_occurrence(occurrence: Occurrence) -> str:
+    if occurrence.all_day:
+        text = f"All day  {occurrence.summary}"
+    else:
+        text = f"{occurrence.start:%H:%M}-{occurrence.end:%H:%M}  {occurrence.summary}"
+    if occurrence.location:
+        text += f" ({occurrence.location})"
+    return text
+
+
+class CalendarWidget(QWidget):
+    """
+    Week agenda of the .ics files listed in the "calendar_files" setting. Files are
+    (re)loaded in the background each time the window is shown; unchanged files come
+    straight from the engine's cache.
+    """
+
+    def __init__(self, state_manager, engine: CalendarEngine, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.engine = engine
+        self.week_start = self._monday(date.today())
+        self.setWindowTitle("Calendar")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.resize(380, 460)
+
+        self.next_label = QLabel("", self)
+        self.next_label.setWordWrap(True)
+        previous_button = QPushButton("<", self)
+        today_button = QPushButton("Today", self)
+        next_button = QPushButton(">", self)
+        self.week_label = QLabel("", self)
+        self.week_label.setAlignment(Qt.AlignCenter)
+        self.event_list = QListWidget(self)
+        self.status_label = QLabel("", self)
+        add_button = QPushButton("Add calendar...", self)
+
+        navigation = QHBoxLayout()
+        navigation.addWidget(previous_button)
+        navigation.addWidget(self.week_label, 1)
+        navigation.addWidget(today_button)
+        navigation.addWidget(next_button)
+        footer = QHBoxLayout()
+        footer.addWidget(self.status_label, 1)
+        footer.addWidget(add_button)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.next_label)
+        layout.addLayout(navigation)
+        layout.addWidget(self.event_list)
+        layout.addLayout(footer)
+
+        previous_button.clicked.connect(lambda: self.shift_week(-1))
+        next_button.clicked.connect(lambda: self.shift_week(1))
+        today_button.clicked.connect(self.show_today)
+        add_button.clicked.connect(self.add_calendar)
+        self.engine.loaded.connect(self.refresh)
+
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    @staticmethod
+    def _monday(day: date) -> date:
+        return day - timedelta(days=day.weekday())
+
+    def _files(self):
+        return list(self.state_manager.settings_manager.get_setting("calendar_files", []))
+
+    def shift_week(self, weeks: int) -> None:
+        self.week_start += timedelta(weeks=weeks)
+        self.refresh()
+
+    def show_today(self) -> None:
+        self.week_start = self._monday(date.today())
+        self.refresh()
+
+    def refresh(self) -> None:
+        start = datetime.combine(self.week_start, time())
+        end = start + timedelta(days=7)
+        self.week_label.setText(f"{start:%d %b} - {end - timedelta(days=1):%d %b %Y}")
+        self.event_list.clear()
+        current_day = None
+        for occurrence in self.engine.between(start, end):
+            day = max(occurrence.start, start).date()
+            if day != current_day:
+                current_day = day
+                header = QListWidgetItem(f"{day:%A %d %B}")
+                header.setFlags(Qt.NoItemFlags)
+                self.event_list.addItem(header)
+            self.event_list.addItem(QListWidgetItem(format_occurrence(occurrence)))
+
+        upcoming = self.engine.next_event()
+        if upcoming is None:
+            self.next_label.setText("No upcoming events")
+        else:
+            self.next_label.setText(f"Next: {upcoming.summary} - {upcoming.start:%a %d %b %H:%M}")
+        if not self._files():
+            self.status_label.setText("No calendars added")
+        elif self.engine.errors:
+            self.status_label.setText(f"Could not read {len(self.engine.errors)} file(s)")
+            self.status_label.setToolTip("\n".join(self.engine.errors))
+        else:
+            self.status_label.setText(f"{self.engine.event_count} events")
+            self.status_label.setToolTip("")
+
+    def add_calendar(self) -> None:
+        path, _filter = QFileDialog.getOpenFileName(self, "Add calendar", os.path.expanduser("~"),
+                                                    "Calendars (*.ics)")
+        if not path:
+            return
+        files = self._files()
+        if path not in files:
+            files.append(path)
+            self.state_manager.settings_manager.update_setting("calendar_files", files)
+        self.engine.load(files)
+
+    def showEvent(self, event) -> None:
+        self.engine.load(self._files())
+        self.refresh()
+        super().showEvent(event)
+
+
+def create_tool(state_manager, parent=None) -> CalendarWidget:
+    engine = CalendarEngine(os.path.join(state_manager.settings_manager.data_dir, "calendar_cache"))
+    return CalendarWidget(state_manager, engine, parent)
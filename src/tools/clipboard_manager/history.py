@@ -0,0 +1,88 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+
+class ClipboardEntry:
+    """One clipboard item. Payload is the text (UTF-8) or the compressed image bytes."""
+    __slots__ = ("digest", "kind", "payload", "preview", "size", "created", "last_used")
+
+    def __init__(self, digest: str, kind: str, payload: bytes, preview: str) -> None:
+        self.digest = digest
+        self.kind = kind
+        self.payload = payload
+        self.preview = preview
+        self.size = len(payload)
+        self.created = self.last_used = time.time()
+
+    def text(self) -> str:
+        return self.payload.decode("utf-8") if self.kind == "text" else ""
+
+
+def content_digest(kind: str, payload: bytes) -> str:
+    return hashlib.sha1(kind.encode("ascii") + b"\0" + payload).hexdigest()
+
+
+class ClipboardHistory:
+    """
+    In-memory clipboard history, bounded by entry count and by a byte budget.
+
+    Entries are kept oldest first in an OrderedDict keyed by content hash, so copying
+    something that is already in the history moves it to the newest end (O(1)) instead
+    of storing the payload again. Only a genuinely new entry can push out old ones:
+    when there are more than capacity entries, or the payloads exceed max_bytes, the
+    oldest entries are dropped. Thread-safe, since entries are added from the clipboard
+    worker thread.
+    """
+
+    def __init__(self, capacity: int = 200, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[str, ClipboardEntry]" = OrderedDict()  # oldest first
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, kind: str, payload: bytes, preview: str, digest: Optional[str] = None) -> ClipboardEntry:
+        """Adds (or, for a duplicate, bumps) an entry and returns it."""
+        digest = digest or content_digest(kind, payload)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                entry.last_used = time.time()
+                self._entries.move_to_end(digest)
+                return entry
+
+            entry = ClipboardEntry(digest, kind, payload, preview)
+            self._entries[digest] = entry
+            self.total_bytes += entry.size
+            # Drop the oldest entries, but never the entry just added
+            while len(self._entries) > 1 and (len(self._entries) > self.capacity
+                                              or self.total_bytes > self.max_bytes):
+                _digest, oldest = self._entries.popitem(last=False)
+                self.total_bytes -= oldest.size
+            return entry
+
+    def get(self, digest: str) -> Optional[ClipboardEntry]:
+        with self._lock:
+            return self._entries.get(digest)
+
+    def remove(self, digest: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(digest, None)
+            if entry is not None:
+                self.total_bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def entries(self) -> List[ClipboardEntry]:
+        """Returns the entries newest first."""
+        with self._lock:
+            return list(reversed(self._entries.values()))
@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QObject, Signal
+from PySide6.QtGui import QGuiApplication, QImage
+
+from src.tools.clipboard_manager.history import ClipboardEntry, ClipboardHistory, content_digest
+from src.tools.clipboard_manager.store import ClipboardStore
+
+
+class ClipboardMonitor(QObject):
+    """
+    Records clipboard changes into a ClipboardHistory and a ClipboardStore.
+
+    The GUI thread only grabs the clipboard contents (a QImage is implicitly shared, so
+    this does not copy pixels); hashing, PNG compression of images and the store insert
+    happen on a worker thread. entryAdded is emitted from the worker and delivered to
+    GUI-thread receivers through a queued connection.
+    """
+    entryAdded = Signal(object)
+
+    def __init__(self, history: ClipboardHistory, store: ClipboardStore, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.history = history
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ClipboardWorker")
+        self.clipboard = QGuiApplication.clipboard()
+        self.clipboard.dataChanged.connect(self._on_clipboard_changed)
+
+    def _on_clipboard_changed(self) -> None:
+        mime = self.clipboard.mimeData()
+        if mime is None:
+            return
+        if mime.hasImage():
+            image = self.clipboard.image()
+            if not image.isNull():
+                self._executor.submit(self._record_image, image)
+        elif mime.hasText():
+            text = mime.text()
+            if text.strip():
+                self._executor.submit(self._record_text, text)
+
+    def _record_text(self, text: str) -> None:
+        payload = text.encode("utf-8")
+        preview = " ".join(text.split())[:200]
+        self._record("text", payload, preview)
+
+    def _record_image(self, image: QImage) -> None:
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.WriteOnly)
+        image.save(buffer, "PNG")
+        buffer.close()
+        self._record("image", bytes(data), f"Image {image.width()} x {image.height()}")
+
+    def _record(self, kind: str, payload: bytes, preview: str) -> None:
+        entry = self.history.add(kind, payload, preview, digest=content_digest(kind, payload))
+        self.store.put(entry)
+        self.entryAdded.emit(entry)
+
+    def copy_to_clipboard(self, entry: ClipboardEntry) -> None:
+        """Puts an entry back on the clipboard (deduplication bumps it to the top instead of copying it)."""
+        if entry.kind == "text":
+            self.clipboard.setText(entry.text())
+        else:
+            self.clipboard.setImage(QImage.fromData(entry.payload, "PNG"))
+
+    def shutdown(self) -> None:
+        self.clipboard.dataChanged.disconnect(self._on_clipboard_changed)
+        self._executor.shutdown(wait=True)
+        self.store.close()
+
+
+_monitor: Optional[ClipboardMonitor] = None
+
+
+def start_service(state_manager) -> ClipboardMonitor:
+    """Starts recording the clipboard (called at startup when the tool is enabled)."""
+    global _monitor
+    if _monitor is None:
+        app_config = state_manager.app_config
+        data_dir = state_manager.settings_manager.data_dir
+        history = ClipboardHistory(capacity=app_config.get("clipboard_history_size", 200),
+                                   max_bytes=app_config.get("clipboard_history_budget_mb", 32) * 1024 * 1024)
+        store = ClipboardStore(os.path.join(data_dir, "clipboard_history.sqlite3"),
+                               max_rows=app_config.get("clipboard_store_max_entries", 50000))
+        _monitor = ClipboardMonitor(history, store)
+        QGuiApplication.instance().aboutToQuit.connect(_monitor.shutdown)
+    return _monitor
@@ -0,0 +1,188 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+
+class ClipboardStore:
+    """
+    Persistent clipboard history in SQLite with a full-text index.
+
+    All writes go through a queue to a single writer thread, so callers never wait on
+    disk I/O. Searches run on the caller's own read connection (WAL mode lets them run
+    alongside the writer) against an FTS5 index, falling back to LIKE when the SQLite
+    build has no FTS5. Rows beyond max_rows are pruned, oldest first.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            id INTEGER PRIMARY KEY,
+            digest TEXT NOT NULL UNIQUE,
+            kind TEXT NOT NULL,
+            text TEXT NOT NULL DEFAULT '',
+            payload BLOB,
+            size INTEGER NOT NULL,
+            created REAL NOT NULL,
+            last_used REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS entries_last_used ON entries(last_used);
+    """
+
+    FTS_SCHEMA = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(text, content='entries', content_rowid='id');
+        CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+            INSERT INTO entries_fts(rowid, text) VALUES (new.id, new.text);
+        END;
+        CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+            INSERT INTO entries_fts(entries_fts, rowid, text) VALUES ('delete', old.id, old.text);
+        END;
+    """
+
+    def __init__(self, db_path: str, max_rows: int = 50000) -> None:
+        self.db_path = db_path
+        self.max_rows = max_rows
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        connection = self._connect()
+        connection.executescript(self.SCHEMA)
+        try:
+            connection.executescript(self.FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False
+        connection.commit()
+        connection.close()
+
+        self._read_connections = threading.local()
+        self._queue: "queue.Queue[Optional[Tuple]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="ClipboardStoreWriter", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    # ------------------------------------------------------------------
+    # Writes (queued to the writer thread)
+    # ------------------------------------------------------------------
+    def put(self, entry) -> None:
+        """Queues an insert, or a last_used bump if the content is already stored."""
+        searchable_text = entry.text() if entry.kind == "text" else entry.preview
+        self._queue.put(("put", entry.digest, entry.kind, searchable_text,
+                         entry.payload if entry.kind != "text" else None,
+                         entry.size, entry.created, entry.last_used))
+
+    def delete(self, digest: str) -> None:
+        self._queue.put(("delete", digest))
+
+    def clear(self) -> None:
+        self._queue.put(("clear",))
+
+    def close(self) -> None:
+        """Writes everything still queued and stops the writer thread."""
+        self._queue.put(None)
+        self._writer.join()
+
+    def _writer_loop(self) -> None:
+        connection = self._connect()
+        inserts_since_prune = 0
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            jobs = [job]
+            # Batch whatever else is already waiting into the same transaction
+            while len(jobs) < 256:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._queue.put(None)
+                    break
+                jobs.append(job)
+            try:
+                with connection:
+                    for job in jobs:
+                        inserts_since_prune += self._apply(connection, job)
+                    if inserts_since_prune >= 500:
+                        self._prune(connection)
+                        inserts_since_prune = 0
+            except sqlite3.Error as e:
+                print("Clipboard store write failed:", e)
+        connection.close()
+
+    def _apply(self, connection: sqlite3.Connection, job: Tuple) -> int:
+        action = job[0]
+        if action == "put":
+            _, digest, kind, text, payload, size, created, last_used = job
+            connection.execute(
+                "INSERT INTO entries (digest, kind, text, payload, size, created, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(digest) DO UPDATE SET last_used = excluded.last_used",
+                (digest, kind, text, payload, size, created, last_used))
+            return 1
+        if action == "delete":
+            connection.execute("DELETE FROM entries WHERE digest = ?", (job[1],))
+        elif action == "clear":
+            connection.execute("DELETE FROM entries")
+        return 0
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "DELETE FROM entries WHERE id IN ("
+            " SELECT id FROM entries ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.max_rows,))
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def _reader(self) -> sqlite3.Connection:
+        connection = getattr(self._read_connections, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path)
+            self._read_connections.connection = connection
+        return connection
+
+    def recent(self, limit: int = 200) -> List[Tuple[str, str, str, float]]:
+        """Returns (digest, kind, text, last_used) rows, most recently used first."""
+        return self._reader().execute(
+            "SELECT digest, kind, text, last_used FROM entries ORDER BY last_used DESC LIMIT ?",
+            (limit,)).fetchall()
+
+    def search(self, query: str, limit: int = 100) -> List[Tuple[str, str, str, float]]:
+        """Full-text prefix search; every word in the query must match."""
+        words = query.split()
+        if not words:
+            return self.recent(limit)
+        connection = self._reader()
+        if self.has_fts:
+            match = " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+            return connection.execute(
+                "SELECT e.digest, e.kind, e.text, e.last_used FROM entries_fts"
+                " JOIN entries e ON e.id = entries_fts.rowid"
+                " WHERE entries_fts MATCH ? ORDER BY e.last_used DESC LIMIT ?",
+                (match, limit)).fetchall()
+        where = " AND ".join("text LIKE ?" for _ in words)
+        return connection.execute(
+            f"SELECT digest, kind, text, last_used FROM entries WHERE {where}"
+            " ORDER BY last_used DESC LIMIT ?",
+            [f"%{word}%" for word in words] + [limit]).fetchall()
+
+    def payload(self, digest: str) -> Optional[Tuple[str, bytes]]:
+        """Returns (kind, payload) for an entry; text entries return their UTF-8 text."""
+        row = self._reader().execute(
+            "SELECT kind, text, payload FROM entries WHERE digest = ?", (digest,)).fetchone()
+        if row is None:
+            return None
+        kind, text, payload = row
+        return kind, (text.encode("utf-8") if kind == "text" else payload)
+
+    def wait_idle(self, timeout: float = 5.0) -> None:
+        """Blocks until the write queue is drained (used on shutdown and in benchmarks)."""
+        deadline = time.monotonic() + timeout
+        while not self._queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
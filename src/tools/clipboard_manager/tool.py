@@ -0,0 +1,83 @@
+from typing import Optional
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout, QWidget
+
+from src.tools.clipboard_manager.history import ClipboardEntry
+from src.tools.clipboard_manager.monitor import ClipboardMonitor, start_service
+from src.ui.text_fitter import TextFitter
+
+
+class ClipboardManagerWidget(QWidget):
+    """Searchable clipboard history; double-click (or Enter) puts an entry back on the clipboard."""
+
+    def __init__(self, state_manager, monitor: ClipboardMonitor, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.monitor = monitor
+        self.setWindowTitle("Clipboard Manager")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.resize(360, 480)
+
+        self.search_box = QLineEdit(self)
+        self.search_box.setPlaceholderText("Search clipboard history...")
+        self.list_widget = QListWidget(self)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.search_box)
+        layout.addWidget(self.list_widget)
+
+        # Re-query once typing pauses instead of on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(80)
+        self._search_timer.timeout.connect(self.refresh)
+        self.search_box.textChanged.connect(self._search_timer.start)
+        self.list_widget.itemActivated.connect(self._on_item_activated)
+        self.monitor.entryAdded.connect(self._on_entry_added)
+
+        self.state_manager.theme_manager.register(self)
+        self.refresh()
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def _add_item(self, digest: str, kind: str, preview: str, at_top: bool = False) -> None:
+        width = max(80, self.list_widget.viewport().width() - 16)
+        text = TextFitter.shared().elide(preview, self.list_widget.font(), width)
+        item = QListWidgetItem(text)
+        item.setData(Qt.UserRole, digest)
+        item.setToolTip(preview[:500])
+        if at_top:
+            self.list_widget.insertItem(0, item)
+        else:
+            self.list_widget.addItem(item)
+
+    def refresh(self) -> None:
+        self.list_widget.clear()
+        for digest, kind, text, _last_used in self.monitor.store.search(self.search_box.text()):
+            preview = " ".join(text.split()) if kind == "text" else text or "Image"
+            self._add_item(digest, kind, preview)
+
+    def _on_entry_added(self, entry: ClipboardEntry) -> None:
+        if self.search_box.text():
+            return
+        for row in range(self.list_widget.count()):
+            if self.list_widget.item(row).data(Qt.UserRole) == entry.digest:
+                self.list_widget.takeItem(row)
+                break
+        self._add_item(entry.digest, entry.kind, entry.preview, at_top=True)
+
+    def _on_item_activated(self, item: QListWidgetItem) -> None:
+        digest = item.data(Qt.UserRole)
+        entry = self.monitor.history.get(digest)
+        if entry is None:
+            stored = self.monitor.store.payload(digest)
+            if stored is None:
+                return
+            kind, payload = stored
+            entry = ClipboardEntry(digest, kind, payload, item.text())
+        self.monitor.copy_to_clipboard(entry)
+
+
+def create_tool(state_manager, parent=None) -> ClipboardManagerWidget:
+    return ClipboardManagerWidget(state_manager, start_service(state_manager), parent)
@@ -0,0 +1,84 @@
+import os
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QLineEdit, QListWidget, QVBoxLayout, QWidget
+
+from src.core.currency_rates import CurrencyRates
+from src.core.expression_engine import ExpressionEngine, IncrementalEvaluator
+
+
+class CurrencyConverterWidget(QWidget):
+    """Converts an amount (which may be an expression) into every known currency, from offline rates."""
+
+    def __init__(self, state_manager, engine: ExpressionEngine, rates: CurrencyRates,
+                 parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.evaluator = IncrementalEvaluator(engine)
+        self.rates = rates
+        self.setWindowTitle("Currency")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.resize(300, 420)
+
+        self.input = QLineEdit("1", self)
+        self.currency_box = QComboBox(self)
+        self.error_label = QLabel("", self)
+        self.result_list = QListWidget(self)
+        self.rates_label = QLabel("", self)
+        row = QHBoxLayout()
+        row.addWidget(self.input, 1)
+        row.addWidget(self.currency_box)
+        layout = QVBoxLayout(self)
+        layout.addLayout(row)
+        layout.addWidget(self.error_label)
+        layout.addWidget(self.result_list)
+        layout.addWidget(self.rates_label)
+
+        self.input.textChanged.connect(self.refresh)
+        self.currency_box.currentIndexChanged.connect(self.refresh)
+        self.rates.updated.connect(self._fill_currencies)
+
+        self._fill_currencies()
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def _fill_currencies(self) -> None:
+        current = self.currency_box.currentData() or self.rates.base
+        self.currency_box.blockSignals(True)
+        self.currency_box.clear()
+        for code in self.rates.currencies:
+            self.currency_box.addItem(code, code)
+        self.currency_box.setCurrentIndex(max(0, self.currency_box.findData(current)))
+        self.currency_box.blockSignals(False)
+        self.rates_label.setText(f"Rates as of {self.rates.date or 'unknown'}")
+        self.refresh()
+
+    def refresh(self, *_args) -> None:
+        value = self.evaluator.update(self.input.text())
+        self.error_label.setText(self.evaluator.error or self.rates.error)
+        self.result_list.clear()
+        code = self.currency_box.currentData()
+        if value is None or code is None:
+            return
+        self.result_list.addItems([f"{converted:,.2f} {target}"
+                                   for target, converted in self.rates.convert_all(value, code)
+                                   if target != code])
+
+    def showEvent(self, event) -> None:
+        self.rates.refresh()
+        super().showEvent(event)
+
+
+def create_tool(state_manager, parent=None) -> CurrencyConverterWidget:
+    settings_manager = state_manager.settings_manager
+    app_config = settings_manager.app_config
+    rates = CurrencyRates(
+        os.path.join(settings_manager.data_dir, "currency_rates.json"),
+        app_config.get("config_paths", {}).get("currency_rates", "src/config/currency_rates.json"),
+        url=app_config.get("currency_rates_url", ""),
+        max_age=app_config.get("currency_rates_max_age_h", 24) * 3600,
+    )
+    return CurrencyConverterWidget(state_manager, ExpressionEngine.shared(), rates, parent)
@@ -0,0 +1,481 @@
+import heapq
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# id -> path (None once removed), id -> lowercase basename, id -> is_dir, path -> id, trigram -> ids
+Tables = Tuple[List[Optional[str]], List[str], bytearray, Dict[str, int], Dict[str, Set[int]]]
+
+INDEX_VERSION = 1
+# Two leading pad characters turn the first trigrams of a name into 1- and 2-letter prefixes
+PAD = "\0\0"
+
+
+def trigrams(name: str) -> Set[str]:
+    """Returns the trigrams of a lowercase name, including the padded prefix grams."""
+    padded = PAD + name
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def query_grams(query: str) -> Set[str]:
+    """Grams to look up for a query: padded prefix grams for short queries, plain trigrams otherwise."""
+    if len(query) < 3:
+        return {(PAD + query)[-3:]}
+    return {query[i:i + 3] for i in range(len(query) - 2)}
+
+
+def is_subsequence(query: str, text: str) -> bool:
+    position = 0
+    for char in query:
+        position = text.find(char, position) + 1
+        if not position:
+            return False
+    return True
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp.", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class FileIndex:
+    """
+    Searchable index of the files and folders below a set of root directories.
+
+    A worker thread loads the index saved by the previous run (or crawls the roots the
+    first time), then keeps it current: every refresh_interval seconds, or when refresh()
+    is called, it stat()s each indexed directory and re-lists only those whose mtime
+    changed, since a directory's mtime moves exactly when entries are added, removed or
+    renamed in it. New subdirectories are crawled, removed ones are dropped with their
+    subtree. There is never a full rescan.
+
+    Names are indexed by trigram (with two padding characters in front, so one- and
+    two-letter queries are prefix lookups). A query intersects the posting sets of its
+    trigrams, smallest first, and falls back to a subsequence match over the entries
+    sharing the most trigrams when too few names contain the query verbatim. Results are
+    ranked by match quality plus how often and how recently each path was opened
+    (record_open()); only a shortlist of at most a few times limit entries is scored. The
+    index and the usage stats are saved to directory on changes.
+
+    Only the worker thread changes the tables, so it reads them without the lock; it
+    takes the lock to change them, in small sections or by building whole new tables
+    (on load and compaction) and swapping them in.
+    """
+
+    def __init__(self, directory: str, roots: Sequence[str], exclude: Iterable[str] = (),
+                 include_hidden: bool = False, max_entries: int = 500000, refresh_interval: float = 60.0) -> None:
+        self.directory = directory
+        self.index_file = os.path.join(directory, "index.json")
+        self.usage_file = os.path.join(directory, "usage.json")
+        os.makedirs(directory, exist_ok=True)
+        self.roots = [os.path.abspath(os.path.expanduser(root)) for root in roots]
+        self.exclude = set(exclude)
+        self.include_hidden = include_hidden
+        self.max_entries = max_entries
+        self.refresh_interval = refresh_interval
+
+        self._paths: List[Optional[str]] = []  # id -> path, None once removed
+        self._names: List[str] = []  # id -> lowercase basename
+        self._is_dir = bytearray()
+        self._ids: Dict[str, int] = {}
+        self._grams: Dict[str, Set[int]] = {}
+        self._dirs: Dict[str, int] = {}  # indexed directory -> mtime_ns when it was listed
+        self._children: Dict[str, Set[str]] = {}  # indexed directory -> child names
+        self._free = 0  # removed ids not yet compacted away
+        self.usage: Dict[str, List[float]] = {}  # path -> [open count, last opened]
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._dirty = False
+        self._usage_dirty = False
+        self.ready = threading.Event()
+        self.crawl_seconds = 0.0
+        self.last_refresh_changes = 0
+        self._worker = threading.Thread(target=self._run, name="FileIndexer", daemon=True)
+        self._worker.start()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+    def _add(self, path: str, is_dir: bool) -> None:
+        if path in self._ids or len(self._ids) >= self.max_entries:
+            return
+        self._insert((self._paths, self._names, self._is_dir, self._ids, self._grams), path, is_dir)
+
+    @staticmethod
+    def _insert(tables: Tables, path: str, is_dir: bool) -> None:
+        paths, names, dir_flags, ids, grams = tables
+        entry_id = len(paths)
+        name = os.path.basename(path).lower()
+        paths.append(path)
+        names.append(name)
+        dir_flags.append(1 if is_dir else 0)
+        ids[path] = entry_id
+        for gram in trigrams(name):
+            postings = grams.get(gram)
+            if postings is None:
+                grams[gram] = postings = set()
+            postings.add(entry_id)
+
+    def _build(self, entries: Iterable[Tuple[str, int]]) -> Tables:
+        """New tables holding entries, built without the lock; _swap() puts them in place."""
+        tables: Tables = ([], [], bytearray(), {}, {})
+        ids = tables[3]
+        for path, is_dir in entries:
+            if path not in ids and len(ids) < self.max_entries:
+                self._insert(tables, path, bool(is_dir))
+        return tables
+
+    def _swap(self, tables: Tables) -> None:
+        with self._lock:
+            self._paths, self._names, self._is_dir, self._ids, self._grams = tables
+            self._free = 0
+
+    def _remove(self, path: str) -> None:
+        entry_id = self._ids.pop(path, None)
+        if entry_id is None:
+            return
+        for gram in trigrams(self._names[entry_id]):
+            postings = self._grams.get(gram)
+            if postings is not None:
+                postings.discard(entry_id)
+                if not postings:
+                    del self._grams[gram]
+        self._paths[entry_id] = None
+        self._free += 1
+        if self._is_dir[entry_id]:
+            for name in self._children.pop(path, ()):
+                self._remove(os.path.join(path, name))
+            self._dirs.pop(path, None)
+
+    def _compact(self) -> None:
+        """Renumbers the entries once removed ids make up a quarter of the tables."""
+        self._swap(self._build(self._entries()))
+
+    def _entries(self) -> List[Tuple[str, int]]:
+        return [(path, self._is_dir[i]) for i, path in enumerate(self._paths) if path is not None]
+
+    # ------------------------------------------------------------------
+    # Crawling
+    # ------------------------------------------------------------------
+    def _skip(self, name: str) -> bool:
+        return name in self.exclude or (not self.include_hidden and name.startswith("."))
+
+    def _list(self, directory: str) -> Optional[Tuple[int, List[Tuple[str, bool]]]]:
+        """Returns (mtime_ns, [(name, is_dir)]) for a directory, or None if it cannot be read."""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+            entries = []
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if self._skip(entry.name):
+                        continue
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append((entry.name, is_dir))
+            return mtime, entries
+        except OSError:
+            return None
+
+    def _crawl(self, top: str) -> int:
+        """Indexes top and everything below it; returns the number of entries added."""
+        added = 0
+        stack = [top]
+        while stack and not self._closed:
+            directory = stack.pop()
+            listing = self._list(directory)
+            if listing is None:
+                continue
+            mtime, entries = listing
+            # Small locked sections, so queries on the GUI thread never wait for a whole crawl
+            with self._lock:
+                self._dirs[directory] = mtime
+                self._children[directory] = {name for name, _is_dir in entries}
+                for name, is_dir in entries:
+                    path = os.path.join(directory, name)
+                    if path not in self._ids:
+                        self._add(path, is_dir)
+                        added += 1
+                    if is_dir:
+                        stack.append(path)
+        return added
+
+    def _refresh_changed(self) -> int:
+        """Re-lists the directories whose mtime moved; returns the number of entries added or removed."""
+        changes = 0
+        for directory in list(self._dirs):
+            if self._closed:
+                break
+            known = self._dirs.get(directory)
+            if known is None:
+                continue  # removed meanwhile, together with its parent
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtime = None
+            if mtime == known:
+                continue
+            listing = self._list(directory) if mtime is not None else None
+            current = dict(listing[1]) if listing is not None else {}
+            new_dirs = []
+            with self._lock:
+                previous = self._children.get(directory, set())
+                for name in previous - current.keys():
+                    self._remove(os.path.join(directory, name))
+                    changes += 1
+                for name in current.keys() - previous:
+                    path = os.path.join(directory, name)
+                    self._add(path, current[name])
+                    changes += 1
+                    if current[name]:
+                        new_dirs.append(path)
+                if listing is None:
+                    self._dirs.pop(directory, None)
+                    self._children.pop(directory, None)
+                else:
+                    self._dirs[directory] = listing[0]
+                    self._children[directory] = set(current)
+            for path in new_dirs:
+                changes += self._crawl(path)
+        for root in self.roots:
+            if root not in self._dirs and os.path.isdir(root):
+                changes += self._crawl(root)
+        return changes
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _load(self) -> bool:
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != INDEX_VERSION or data.get("roots") != self.roots:
+            return False
+        # Searches keep running on the (empty) old tables until the new ones are complete
+        tables = self._build(data["entries"])
+        children: Dict[str, Set[str]] = {}
+        for path, _is_dir in data["entries"]:
+            children.setdefault(os.path.dirname(path), set()).add(os.path.basename(path))
+        self._dirs = {path: mtime for path, mtime in data["dirs"].items()}
+        for directory in self._dirs:
+            children.setdefault(directory, set())
+        self._children = children
+        self._swap(tables)
+        return True
+
+    def _load_usage(self) -> None:
+        try:
+            with open(self.usage_file, "r", encoding="utf-8") as f:
+                self.usage = json.load(f)
+        except (OSError, ValueError):
+            self.usage = {}
+
+    def _save(self) -> None:
+        # Runs on the worker, the only thread that changes the tables: no lock needed to read them
+        if self._free > len(self._paths) // 4:
+            self._compact()
+        data = {"version": INDEX_VERSION, "roots": self.roots, "dirs": self._dirs, "entries": self._entries()}
+        self._dirty = False
+        write_atomic(self.index_file, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    def _save_usage(self) -> None:
+        with self._lock:
+            data = json.dumps(self.usage).encode("utf-8")
+            self._usage_dirty = False
+        write_atomic(self.usage_file, data)
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        started = time.perf_counter()
+        self._load_usage()
+        if self._load():
+            self.ready.set()
+            self._dirty = self._refresh_changed() > 0
+        else:
+            for root in self.roots:
+                if os.path.isdir(root):
+                    self._crawl(root)
+            self._dirty = True
+            self.ready.set()
+        self.crawl_seconds = time.perf_counter() - started
+        while not self._closed:
+            if self._dirty:
+                self._save()
+            if self._usage_dirty:
+                self._save_usage()
+            self._wake.wait(self.refresh_interval)
+            self._wake.clear()
+            if self._closed:
+                break
+            self.last_refresh_changes = self._refresh_changed()
+            if self.last_refresh_changes:
+                self._dirty = True
+        if self._usage_dirty:
+            self._save_usage()
+
+    def refresh(self) -> None:
+        """Asks the worker to pick up changes now instead of at the next interval."""
+        self._wake.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._wake.set()
+        self._worker.join(timeout=5.0)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def record_open(self, path: str) -> None:
+        """Counts an open of path; frequently and recently opened paths rank higher."""
+        with self._lock:
+            entry = self.usage.setdefault(path, [0, 0.0])
+            entry[0] += 1
+            entry[1] = time.time()
+            self._usage_dirty = True
+
+    def search(self, query: str, kind: str = "", limit: int = 50) -> List[str]:
+        """
+        Returns up to limit paths whose name matches query, best first. kind is "file",
+        "dir" or "" for both. An empty query lists the most used paths.
+        """
+        query = query.strip().lower()
+        want_dir = {"file": 0, "dir": 1}.get(kind)
+        now = time.time()
+        with self._lock:
+            used = {self._ids[path] for path in self.usage if path in self._ids}
+            if not query:
+                return self._rank(used, "", want_dir, now, limit)
+            grams = sorted((self._grams.get(gram, set()) for gram in query_grams(query)), key=len)
+            if not grams[0]:
+                matches: Set[int] = set()
+            elif len(query) <= 3:
+                # The only gram is the query itself (or its padded prefix): every posting matches
+                matches = grams[0]
+            else:
+                names = self._names
+                # Trigram hits can straddle; keep the names that really contain the query
+                matches = {i for i in grams[0].intersection(*grams[1:]) if query in names[i]}
+            shortlist = self._shortlist(matches, query, used, want_dir, limit)
+            if len(matches) < limit and len(query) >= 3:
+                fuzzy = self._fuzzy_candidates(query, grams) - matches
+                shortlist |= self._shortlist(fuzzy, "", used, want_dir, limit)
+            return self._rank(shortlist, query, want_dir, now, limit)
+
+    def _shortlist(self, ids: Set[int], query: str, used: Set[int], want_dir: Optional[int],
+                   limit: int) -> Set[int]:
+        """
+        The entries of ids that can make the top limit, so the scoring in _rank only runs on
+        those. Without usage an entry scores its match tier minus a small length penalty,
+        so per tier only the limit shortest paths can make it, and once the prefix matches
+        fill the list no plain substring match can. Entries with usage are always kept,
+        since their bonus may lift them past any tier.
+        """
+        paths, names = self._paths, self._names
+        if want_dir is not None:
+            is_dir = self._is_dir
+            ids = [i for i in ids if is_dir[i] == want_dir]
+        shortlist = used.intersection(ids)
+        tiers = [ids]
+        if query:
+            prefixed = [i for i in ids if names[i].startswith(query)]
+            tiers = [[i for i in prefixed if names[i] == query], prefixed]
+            if len(prefixed) < limit:
+                tiers.append(ids)  # the prefix matches among them are already in
+        for tier in tiers:
+            if len(tier) <= limit:
+                shortlist.update(tier)
+                continue
+            # The limit shortest paths, and any as long as the last of them (_rank breaks the tie)
+            cutoff = sorted(map(len, map(paths.__getitem__, tier)))[limit - 1]
+            shortlist.update(i for i in tier if len(paths[i]) <= cutoff)
+        return shortlist
+
+    def _fuzzy_candidates(self, query: str, grams: List[Set[int]], cap: int = 20000) -> Set[int]:
+        """Entries sharing all but one of the query's trigrams whose name contains the query as a subsequence."""
+        counts: Dict[int, int] = {}
+        for postings in grams:
+            if len(postings) > cap:
+                continue  # too common to narrow anything down
+            for entry_id in postings:
+                counts[entry_id] = counts.get(entry_id, 0) + 1
+        needed = max(1, len(grams) - 1)
+        names = self._names
+        return {i for i, count in counts.items() if count >= needed and is_subsequence(query, names[i])}
+
+    def _rank(self, candidates: Iterable[int], query: str, want_dir: Optional[int], now: float,
+              limit: int) -> List[str]:
+        scored = []
+        for entry_id in candidates:
+            if want_dir is not None and self._is_dir[entry_id] != want_dir:
+                continue
+            path = self._paths[entry_id]
+            if path is None:
+                continue
+            name = self._names[entry_id]
+            if not query:
+                score = 0.0
+            elif name == query:
+                score = 100.0
+            elif name.startswith(query):
+                score = 60.0
+            elif query in name:
+                score = 40.0
+            else:
+                score = 20.0
+            usage = self.usage.get(path)
+            if usage:
+                # Frequency counts logarithmically, recency decays with a one-week time constant
+                score += 10.0 * math.log2(1 + usage[0]) + 30.0 * math.exp(-(now - usage[1]) / 604800.0)
+            # Among equals, prefer shallower and shorter paths
+            score -= 0.01 * len(path)
+            scored.append((score, path))
+        return [path for _score, path in heapq.nlargest(limit, scored)]
+
+
+_index: Optional[FileIndex] = None
+
+
+def get_index(state_manager) -> FileIndex:
+    """Returns the index shared by the file and folder shortcut tools, starting it on first use."""
+    global _index
+    if _index is None:
+        from PySide6.QtGui import QGuiApplication
+
+        settings_manager = state_manager.settings_manager
+        app_config = state_manager.app_config
+        _index = FileIndex(
+            os.path.join(settings_manager.data_dir, "file_index"),
+            roots=settings_manager.get_setting("file_index_roots", ["~"]),
+            exclude=app_config.get("file_index_exclude", []),
+            include_hidden=app_config.get("file_index_include_hidden", False),
+            max_entries=app_config.get("file_index_max_entries", 500000),
+            refresh_interval=app_config.get("file_index_refresh_s", 60),
+        )
+        QGuiApplication.instance().aboutToQuit.connect(_index.close)
+    return _index
+
+
+def start_service(state_manager) -> FileIndex:
+    """Starts indexing at startup, so the first search does not wait for the crawl."""
+    return get_index(state_manager)
@@ -0,0 +1,121 @@
+import os
+import threading
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer, QUrl, Signal
+from PySide6.QtGui import QDesktopServices
+from PySide6.QtWidgets import QLabel, QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout, QWidget
+
+from src.tools.file_shortcuts.file_index import FileIndex, get_index
+
+
+class SearchWorker(QObject):
+    """
+    Runs index searches on a thread of its own, so the GUI thread never waits for the
+    index lock or a large result set. Only the newest query runs: one submitted while a
+    search is running replaces any query still waiting. "finished" carries the
+    generation submit() returned, so results of superseded queries can be dropped.
+    """
+    finished = Signal(int, object)  # generation, list of paths
+
+    def __init__(self, index: FileIndex, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.index = index
+        self._condition = threading.Condition()
+        self._pending = None
+        self._generation = 0
+        self._thread = threading.Thread(target=self._run, name="FileSearch", daemon=True)
+        self._thread.start()
+
+    def submit(self, query: str, kind: str, limit: int) -> int:
+        with self._condition:
+            self._generation += 1
+            self._pending = (self._generation, query, kind, limit)
+            self._condition.notify()
+            return self._generation
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                generation, query, kind, limit = self._pending
+                self._pending = None
+            self.finished.emit(generation, self.index.search(query, kind=kind, limit=limit))
+
+
+class FileShortcutsWidget(QWidget):
+    """Search box over the background file index; Enter or double-click opens the selected entry."""
+
+    def __init__(self, state_manager, index: FileIndex, kind: str = "file", title: str = "Files",
+                 parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.index = index
+        self.kind = kind
+        self.setWindowTitle(title)
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.resize(520, 420)
+
+        self.search_box = QLineEdit(self)
+        self.search_box.setPlaceholderText(f"Search {title.lower()}...")
+        self.result_list = QListWidget(self)
+        self.result_list.setTextElideMode(Qt.ElideMiddle)
+        self.status_label = QLabel("", self)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.search_box)
+        layout.addWidget(self.result_list)
+        layout.addWidget(self.status_label)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(80)
+        self._search_timer.timeout.connect(self.refresh_results)
+        self._search_generation = 0
+        self.searcher = SearchWorker(index, self)
+        self.searcher.finished.connect(self._show_results)
+        self.search_box.textChanged.connect(self._search_timer.start)
+        self.search_box.returnPressed.connect(self.open_selected)
+        self.result_list.itemActivated.connect(self.open_selected)
+
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def refresh_results(self) -> None:
+        self._search_generation = self.searcher.submit(self.search_box.text(), self.kind, 100)
+
+    def _show_results(self, generation: int, paths: List[str]) -> None:
+        if generation != self._search_generation:
+            return  # the text changed again while this search ran
+        self.result_list.clear()
+        for path in paths:
+            item = QListWidgetItem(f"{os.path.basename(path)}    {os.path.dirname(path)}")
+            item.setData(Qt.UserRole, path)
+            item.setToolTip(path)
+            self.result_list.addItem(item)
+        if self.result_list.count():
+            self.result_list.setCurrentRow(0)
+        state = "" if self.index.ready.is_set() else "Indexing... "
+        self.status_label.setText(f"{state}{len(self.index)} entries indexed")
+
+    def open_selected(self, *_args) -> None:
+        item = self.result_list.currentItem()
+        if item is None:
+            return
+        path = item.data(Qt.UserRole)
+        self.index.record_open(path)
+        QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+        self.hide()
+
+    def showEvent(self, event) -> None:
+        # Pick up changes since the last periodic refresh
+        self.index.refresh()
+        self.refresh_results()
+        self.search_box.setFocus()
+        super().showEvent(event)
+
+
+def create_tool(state_manager, parent=None) -> FileShortcutsWidget:
+    return FileShortcutsWidget(state_manager, get_index(state_manager), kind="file", title="Files", parent=parent)
@@ -0,0 +1,7 @@
+from src.tools.file_shortcuts.file_index import get_index
+from src.tools.file_shortcuts.tool import FileShortcutsWidget
+
+
+def create_tool(state_manager, parent=None) -> FileShortcutsWidget:
+    """Folder search over the same index the file shortcuts use."""
+    return FileShortcutsWidget(state_manager, get_index(state_manager), kind="dir", title="Folders", parent=parent)
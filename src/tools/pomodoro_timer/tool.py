@@ -0,0 +1,120 @@
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QApplication, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
+
+from src.tools.quick_timer.countdown import Countdown, format_seconds
+
+
+class PomodoroTimerWidget(QWidget):
+    """
+    Work / break cycles on top of a Countdown. Every pomodoro_rounds work sessions the
+    break is a long one. Like the quick timer, the display only refreshes while visible.
+    """
+
+    def __init__(self, state_manager, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.scheduler = state_manager.scheduler
+        app_config = state_manager.app_config
+        self.work_seconds = app_config.get("pomodoro_work_minutes", 25) * 60
+        self.break_seconds = app_config.get("pomodoro_break_minutes", 5) * 60
+        self.long_break_seconds = app_config.get("pomodoro_long_break_minutes", 15) * 60
+        self.rounds = max(1, app_config.get("pomodoro_rounds", 4))
+        self.countdown = Countdown(self.scheduler, self._on_phase_finished)
+        self.completed_rounds = 0
+        self.on_break = False
+        self._display_call = None
+        self.setWindowTitle("Pomodoro")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+
+        self.phase_label = QLabel(self)
+        self.phase_label.setAlignment(Qt.AlignCenter)
+        self.time_label = QLabel(self)
+        self.time_label.setAlignment(Qt.AlignCenter)
+        font = QFont(self.time_label.font())
+        font.setPointSize(28)
+        self.time_label.setFont(font)
+        self.start_button = QPushButton("Start", self)
+        skip_button = QPushButton("Skip", self)
+        reset_button = QPushButton("Reset", self)
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.start_button)
+        buttons.addWidget(skip_button)
+        buttons.addWidget(reset_button)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.phase_label)
+        layout.addWidget(self.time_label)
+        layout.addLayout(buttons)
+
+        self.start_button.clicked.connect(self.toggle)
+        skip_button.clicked.connect(self.skip)
+        reset_button.clicked.connect(self.reset)
+
+        self.countdown.set_duration(self.work_seconds)
+        self._update_display()
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def toggle(self) -> None:
+        if self.countdown.running:
+            self.countdown.pause()
+        else:
+            self.countdown.start()
+        self._update_display()
+
+    def skip(self) -> None:
+        self._next_phase(start=self.countdown.running)
+
+    def reset(self) -> None:
+        self.completed_rounds = 0
+        self.on_break = False
+        self.countdown.set_duration(self.work_seconds)
+        self._update_display()
+
+    def _on_phase_finished(self) -> None:
+        QApplication.beep()
+        self._next_phase(start=True)
+        self.show()
+        self.raise_()
+
+    def _next_phase(self, start: bool) -> None:
+        if self.on_break:
+            self.on_break = False
+            duration = self.work_seconds
+        else:
+            self.completed_rounds += 1
+            self.on_break = True
+            long_break = self.completed_rounds % self.rounds == 0
+            duration = self.long_break_seconds if long_break else self.break_seconds
+        self.countdown.set_duration(duration)
+        if start:
+            self.countdown.start()
+        self._update_display()
+
+    def _update_display(self) -> None:
+        if self.on_break:
+            phase = "Long break" if self.completed_rounds % self.rounds == 0 else "Break"
+        else:
+            phase = f"Focus {self.completed_rounds % self.rounds + 1}/{self.rounds}"
+        self.phase_label.setText(phase)
+        self.time_label.setText(format_seconds(self.countdown.remaining()))
+        self.start_button.setText("Pause" if self.countdown.running else "Start")
+
+    def showEvent(self, event) -> None:
+        if self._display_call is None:
+            self._display_call = self.scheduler.call_every(1000, self._update_display)
+        self._update_display()
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self.scheduler.cancel(self._display_call)
+        self._display_call = None
+        super().hideEvent(event)
+
+
+def create_tool(state_manager, parent=None) -> PomodoroTimerWidget:
+    return PomodoroTimerWidget(state_manager, parent)
@@ -0,0 +1,363 @@
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import traceback
+import uuid
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> Set[str]:
+    return set(TOKEN_RE.findall(text.lower()))
+
+
+def title_from_body(body: str) -> str:
+    for line in body.splitlines():
+        line = line.strip()
+        if line:
+            return line[:80]
+    return "Untitled"
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Writes to a temp file in the same directory and renames it over path."""
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp.", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class NoteMeta:
+    __slots__ = ("id", "title", "created", "updated", "size")
+
+    def __init__(self, note_id: str, title: str, created: float, updated: float, size: int) -> None:
+        self.id = note_id
+        self.title = title
+        self.created = created
+        self.updated = updated
+        self.size = size
+
+    def to_json(self) -> Dict:
+        return {"title": self.title, "created": self.created, "updated": self.updated, "size": self.size}
+
+
+class NoteStore:
+    """
+    Quick notes on disk, saved incrementally.
+
+    Layout of the notes directory:
+      - notes.json      metadata of every note (title, timestamps, size) as of the last compaction
+      - tokens.json     the words of every note, from which the inverted search index is built
+      - bodies/<id>.txt note bodies, only read when a note is opened
+      - oplog.jsonl     append-only log of edits since the last compaction
+
+    Edits only mark a note dirty. After autosave_delay seconds without edits a writer
+    thread re-tokenizes the edited notes for the search index and appends one log line per dirty note, so typing never rewrites the whole store.
+    Once the log grows past compact_threshold bytes, the same thread folds it into the
+    body files and snapshots and truncates it. Opening the store reads only the snapshots
+    and the log, never the bodies.
+    """
+
+    def __init__(self, directory: str, autosave_delay: float = 0.5, compact_threshold: int = 256 * 1024) -> None:
+        self.directory = directory
+        self.bodies_dir = os.path.join(directory, "bodies")
+        self.meta_file = os.path.join(directory, "notes.json")
+        self.tokens_file = os.path.join(directory, "tokens.json")
+        self.log_file = os.path.join(directory, "oplog.jsonl")
+        os.makedirs(self.bodies_dir, exist_ok=True)
+        self.autosave_delay = autosave_delay
+        self.compact_threshold = compact_threshold
+
+        self.meta: Dict[str, NoteMeta] = {}
+        self._bodies: Dict[str, str] = {}  # Loaded or edited bodies
+        self._note_tokens: Dict[str, Set[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}  # token -> note ids
+        self._sorted_tokens: Optional[List[str]] = None
+        self._unindexed: Set[str] = set()  # Edited, search index not yet updated
+        self._unsaved: Set[str] = set()  # Edited, not yet in the log
+        self._unsaved_deletes: Set[str] = set()  # Deleted, not yet in the log
+        self._logged: Set[str] = set()  # Edits in the log, not yet in a body file
+        self._deleted: Set[str] = set()  # Deletes in the log, body file not yet removed
+
+        self._condition = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._deadline = 0.0
+        self._closed = False
+        self.log_bytes = 0
+        self._load()
+        self._writer = threading.Thread(target=self._writer_loop, name="NoteStoreWriter", daemon=True)
+        self._writer.start()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        meta = self._read_json(self.meta_file)
+        for note_id, data in meta.items():
+            self.meta[note_id] = NoteMeta(note_id, data["title"], data["created"], data["updated"], data["size"])
+        for note_id, tokens in self._read_json(self.tokens_file).items():
+            if note_id in self.meta:
+                self._index(note_id, set(tokens))
+
+        # Replay edits made after the last compaction
+        if os.path.exists(self.log_file):
+            with open(self.log_file, "rb") as f:
+                for line in f:
+                    try:
+                        op = json.loads(line)
+                    except ValueError:
+                        break  # A torn last line from a crash; everything before it is intact
+                    if op["op"] == "put":
+                        self._apply_put(op["id"], op["body"], op["created"], op["updated"])
+                        self._logged.add(op["id"])
+                    elif op["op"] == "delete":
+                        self._apply_delete(op["id"])
+                        self._logged.discard(op["id"])
+                        self._deleted.add(op["id"])
+                    self.log_bytes += len(line)
+            if self.log_bytes != os.path.getsize(self.log_file):
+                # Cut the torn tail so new entries are not appended after garbage
+                with open(self.log_file, "r+b") as f:
+                    f.truncate(self.log_bytes)
+
+    @staticmethod
+    def _read_json(path: str) -> Dict:
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            return {}
+
+    # ------------------------------------------------------------------
+    # Inverted index
+    # ------------------------------------------------------------------
+    def _index(self, note_id: str, tokens: Set[str]) -> None:
+        old_tokens = self._note_tokens.get(note_id, set())
+        for token in old_tokens - tokens:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(note_id)
+                if not postings:
+                    del self._postings[token]
+                    self._sorted_tokens = None
+        for token in tokens - old_tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                self._postings[token] = postings = set()
+                self._sorted_tokens = None
+            postings.add(note_id)
+        if tokens:
+            self._note_tokens[note_id] = tokens
+        else:
+            self._note_tokens.pop(note_id, None)
+
+    def search(self, query: str, limit: int = 100) -> List[NoteMeta]:
+        """
+        Returns notes containing every query word as a word prefix, newest first. Words
+        typed in the last autosave_delay seconds are not found until the writer indexes them.
+        """
+        words = tokenize(query)
+        if not words:
+            return self.notes()[:limit]
+        with self._condition:  # the writer thread updates the index
+            return self._search(words, limit)
+
+    def _search(self, words: Set[str], limit: int) -> List[NoteMeta]:
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        result: Optional[Set[str]] = None
+        for word in words:
+            matches: Set[str] = set()
+            position = bisect_left(self._sorted_tokens, word)
+            while position < len(self._sorted_tokens) and self._sorted_tokens[position].startswith(word):
+                matches |= self._postings[self._sorted_tokens[position]]
+                position += 1
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+        notes = [self.meta[note_id] for note_id in result if note_id in self.meta]
+        notes.sort(key=lambda note: note.updated, reverse=True)
+        return notes[:limit]
+
+    # ------------------------------------------------------------------
+    # Notes
+    # ------------------------------------------------------------------
+    def notes(self) -> List[NoteMeta]:
+        """Metadata of all notes, most recently edited first. Does not read any bodies."""
+        return sorted(self.meta.values(), key=lambda note: note.updated, reverse=True)
+
+    def get_body(self, note_id: str) -> str:
+        body = self._bodies.get(note_id)
+        if body is None:
+            path = os.path.join(self.bodies_dir, f"{note_id}.txt")
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    body = f.read()
+            except FileNotFoundError:
+                body = ""
+            self._bodies[note_id] = body
+        return body
+
+    def create(self, body: str = "") -> str:
+        note_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        with self._condition:
+            self._apply_put(note_id, body, now, now)
+            self._mark_unsaved(note_id)
+        return note_id
+
+    def update(self, note_id: str, body: str) -> None:
+        """Records an edit; it reaches the disk after the autosave delay."""
+        with self._condition:
+            note = self.meta.get(note_id)
+            if note is None or self._bodies.get(note_id) == body:
+                return
+            # Tokenizing the whole body is left to the writer, not done on every keystroke
+            self._apply_put(note_id, body, note.created, time.time(), index=False)
+            self._mark_unsaved(note_id)
+
+    def delete(self, note_id: str) -> None:
+        with self._condition:
+            self._apply_delete(note_id)
+            self._unsaved.discard(note_id)
+            self._unsaved_deletes.add(note_id)
+            self._schedule()
+
+    def _apply_put(self, note_id: str, body: str, created: float, updated: float, index: bool = True) -> None:
+        self._bodies[note_id] = body
+        self.meta[note_id] = NoteMeta(note_id, title_from_body(body), created, updated, len(body))
+        if index:
+            self._index(note_id, tokenize(body))
+            self._unindexed.discard(note_id)
+        else:
+            self._unindexed.add(note_id)
+
+    def _apply_delete(self, note_id: str) -> None:
+        self.meta.pop(note_id, None)
+        self._bodies.pop(note_id, None)
+        self._unindexed.discard(note_id)
+        self._index(note_id, set())
+
+    def _mark_unsaved(self, note_id: str) -> None:
+        self._unsaved.add(note_id)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        self._deadline = time.monotonic() + self.autosave_delay
+        self._condition.notify()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _writer_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._unsaved and not self._unsaved_deletes and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+            try:
+                self.flush()
+                if self.log_bytes >= self.compact_threshold:
+                    self.compact()
+            except OSError as e:
+                print("Failed to save notes:", e)
+            except Exception:
+                # Keep autosaving whatever went wrong with this round
+                print("Unexpected error while saving notes:")
+                traceback.print_exc()
+
+    def flush(self) -> None:
+        """
+        Appends one log line per note edited (or deleted) since the last flush.
+        Runs on the writer thread; call it directly only after close().
+        """
+        self._reindex()
+        with self._condition:
+            ops = []
+            for note_id in self._unsaved:
+                note = self.meta[note_id]
+                ops.append({"op": "put", "id": note_id, "body": self._bodies[note_id],
+                            "created": note.created, "updated": note.updated})
+            for note_id in self._unsaved_deletes:
+                ops.append({"op": "delete", "id": note_id})
+            self._logged = (self._logged | self._unsaved) - self._unsaved_deletes
+            self._deleted |= self._unsaved_deletes
+            self._unsaved = set()
+            self._unsaved_deletes = set()
+        if not ops:
+            return
+        data = "".join(json.dumps(op) + "\n" for op in ops).encode("utf-8")
+        with self._io_lock:
+            with open(self.log_file, "ab") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            self.log_bytes += len(data)
+
+    def _reindex(self) -> None:
+        """Updates the search index for edited notes, tokenizing outside the lock."""
+        with self._condition:
+            pending = {note_id: self._bodies[note_id] for note_id in self._unindexed if note_id in self._bodies}
+            self._unindexed = set()
+        tokens = {note_id: tokenize(body) for note_id, body in pending.items()}
+        with self._condition:
+            for note_id, note_tokens in tokens.items():
+                # A note edited again meanwhile is back in _unindexed; a deleted one is already unindexed
+                if self._bodies.get(note_id) is pending[note_id]:
+                    self._index(note_id, note_tokens)
+
+    def compact(self) -> None:
+        """
+        Folds the log into the body files and the snapshots, then truncates it.
+        Runs on the writer thread once the log passes compact_threshold.
+        """
+        self.flush()
+        with self._condition:
+            # Unsaved edits are included too, so the snapshot never names a body it lacks. Notes
+            # deleted since the flush above are gone from _bodies; their delete is logged next time.
+            live = (self._logged | self._unsaved) - self._unsaved_deletes
+            bodies = {note_id: self._bodies[note_id] for note_id in live if note_id in self._bodies}
+            deleted = set(self._deleted)
+            meta = {note_id: note.to_json() for note_id, note in self.meta.items()}
+            tokens = {note_id: sorted(note_tokens) for note_id, note_tokens in self._note_tokens.items()}
+        with self._io_lock:
+            for note_id, body in bodies.items():
+                write_atomic(os.path.join(self.bodies_dir, f"{note_id}.txt"), body.encode("utf-8"))
+            for note_id in deleted:
+                path = os.path.join(self.bodies_dir, f"{note_id}.txt")
+                if os.path.exists(path):
+                    os.remove(path)
+            write_atomic(self.tokens_file, json.dumps(tokens).encode("utf-8"))
+            write_atomic(self.meta_file, json.dumps(meta).encode("utf-8"))
+            write_atomic(self.log_file, b"")
+            self.log_bytes = 0
+        with self._condition:
+            self._logged -= bodies.keys()
+            self._deleted -= deleted
+
+    def close(self) -> None:
+        """Saves pending edits and stops the writer thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._writer.join()
+        self.flush()
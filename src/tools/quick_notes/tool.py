@@ -0,0 +1,111 @@
+import os
+from typing import Optional
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QGuiApplication
+from PySide6.QtWidgets import (QHBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QPlainTextEdit,
+                               QPushButton, QSplitter, QVBoxLayout, QWidget)
+
+from src.tools.quick_notes.note_store import NoteStore
+
+
+class QuickNotesWidget(QWidget):
+    """Note list with search on the left, editor on the right. Every edit is autosaved."""
+
+    def __init__(self, state_manager, store: NoteStore, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.store = store
+        self.current_id: Optional[str] = None
+        self.setWindowTitle("Quick Notes")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.resize(560, 420)
+
+        self.search_box = QLineEdit(self)
+        self.search_box.setPlaceholderText("Search notes...")
+        self.note_list = QListWidget(self)
+        new_button = QPushButton("New", self)
+        delete_button = QPushButton("Delete", self)
+        buttons = QHBoxLayout()
+        buttons.addWidget(new_button)
+        buttons.addWidget(delete_button)
+
+        left = QWidget(self)
+        left_layout = QVBoxLayout(left)
+        left_layout.setContentsMargins(0, 0, 0, 0)
+        left_layout.addWidget(self.search_box)
+        left_layout.addWidget(self.note_list)
+        left_layout.addLayout(buttons)
+
+        self.editor = QPlainTextEdit(self)
+        splitter = QSplitter(self)
+        splitter.addWidget(left)
+        splitter.addWidget(self.editor)
+        splitter.setSizes([200, 360])
+        layout = QVBoxLayout(self)
+        layout.addWidget(splitter)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(80)
+        self._search_timer.timeout.connect(self.refresh_list)
+        self.search_box.textChanged.connect(self._search_timer.start)
+        self.note_list.currentItemChanged.connect(self._on_current_changed)
+        self.editor.textChanged.connect(self._on_text_changed)
+        new_button.clicked.connect(self.new_note)
+        delete_button.clicked.connect(self.delete_note)
+
+        self.state_manager.theme_manager.register(self)
+        self.refresh_list()
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def refresh_list(self) -> None:
+        self.note_list.blockSignals(True)
+        self.note_list.clear()
+        for note in self.store.search(self.search_box.text(), limit=500):
+            item = QListWidgetItem(note.title)
+            item.setData(Qt.UserRole, note.id)
+            self.note_list.addItem(item)
+            if note.id == self.current_id:
+                self.note_list.setCurrentItem(item)
+        self.note_list.blockSignals(False)
+
+    def _on_current_changed(self, item: Optional[QListWidgetItem], _previous=None) -> None:
+        self.current_id = item.data(Qt.UserRole) if item else None
+        self.editor.blockSignals(True)
+        # The body is only read from disk now, when the note is opened
+        self.editor.setPlainText(self.store.get_body(self.current_id) if self.current_id else "")
+        self.editor.blockSignals(False)
+
+    def _on_text_changed(self) -> None:
+        if self.current_id is None:
+            return
+        self.store.update(self.current_id, self.editor.toPlainText())
+        item = self.note_list.currentItem()
+        if item is not None:
+            item.setText(self.store.meta[self.current_id].title)
+
+    def new_note(self) -> None:
+        self.current_id = self.store.create()
+        self.search_box.clear()
+        self.refresh_list()
+        self._on_current_changed(self.note_list.currentItem())
+        self.editor.setFocus()
+
+    def delete_note(self) -> None:
+        if self.current_id is None:
+            return
+        self.store.delete(self.current_id)
+        self.current_id = None
+        self.refresh_list()
+        self._on_current_changed(None)
+
+
+def create_tool(state_manager, parent=None) -> QuickNotesWidget:
+    app_config = state_manager.app_config
+    store = NoteStore(os.path.join(state_manager.settings_manager.data_dir, "quick_notes"),
+                      autosave_delay=app_config.get("notes_autosave_delay_ms", 500) / 1000.0)
+    QGuiApplication.instance().aboutToQuit.connect(store.close)
+    return QuickNotesWidget(state_manager, store, parent)
@@ -0,0 +1,77 @@
+import time
+from typing import Callable, Optional
+
+from src.core.scheduler import ScheduledCall, Scheduler
+
+
+class Countdown:
+    """
+    A pausable countdown backed by the shared Scheduler.
+
+    Only the finishing call is kept on the wheel while running; the remaining time is
+    computed from the monotonic clock whenever it is read, so nothing ticks while
+    no one is looking.
+    """
+
+    def __init__(self, scheduler: Scheduler, on_finished: Callable[[], None]) -> None:
+        self.scheduler = scheduler
+        self.on_finished = on_finished
+        self.duration = 0.0
+        self._remaining = 0.0  # seconds left while paused
+        self._deadline: Optional[float] = None  # monotonic deadline while running
+        self._call: Optional[ScheduledCall] = None
+
+    @property
+    def running(self) -> bool:
+        return self._deadline is not None
+
+    def remaining(self) -> float:
+        """Returns the seconds left."""
+        if self._deadline is not None:
+            return max(0.0, self._deadline - time.monotonic())
+        return self._remaining
+
+    def set_duration(self, seconds: float) -> None:
+        self.stop()
+        self.duration = max(0.0, seconds)
+        self._remaining = self.duration
+
+    def start(self) -> None:
+        if self.running or self._remaining <= 0:
+            return
+        self._deadline = time.monotonic() + self._remaining
+        self._call = self.scheduler.call_at(self._deadline, self._finish)
+
+    def pause(self) -> None:
+        if not self.running:
+            return
+        self._remaining = self.remaining()
+        self._deadline = None
+        self.scheduler.cancel(self._call)
+        self._call = None
+
+    def stop(self) -> None:
+        """Pauses and rewinds to the full duration."""
+        self.pause()
+        self._remaining = self.duration
+
+    def _finish(self) -> None:
+        self._deadline = None
+        self._call = None
+        self._remaining = 0.0
+        self.on_finished()
+
+
+def format_seconds(seconds: float, tenths: bool = False) -> str:
+    """Formats seconds as [h:]mm:ss, optionally with tenths."""
+    if not tenths:
+        # Countdowns show 00:01 until they are actually done
+        seconds = int(seconds + 0.999)
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    text = f"{int(minutes):02d}:{int(secs):02d}"
+    if hours:
+        text = f"{int(hours)}:{text}"
+    if tenths:
+        text += f".{int(seconds * 10) % 10}"
+    return text
@@ -0,0 +1,105 @@
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QApplication, QHBoxLayout, QLabel, QPushButton, QSpinBox, QVBoxLayout, QWidget
+
+from src.tools.quick_timer.countdown import Countdown, format_seconds
+
+
+class QuickTimerWidget(QWidget):
+    """
+    A single countdown. The display refreshes once a second through the shared
+    scheduler, and only while the window is visible.
+    """
+
+    def __init__(self, state_manager, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.scheduler = state_manager.scheduler
+        self.countdown = Countdown(self.scheduler, self._on_finished)
+        self._display_call = None
+        self.setWindowTitle("Quick Timer")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+
+        self.minutes = QSpinBox(self)
+        self.minutes.setRange(0, 999)
+        self.minutes.setSuffix(" min")
+        self.minutes.setValue(5)
+        self.seconds = QSpinBox(self)
+        self.seconds.setRange(0, 59)
+        self.seconds.setSuffix(" s")
+        self.time_label = QLabel(self)
+        self.time_label.setAlignment(Qt.AlignCenter)
+        font = QFont(self.time_label.font())
+        font.setPointSize(28)
+        self.time_label.setFont(font)
+        self.start_button = QPushButton("Start", self)
+        reset_button = QPushButton("Reset", self)
+
+        inputs = QHBoxLayout()
+        inputs.addWidget(self.minutes)
+        inputs.addWidget(self.seconds)
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.start_button)
+        buttons.addWidget(reset_button)
+        layout = QVBoxLayout(self)
+        layout.addLayout(inputs)
+        layout.addWidget(self.time_label)
+        layout.addLayout(buttons)
+
+        self.minutes.valueChanged.connect(self._on_duration_changed)
+        self.seconds.valueChanged.connect(self._on_duration_changed)
+        self.start_button.clicked.connect(self.toggle)
+        reset_button.clicked.connect(self.reset)
+
+        self._on_duration_changed()
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def _on_duration_changed(self, *_args) -> None:
+        self.countdown.set_duration(self.minutes.value() * 60 + self.seconds.value())
+        self._update_display()
+
+    def toggle(self) -> None:
+        if self.countdown.running:
+            self.countdown.pause()
+        else:
+            if self.countdown.remaining() <= 0:
+                # Finished: start over from the full duration
+                self.countdown.stop()
+            self.countdown.start()
+        self._update_display()
+
+    def reset(self) -> None:
+        self.countdown.stop()
+        self._update_display()
+
+    def _on_finished(self) -> None:
+        QApplication.beep()
+        self._update_display()
+        self.show()
+        self.raise_()
+
+    def _update_display(self) -> None:
+        self.time_label.setText(format_seconds(self.countdown.remaining()))
+        self.start_button.setText("Pause" if self.countdown.running else "Start")
+        self.minutes.setEnabled(not self.countdown.running)
+        self.seconds.setEnabled(not self.countdown.running)
+
+    def showEvent(self, event) -> None:
+        if self._display_call is None:
+            self._display_call = self.scheduler.call_every(1000, self._update_display)
+        self._update_display()
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self.scheduler.cancel(self._display_call)
+        self._display_call = None
+        super().hideEvent(event)
+
+
+def create_tool(state_manager, parent=None) -> QuickTimerWidget:
+    return QuickTimerWidget(state_manager, parent)
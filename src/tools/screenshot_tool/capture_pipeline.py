@@ -0,0 +1,146 @@
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Optional
+
+from PySide6.QtCore import QObject, QRect, Qt, Signal
+from PySide6.QtGui import QGuiApplication, QImage, QImageWriter, QScreen
+
+
+class CaptureResult:
+    __slots__ = ("path", "width", "height", "thumbnail", "elapsed_ms", "error")
+
+    def __init__(self, path: str, width: int, height: int, thumbnail: Optional[QImage],
+                 elapsed_ms: float, error: str = "") -> None:
+        self.path = path
+        self.width = width
+        self.height = height
+        self.thumbnail = thumbnail
+        self.elapsed_ms = elapsed_ms
+        self.error = error
+
+
+class CapturePipeline(QObject):
+    """
+    Screen capture with all heavy lifting off the GUI thread.
+
+    capture() only grabs the screen on the GUI thread (Qt requires that) and passes the
+    QImage to a worker pool. QImage is implicitly shared and never modified on the GUI
+    thread afterwards, so no pixel copy is made. Workers crop, convert, encode (PNG or
+    JPEG) and make the thumbnail for the recent-captures strip. At most max_pending
+    captures can be in flight; further requests are refused with captureDropped, so a
+    burst never queues up unbounded work or blocks the widget.
+    """
+    captured = Signal(object)  # CaptureResult, delivered to GUI-thread receivers via a queued connection
+    captureDropped = Signal()
+
+    def __init__(self, output_dir: str, image_format: str = "png", quality: int = -1, workers: int = 2,
+                 max_pending: int = 4, thumbnail_size: int = 96, recent_count: int = 12,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        self.image_format = image_format.lower()
+        self.quality = quality
+        self.thumbnail_size = thumbnail_size
+        self.recent: Deque[CaptureResult] = deque(maxlen=recent_count)
+        self.captured.connect(self._remember)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="CaptureWorker")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self.dropped = 0
+
+    def capture(self, screen: Optional[QScreen] = None, rect: Optional[QRect] = None) -> bool:
+        """
+        Grabs the screen (primary by default), optionally cropped to rect given in logical
+        coordinates relative to the screen's top-left corner. Returns False if the pipeline
+        is saturated and the capture was dropped.
+        """
+        if not self._slots.acquire(blocking=False):
+            self.dropped += 1
+            self.captureDropped.emit()
+            return False
+        started = time.perf_counter()
+        screen = screen or QGuiApplication.primaryScreen()
+        image = screen.grabWindow(0).toImage()
+        if rect is not None:
+            # Convert from logical screen coordinates to device pixels of the grabbed image
+            dpr = image.devicePixelRatio()
+            rect = QRect(int(rect.x() * dpr), int(rect.y() * dpr), int(rect.width() * dpr), int(rect.height() * dpr))
+        self._executor.submit(self._process, image, rect, started)
+        return True
+
+    def _remember(self, result: CaptureResult) -> None:
+        if not result.error:
+            self.recent.appendleft(result)
+
+    def _next_path(self) -> str:
+        """
+        Reserves a new file name by creating it with O_EXCL, so captures finishing in the
+        same millisecond on different workers (or an existing file) get a numbered suffix
+        instead of overwriting each other.
+        """
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        millis = int(time.time() * 1000) % 1000
+        extension = "jpg" if self.image_format in ("jpg", "jpeg") else self.image_format
+        base = os.path.join(self.output_dir, f"Screenshot_{stamp}_{millis:03d}")
+        suffix = 0
+        while True:
+            path = f"{base}.{extension}" if suffix == 0 else f"{base}_{suffix}.{extension}"
+            try:
+                os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+                return path
+            except FileExistsError:
+                suffix += 1
+
+    def _process(self, image: QImage, rect: Optional[QRect], started: float) -> None:
+        path = ""
+        try:
+            if rect is not None:
+                image = image.copy(rect.intersected(image.rect()))
+            if self.image_format in ("jpg", "jpeg"):
+                image = image.convertToFormat(QImage.Format_RGB32)
+            path = self._next_path()
+            writer = QImageWriter(path, self.image_format.encode("ascii"))
+            if self.quality >= 0:
+                writer.setQuality(self.quality)
+            if not writer.write(image):
+                if os.path.exists(path):
+                    os.remove(path)  # the empty file reserved by _next_path
+                raise OSError(writer.errorString())
+            thumbnail = None
+            if self.thumbnail_size > 0:
+                thumbnail = image.scaled(self.thumbnail_size, self.thumbnail_size,
+                                         Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            result = CaptureResult(path, image.width(), image.height(), thumbnail,
+                                   (time.perf_counter() - started) * 1000)
+        except Exception as e:
+            result = CaptureResult(path, 0, 0, None, (time.perf_counter() - started) * 1000, error=str(e))
+        finally:
+            self._slots.release()
+        self.captured.emit(result)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+_pipeline: Optional[CapturePipeline] = None
+
+
+def get_pipeline(state_manager) -> CapturePipeline:
+    """Returns the shared pipeline, creating it on first use."""
+    global _pipeline
+    if _pipeline is None:
+        app_config = state_manager.app_config
+        output_dir = state_manager.settings_manager.get_setting(
+            "screenshot_dir", os.path.join(state_manager.settings_manager.data_dir, "screenshots"))
+        _pipeline = CapturePipeline(
+            output_dir,
+            image_format=app_config.get("screenshot_format", "png"),
+            quality=app_config.get("screenshot_quality", -1),
+            workers=app_config.get("screenshot_workers", 2),
+            max_pending=app_config.get("screenshot_max_pending", 4),
+        )
+        QGuiApplication.instance().aboutToQuit.connect(_pipeline.shutdown)
+    return _pipeline
@@ -0,0 +1,76 @@
+from typing import Optional
+
+from PySide6.QtCore import QSize, Qt, QTimer, QUrl
+from PySide6.QtGui import QDesktopServices, QIcon, QPixmap
+from PySide6.QtWidgets import QLabel, QListView, QListWidget, QListWidgetItem, QPushButton, QVBoxLayout, QWidget
+
+from src.tools.screenshot_tool.capture_pipeline import CapturePipeline, CaptureResult, get_pipeline
+
+
+class ScreenshotToolWidget(QWidget):
+    """Capture button plus a strip of recent captures; double-click a capture to open it."""
+
+    def __init__(self, state_manager, pipeline: CapturePipeline, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.pipeline = pipeline
+        self.setWindowTitle("Screenshot")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.resize(420, 220)
+
+        capture_button = QPushButton("Capture screen", self)
+        self.status_label = QLabel("", self)
+        thumb = pipeline.thumbnail_size
+        self.recent_strip = QListWidget(self)
+        self.recent_strip.setViewMode(QListView.IconMode)
+        self.recent_strip.setFlow(QListView.LeftToRight)
+        self.recent_strip.setWrapping(False)
+        self.recent_strip.setIconSize(QSize(thumb, thumb))
+        self.recent_strip.setFixedHeight(thumb + 24)
+        layout = QVBoxLayout(self)
+        layout.addWidget(capture_button)
+        layout.addWidget(self.recent_strip)
+        layout.addWidget(self.status_label)
+
+        capture_button.clicked.connect(self.capture)
+        self.pipeline.captured.connect(self._on_captured)
+        self.pipeline.captureDropped.connect(lambda: self.status_label.setText("Busy, capture skipped"))
+        self.recent_strip.itemDoubleClicked.connect(
+            lambda item: QDesktopServices.openUrl(QUrl.fromLocalFile(item.data(Qt.UserRole))))
+        for result in reversed(self.pipeline.recent):
+            self._add_thumbnail(result)
+
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def capture(self) -> None:
+        # Get out of the way first, then grab once the window is gone
+        self.hide()
+        QTimer.singleShot(200, self, self._capture_and_show)
+
+    def _capture_and_show(self) -> None:
+        self.pipeline.capture()
+        self.show()
+
+    def _on_captured(self, result: CaptureResult) -> None:
+        if result.error:
+            self.status_label.setText(f"Capture failed: {result.error}")
+            return
+        self.status_label.setText(f"Saved {result.width}x{result.height} in {result.elapsed_ms:.0f} ms")
+        self._add_thumbnail(result)
+
+    def _add_thumbnail(self, result: CaptureResult) -> None:
+        item = QListWidgetItem()
+        if result.thumbnail is not None:
+            item.setIcon(QIcon(QPixmap.fromImage(result.thumbnail)))
+        item.setData(Qt.UserRole, result.path)
+        item.setToolTip(result.path)
+        self.recent_strip.insertItem(0, item)
+        while self.recent_strip.count() > self.pipeline.recent.maxlen:
+            self.recent_strip.takeItem(self.recent_strip.count() - 1)
+
+
+def create_tool(state_manager, parent=None) -> ScreenshotToolWidget:
+    return ScreenshotToolWidget(state_manager, get_pipeline(state_manager), parent)
@@ -0,0 +1,96 @@
+import importlib.util
+from typing import List, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QLabel, QListWidget, QListWidgetItem, QVBoxLayout, QWidget
+
+
+def has_implementation(module: str) -> bool:
+    """True if the tool's module exists, without importing it."""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+class SettingsWidget(QWidget):
+    """
+    Chooses which tools appear in the menu. Changes are saved to "enabled_tools" right
+    away; the menu picks them up the next time it opens, and background services of
+    newly enabled tools start immediately.
+    """
+
+    def __init__(self, state_manager, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.registry = state_manager.tool_registry
+        self.setWindowTitle("Settings")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.resize(300, 420)
+
+        grid = state_manager.app_config.get("menu_grid", {"rows": 3, "columns": 3})
+        # One cell always holds the settings tool itself
+        self.menu_slots = grid.get("rows", 3) * grid.get("columns", 3) - 1
+
+        self.tool_list = QListWidget(self)
+        self.status_label = QLabel("", self)
+        self.status_label.setWordWrap(True)
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("Tools shown in the menu:", self))
+        layout.addWidget(self.tool_list)
+        layout.addWidget(self.status_label)
+
+        self._fill()
+        self.tool_list.itemChanged.connect(self._on_item_changed)
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def _enabled(self) -> List[str]:
+        return list(self.state_manager.settings_manager.get_setting("enabled_tools", []))
+
+    def _fill(self) -> None:
+        available = self.state_manager.app_config.get("available_tools", [])
+        enabled = set(self._enabled())
+        self.tool_list.blockSignals(True)
+        self.tool_list.clear()
+        for spec in sorted(self.registry.specs.values(), key=lambda spec: spec.priority):
+            if spec.name in self.registry.ALWAYS_ENABLED or spec.name not in available:
+                continue
+            item = QListWidgetItem(spec.display_name)
+            item.setData(Qt.UserRole, spec.name)
+            if has_implementation(spec.module):
+                item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
+                item.setCheckState(Qt.Checked if spec.name in enabled else Qt.Unchecked)
+            else:
+                item.setFlags(Qt.NoItemFlags)
+                item.setText(f"{spec.display_name} (coming soon)")
+            self.tool_list.addItem(item)
+        self.tool_list.blockSignals(False)
+        self._update_status()
+
+    def _on_item_changed(self, item: QListWidgetItem) -> None:
+        name = item.data(Qt.UserRole)
+        enabled = [tool for tool in self._enabled() if tool != name]
+        if item.checkState() == Qt.Checked:
+            enabled.append(name)
+        self.state_manager.settings_manager.update_setting("enabled_tools", enabled)
+        self.registry.start_services(self.state_manager)
+        self._update_status()
+
+    def _update_status(self) -> None:
+        shown = len(self.registry.enabled_specs()) - len(self.registry.ALWAYS_ENABLED)
+        if shown > self.menu_slots:
+            self.status_label.setText(f"The menu has room for {self.menu_slots} tools; "
+                                      f"the {shown - self.menu_slots} lowest in this list are not shown.")
+        else:
+            self.status_label.setText(f"{shown} of {self.menu_slots} menu cells in use.")
+
+    def showEvent(self, event) -> None:
+        self._fill()
+        super().showEvent(event)
+
+
+def create_tool(state_manager, parent=None) -> SettingsWidget:
+    return SettingsWidget(state_manager, parent)
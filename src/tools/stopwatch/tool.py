@@ -0,0 +1,134 @@
+import time
+from typing import List, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QListWidget, QPushButton, QVBoxLayout, QWidget
+
+from src.tools.quick_timer.countdown import format_seconds
+
+
+class Stopwatch:
+    """Elapsed time measured against the monotonic clock; it needs no timer at all to keep time."""
+
+    def __init__(self) -> None:
+        self._accumulated = 0.0
+        self._started: Optional[float] = None
+        self.laps: List[float] = []
+
+    @property
+    def running(self) -> bool:
+        return self._started is not None
+
+    def elapsed(self) -> float:
+        if self._started is None:
+            return self._accumulated
+        return self._accumulated + time.monotonic() - self._started
+
+    def start(self) -> None:
+        if self._started is None:
+            self._started = time.monotonic()
+
+    def pause(self) -> None:
+        if self._started is not None:
+            self._accumulated = self.elapsed()
+            self._started = None
+
+    def reset(self) -> None:
+        self._accumulated = 0.0
+        self._started = time.monotonic() if self.running else None
+        self.laps.clear()
+
+    def lap(self) -> float:
+        self.laps.append(self.elapsed())
+        return self.laps[-1]
+
+
+class StopwatchWidget(QWidget):
+    """
+    Stopwatch with laps. The display refreshes every 100 ms through the shared scheduler,
+    and only while the stopwatch is both running and visible.
+    """
+
+    DISPLAY_INTERVAL_MS = 100
+
+    def __init__(self, state_manager, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.scheduler = state_manager.scheduler
+        self.stopwatch = Stopwatch()
+        self._display_call = None
+        self.setWindowTitle("Stopwatch")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+
+        self.time_label = QLabel(self)
+        self.time_label.setAlignment(Qt.AlignCenter)
+        font = QFont(self.time_label.font())
+        font.setPointSize(28)
+        self.time_label.setFont(font)
+        self.start_button = QPushButton("Start", self)
+        lap_button = QPushButton("Lap", self)
+        reset_button = QPushButton("Reset", self)
+        self.lap_list = QListWidget(self)
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.start_button)
+        buttons.addWidget(lap_button)
+        buttons.addWidget(reset_button)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.time_label)
+        layout.addLayout(buttons)
+        layout.addWidget(self.lap_list)
+
+        self.start_button.clicked.connect(self.toggle)
+        lap_button.clicked.connect(self.lap)
+        reset_button.clicked.connect(self.reset)
+
+        self._update_display()
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def toggle(self) -> None:
+        if self.stopwatch.running:
+            self.stopwatch.pause()
+        else:
+            self.stopwatch.start()
+        self._sync_display_call()
+        self._update_display()
+
+    def lap(self) -> None:
+        if not self.stopwatch.running:
+            return
+        elapsed = self.stopwatch.lap()
+        self.lap_list.insertItem(0, f"Lap {len(self.stopwatch.laps)}   {format_seconds(elapsed, tenths=True)}")
+
+    def reset(self) -> None:
+        self.stopwatch.reset()
+        self.lap_list.clear()
+        self._update_display()
+
+    def _update_display(self) -> None:
+        self.time_label.setText(format_seconds(self.stopwatch.elapsed(), tenths=True))
+        self.start_button.setText("Pause" if self.stopwatch.running else "Start")
+
+    def _sync_display_call(self) -> None:
+        wanted = self.stopwatch.running and self.isVisible()
+        if wanted and self._display_call is None:
+            self._display_call = self.scheduler.call_every(self.DISPLAY_INTERVAL_MS, self._update_display)
+        elif not wanted and self._display_call is not None:
+            self.scheduler.cancel(self._display_call)
+            self._display_call = None
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._sync_display_call()
+        self._update_display()
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._sync_display_call()
+
+
+def create_tool(state_manager, parent=None) -> StopwatchWidget:
+    return StopwatchWidget(state_manager, parent)
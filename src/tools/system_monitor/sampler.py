@@ -0,0 +1,183 @@
+import os
+import time
+from array import array
+from itertools import islice
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class RingBuffer:
+    """Fixed-capacity series of floats in a preallocated array('d'); the oldest value is overwritten."""
+    __slots__ = ("capacity", "values", "head", "count")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.values = array("d", bytes(8 * capacity))
+        self.head = 0
+        self.count = 0
+
+    def append(self, value: float) -> None:
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def at(self, index: int) -> float:
+        """Returns the index-th value, oldest first."""
+        return self.values[(self.head - self.count + index) % self.capacity]
+
+    def last(self) -> float:
+        return self.values[(self.head - 1) % self.capacity] if self.count else 0.0
+
+    def max(self) -> float:
+        # Until the buffer wraps, the live values are the first count slots; islice walks them without a copy
+        return max(self.values) if self.count == self.capacity else max(islice(self.values, self.count), default=0.0)
+
+
+class ProcReader:
+    """
+    Reads CPU, memory, disk and network counters from /proc (Linux).
+
+    The /proc files are opened once and re-read from offset 0 on each sample, which
+    avoids the open/close cost on every tick.
+    """
+
+    FILES = ("/proc/stat", "/proc/meminfo", "/proc/diskstats", "/proc/net/dev")
+
+    def __init__(self) -> None:
+        self.available = all(os.path.exists(path) for path in self.FILES)
+        self._files = {path: open(path, "rb") for path in self.FILES} if self.available else {}
+        self._skip_device: Dict[bytes, bool] = {}
+
+    def _read(self, path: str) -> bytes:
+        f = self._files[path]
+        f.seek(0)
+        return f.read()
+
+    def cpu_times(self) -> Tuple[int, int]:
+        """Returns (busy, total) jiffies summed over all CPUs."""
+        fields = self._read("/proc/stat").split(b"\n", 1)[0].split()[1:]
+        values = [int(value) for value in fields]
+        idle = values[3] + (values[4] if len(values) > 4 else 0)  # idle + iowait
+        total = sum(values[:8])  # guest time is already included in user/nice
+        return total - idle, total
+
+    def memory(self) -> Tuple[int, int]:
+        """Returns (used, total) in kB."""
+        info: Dict[bytes, int] = {}
+        for line in self._read("/proc/meminfo").split(b"\n"):
+            key, _, rest = line.partition(b":")
+            if key in (b"MemTotal", b"MemAvailable"):
+                info[key] = int(rest.split()[0])
+                if len(info) == 2:
+                    break
+        total = info.get(b"MemTotal", 0)
+        return total - info.get(b"MemAvailable", total), total
+
+    def disk_bytes(self) -> Tuple[int, int]:
+        """Returns (read, written) bytes summed over whole disks (partitions and virtual devices skipped)."""
+        read = written = 0
+        for line in self._read("/proc/diskstats").split(b"\n"):
+            fields = line.split()
+            if len(fields) < 10:
+                continue
+            name = fields[2]
+            skip = self._skip_device.get(name)
+            if skip is None:
+                skip = name.startswith((b"loop", b"ram", b"zram", b"dm-")) or self._is_partition(name)
+                self._skip_device[name] = skip
+            if skip:
+                continue
+            read += int(fields[5]) * 512
+            written += int(fields[9]) * 512
+        return read, written
+
+    @staticmethod
+    def _is_partition(name: bytes) -> bool:
+        decoded = name.decode("ascii", "replace")
+        return os.path.exists(f"/sys/class/block/{decoded}/partition")
+
+    def net_bytes(self) -> Tuple[int, int]:
+        """Returns (received, sent) bytes summed over all interfaces except loopback."""
+        received = sent = 0
+        for line in self._read("/proc/net/dev").split(b"\n")[2:]:
+            name, _, rest = line.partition(b":")
+            if not rest or name.strip() == b"lo":
+                continue
+            fields = rest.split()
+            received += int(fields[0])
+            sent += int(fields[8])
+        return received, sent
+
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+
+class SystemSampler(QObject):
+    """
+    Samples system counters into ring buffers at an adaptive rate.
+
+    While the monitor is visible it samples every active_interval_ms; while hidden it
+    samples every hidden_interval_ms, or not at all if that is 0. Each series is a
+    RingBuffer, so a sample writes a handful of floats and allocates nothing that stays
+    around. The sampler's own cost (CPU time of the GUI thread, which runs sample(), spent
+    in it) is recorded as the "monitor_cpu" series.
+    """
+    sampled = Signal()
+
+    SERIES = ("cpu", "memory", "disk_read", "disk_write", "net_recv", "net_sent", "monitor_cpu")
+
+    def __init__(self, history: int = 120, active_interval_ms: int = 1000, hidden_interval_ms: int = 0,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.reader = ProcReader()
+        self.series: Dict[str, RingBuffer] = {name: RingBuffer(history) for name in self.SERIES}
+        self.active_interval_ms = active_interval_ms
+        self.hidden_interval_ms = hidden_interval_ms
+        self.memory_total_kb = 0
+        self._previous: Optional[Tuple[float, Tuple[int, int], Tuple[int, int], Tuple[int, int]]] = None
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.sample)
+        self.set_active(False)
+
+    def set_active(self, active: bool) -> None:
+        """Switches between the visible (fast) and hidden (throttled or suspended) rate."""
+        interval = self.active_interval_ms if active else self.hidden_interval_ms
+        if not self.reader.available or interval <= 0:
+            self._timer.stop()
+            self._previous = None  # Rates across a pause would be meaningless
+            return
+        self._timer.setInterval(interval)
+        if not self._timer.isActive():
+            self._timer.start()
+            self.sample()
+
+    def sample(self) -> None:
+        cpu_start = time.thread_time()  # this thread only, unlike process_time()
+        now = time.monotonic()
+        cpu = self.reader.cpu_times()
+        disk = self.reader.disk_bytes()
+        net = self.reader.net_bytes()
+        memory_used, self.memory_total_kb = self.reader.memory()
+        series = self.series
+        series["memory"].append(100.0 * memory_used / self.memory_total_kb if self.memory_total_kb else 0.0)
+
+        if self._previous is not None:
+            last_time, last_cpu, last_disk, last_net = self._previous
+            elapsed = max(now - last_time, 1e-6)
+            total = cpu[1] - last_cpu[1]
+            series["cpu"].append(100.0 * (cpu[0] - last_cpu[0]) / total if total > 0 else 0.0)
+            series["disk_read"].append((disk[0] - last_disk[0]) / elapsed)
+            series["disk_write"].append((disk[1] - last_disk[1]) / elapsed)
+            series["net_recv"].append((net[0] - last_net[0]) / elapsed)
+            series["net_sent"].append((net[1] - last_net[1]) / elapsed)
+            series["monitor_cpu"].append(100.0 * (time.thread_time() - cpu_start) / elapsed)
+        self._previous = (now, cpu, disk, net)
+        self.sampled.emit()
+
+    def shutdown(self) -> None:
+        self._timer.stop()
+        self.reader.close()
@@ -0,0 +1,50 @@
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtWidgets import QWidget
+
+from src.tools.system_monitor.sampler import RingBuffer
+
+
+class Sparkline(QWidget):
+    """
+    Draws a RingBuffer as a line chart.
+
+    The pen is built once and the points are read straight out of the buffer, so a
+    repaint creates no lists or polygons. With fixed_max set (e.g. 100 for percentages)
+    the scale is fixed; otherwise it follows the largest value in the buffer.
+    """
+
+    def __init__(self, buffer: RingBuffer, fixed_max: Optional[float] = None, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.buffer = buffer
+        self.fixed_max = fixed_max
+        self._pen = QPen(QColor("#3498DB"), 1.5)
+        self.setMinimumSize(120, 28)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, False)
+
+    def set_color(self, color: QColor) -> None:
+        self._pen.setColor(color)
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        buffer = self.buffer
+        count = buffer.count
+        if count < 2:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._pen)
+        width = self.width() - 1
+        height = self.height() - 2
+        top = self.fixed_max or buffer.max() or 1.0
+        step = width / (buffer.capacity - 1)
+        x0 = width - (count - 1) * step
+        previous_x = x0
+        previous_y = height + 1 - height * min(buffer.at(0), top) / top
+        for index in range(1, count):
+            x = x0 + index * step
+            y = height + 1 - height * min(buffer.at(index), top) / top
+            painter.drawLine(int(previous_x), int(previous_y), int(x), int(y))
+            previous_x, previous_y = x, y
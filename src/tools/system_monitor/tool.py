@@ -0,0 +1,86 @@
+from typing import Dict, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QGuiApplication
+from PySide6.QtWidgets import QGridLayout, QLabel, QWidget
+
+from src.tools.system_monitor.sampler import SystemSampler
+from src.tools.system_monitor.sparkline import Sparkline
+
+
+def format_rate(bytes_per_second: float) -> str:
+    for unit in ("B/s", "KB/s", "MB/s"):
+        if bytes_per_second < 1024:
+            return f"{bytes_per_second:.0f} {unit}"
+        bytes_per_second /= 1024
+    return f"{bytes_per_second:.1f} GB/s"
+
+
+class SystemMonitorWidget(QWidget):
+    """CPU, memory, disk and network sparklines. Sampling runs fast only while this window is visible."""
+
+    ROWS = (
+        ("cpu", "CPU", 100.0),
+        ("memory", "Memory", 100.0),
+        ("disk_read", "Disk read", None),
+        ("disk_write", "Disk write", None),
+        ("net_recv", "Net down", None),
+        ("net_sent", "Net up", None),
+    )
+
+    def __init__(self, state_manager, sampler: SystemSampler, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.sampler = sampler
+        self.setWindowTitle("System Monitor")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+
+        layout = QGridLayout(self)
+        self.value_labels: Dict[str, QLabel] = {}
+        self.sparklines: Dict[str, Sparkline] = {}
+        for row, (key, title, fixed_max) in enumerate(self.ROWS):
+            layout.addWidget(QLabel(title, self), row, 0)
+            self.value_labels[key] = QLabel("-", self)
+            self.value_labels[key].setMinimumWidth(80)
+            layout.addWidget(self.value_labels[key], row, 1)
+            self.sparklines[key] = Sparkline(sampler.series[key], fixed_max, self)
+            layout.addWidget(self.sparklines[key], row, 2)
+        self.monitor_label = QLabel("", self)
+        layout.addWidget(self.monitor_label, len(self.ROWS), 0, 1, 3)
+        if not sampler.reader.available:
+            self.monitor_label.setText("System counters are only available on Linux (/proc).")
+
+        self.sampler.sampled.connect(self._on_sampled)
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+        for sparkline in self.sparklines.values():
+            sparkline.set_color(theme.color("primary"))
+
+    def _on_sampled(self) -> None:
+        series = self.sampler.series
+        self.value_labels["cpu"].setText(f"{series['cpu'].last():.0f} %")
+        self.value_labels["memory"].setText(f"{series['memory'].last():.0f} %")
+        for key in ("disk_read", "disk_write", "net_recv", "net_sent"):
+            self.value_labels[key].setText(format_rate(series[key].last()))
+        self.monitor_label.setText(f"Monitor overhead: {series['monitor_cpu'].last():.2f} % CPU (GUI thread)")
+        for sparkline in self.sparklines.values():
+            sparkline.update()
+
+    def showEvent(self, event) -> None:
+        self.sampler.set_active(True)
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self.sampler.set_active(False)
+        super().hideEvent(event)
+
+
+def create_tool(state_manager, parent=None) -> SystemMonitorWidget:
+    app_config = state_manager.app_config
+    sampler = SystemSampler(history=app_config.get("system_monitor_history", 120),
+                            active_interval_ms=app_config.get("system_monitor_interval_ms", 1000),
+                            hidden_interval_ms=app_config.get("system_monitor_hidden_interval_ms", 0))
+    QGuiApplication.instance().aboutToQuit.connect(sampler.shutdown)
+    return SystemMonitorWidget(state_manager, sampler, parent)
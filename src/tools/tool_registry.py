@@ -0,0 +1,114 @@
+import importlib
+from typing import Dict, List
+
+
+class ToolSpec:
+    """
+    Static metadata for a tool shown in the menu grid.
+
+    Only this metadata is needed to draw the menu; the implementation module is imported
+    the first time the tool is activated. The module must expose
+    create_tool(state_manager, parent=None) returning the tool's QWidget.
+
+    A tool that has to run in the background from startup (e.g. to record the clipboard)
+    names a separate, lighter service module exposing start_service(state_manager).
+    """
+
+    def __init__(self, name: str, priority: int, display_name: str = "", icon_key: str = "",
+                 module: str = "", service: str = "") -> None:
+        self.name = name
+        self.priority = priority
+        self.display_name = display_name or name.replace("_", " ").title()
+        self.icon_key = icon_key or name
+        self.module = module or f"src.tools.{name}.tool"
+        self.service = service
+
+
+# Tools are listed in menu order; "settings" is always first and cannot be disabled.
+TOOL_SPECS: List[ToolSpec] = [
+    ToolSpec("settings", 0),
+    ToolSpec("quick_notes", 10),
+    ToolSpec("clipboard_manager", 20, service="src.tools.clipboard_manager.monitor"),
+    ToolSpec("screenshot_tool", 30, display_name="Screenshot"),
+    ToolSpec("quick_timer", 40),
+    ToolSpec("pomodoro_timer", 50, display_name="Pomodoro"),
+    ToolSpec("stopwatch", 60),
+    ToolSpec("calculator", 70),
+    ToolSpec("weather", 80),
+    ToolSpec("calendar", 90),
+    ToolSpec("app_shortcuts", 100, display_name="Apps"),
+    ToolSpec("file_shortcuts", 110, display_name="Files", service="src.tools.file_shortcuts.file_index"),
+    ToolSpec("folder_shortcuts", 120, display_name="Folders", service="src.tools.file_shortcuts.file_index"),
+    ToolSpec("system_monitor", 130),
+    ToolSpec("counter", 140),
+    ToolSpec("currency_converter_planned", 150, display_name="Currency"),
+    ToolSpec("unit_converter_planned", 160, display_name="Units"),
+]
+
+
+class ToolRegistry:
+    """
+    Knows which tools exist and which are enabled, and creates tools on first use.
+
+    A tool is enabled when it is listed in both app_config's available_tools and the
+    user's enabled_tools. Modules of tools that are not enabled are never imported.
+    """
+
+    ALWAYS_ENABLED = ("settings",)
+
+    def __init__(self, settings_manager) -> None:
+        self.settings_manager = settings_manager
+        self.debug: bool = settings_manager.app_config.get("debug", False)
+        self.specs: Dict[str, ToolSpec] = {spec.name: spec for spec in TOOL_SPECS}
+        self.instances: Dict[str, object] = {}
+        self.services: Dict[str, object] = {}
+
+    def is_enabled(self, name: str) -> bool:
+        if name in self.ALWAYS_ENABLED:
+            return name in self.specs
+        available = self.settings_manager.app_config.get("available_tools", [])
+        enabled = self.settings_manager.get_setting("enabled_tools", [])
+        return name in self.specs and name in available and name in enabled
+
+    def enabled_specs(self) -> List[ToolSpec]:
+        """Returns the specs of all enabled tools, ordered by grid priority."""
+        specs = [spec for spec in self.specs.values() if self.is_enabled(spec.name)]
+        return sorted(specs, key=lambda spec: spec.priority)
+
+    def start_services(self, state_manager) -> None:
+        """Starts the background services of enabled tools. Call once the UI is up."""
+        for spec in self.enabled_specs():
+            if spec.service and spec.name not in self.services:
+                module = importlib.import_module(spec.service)
+                self.services[spec.name] = module.start_service(state_manager)
+
+    def get(self, name: str):
+        """Returns the tool instance if it has already been created, else None."""
+        return self.instances.get(name)
+
+    def activate(self, name: str, state_manager, parent=None):
+        """
+        Shows the tool, importing its module and building its widget on first use.
+        Returns the tool widget, or None if the tool is disabled or has no implementation yet.
+        """
+        if not self.is_enabled(name):
+            if self.debug:
+                print("Tool is not enabled:", name)
+            return None
+        tool = self.instances.get(name)
+        if tool is None:
+            spec = self.specs[name]
+            try:
+                module = importlib.import_module(spec.module)
+            except ModuleNotFoundError as e:
+                if e.name is None or not spec.module.startswith(e.name):
+                    raise
+                if self.debug:
+                    print("Tool has no implementation yet:", name)
+                return None
+            tool = module.create_tool(state_manager, parent)
+            self.instances[name] = tool
+        tool.show()
+        tool.raise_()
+        tool.activateWindow()
+        return tool
@@ -0,0 +1,61 @@
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QLineEdit, QListWidget, QVBoxLayout, QWidget
+
+from src.core.expression_engine import ExpressionEngine, IncrementalEvaluator, format_number
+from src.core.unit_converter import UnitGraph
+
+
+class UnitConverterWidget(QWidget):
+    """Converts a value (which may be an expression) into every unit of the chosen unit's category."""
+
+    def __init__(self, state_manager, engine: ExpressionEngine, graph: UnitGraph,
+                 parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.evaluator = IncrementalEvaluator(engine)
+        self.graph = graph
+        self.setWindowTitle("Units")
+        self.setWindowFlags(Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.resize(320, 400)
+
+        self.input = QLineEdit("1", self)
+        self.unit_box = QComboBox(self)
+        for category, units in graph.units.items():
+            for unit in units:
+                self.unit_box.addItem(f"{unit}  ({category})", unit)
+        self.unit_box.setCurrentIndex(max(0, self.unit_box.findData("m")))
+        self.error_label = QLabel("", self)
+        self.result_list = QListWidget(self)
+        row = QHBoxLayout()
+        row.addWidget(self.input, 1)
+        row.addWidget(self.unit_box)
+        layout = QVBoxLayout(self)
+        layout.addLayout(row)
+        layout.addWidget(self.error_label)
+        layout.addWidget(self.result_list)
+
+        self.input.textChanged.connect(self.refresh)
+        self.unit_box.currentIndexChanged.connect(self.refresh)
+
+        self.refresh()
+        self.state_manager.theme_manager.register(self)
+
+    def apply_theme(self, theme) -> None:
+        self.setStyleSheet(theme.stylesheets["tool_window"])
+
+    def refresh(self, *_args) -> None:
+        value = self.evaluator.update(self.input.text())
+        self.error_label.setText(self.evaluator.error)
+        self.result_list.clear()
+        unit = self.unit_box.currentData()
+        if value is None or unit is None:
+            return
+        self.result_list.addItems([f"{format_number(converted)} {target}"
+                                   for target, converted in self.graph.convert_all(value, unit)
+                                   if target != unit])
+
+
+def create_tool(state_manager, parent=None) -> UnitConverterWidget:
+    return UnitConverterWidget(state_manager, ExpressionEngine.shared(), UnitGraph.shared(), parent)
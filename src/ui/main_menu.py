@@ -1,91 +1,146 @@
-import json
-import os
+from typing import Dict, List, Optional, Tuple
 
 from PySide6.QtWidgets import QWidget, QGridLayout
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QGuiApplication, QIcon
+from PySide6.QtGui import QIcon
 
+from src.core.screen_layout import ScreenLayout
+from src.core.theme_manager import CompiledTheme
 from src.ui.menu_button_widget import MenuButtonWidget  # Our custom button widget
 
 class MainMenu(QWidget):
+    """
+    The tool grid shown below the floating widget.
+
+    The menu is built once and then only shown, hidden and moved. refresh() compares
+    the menu size and tool list against what was last built and only resizes or rebuilds
+    the cells when they actually changed. Theme switches come from the ThemeManager
+    through apply_theme().
+    """
     def __init__(self, state_manager, parent=None) -> None:
         super().__init__(parent)
         self.state_manager = state_manager
 
         app_config = self.state_manager.settings_manager.app_config
-        user_settings = self.state_manager.settings_manager.user_settings
-
-        # Load theme colors
-        theme_colors_path = self.state_manager.settings_manager.theme_colors_file
-        try:
-            with open(theme_colors_path, "r") as f:
-                all_themes = json.load(f)
-        except Exception:
-            all_themes = {}
-        theme_name = user_settings.get("theme", "dark-1")
-        theme = all_themes.get(theme_name, {})
-        background_color = theme.get("background", "#333333")
 
         # Grid configuration
         grid_config = app_config.get("menu_grid", {"rows": 3, "columns": 3})
         self.rows = grid_config.get("rows", 3)
         self.columns = grid_config.get("columns", 3)
 
-        # Menu size
-        menu_size_options = app_config.get("menu_size_options",
-            {"small": [250, 350], "medium": [300, 400], "large": [350, 450]})
-        menu_size_key = user_settings.get("menu_size", "medium")
-        size_option = menu_size_options.get(menu_size_key, [300, 400])
-        self.menu_width, self.menu_height = size_option[0], size_option[1]
-
-        # Tools list: prepend "settings" as the first tool.
-        self.available_tools = ["settings"] + app_config.get("available_tools", [])
-
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Tool)
-        self.setFixedSize(self.menu_width, self.menu_height)
-        self.setStyleSheet(f"background-color: {background_color};")
+
+        # What the menu is currently built for (filled in by refresh() and apply_theme())
+        self.theme: Optional[CompiledTheme] = None
+        self.menu_width, self.menu_height = 0, 0
+        self.available_tools: List[str] = []
+        self.cells: Dict[str, MenuButtonWidget] = {}
+        self._cell_widgets: List[QWidget] = []
 
         self.setup_ui()
+        self.refresh()
+        self.state_manager.theme_manager.register(self)
         self.original_floating_pos = None
         self.owner = None  # To keep a reference to the owning FloatingWidget
 
     def setup_ui(self) -> None:
-        layout = QGridLayout()
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(10)
+        self.grid_layout = QGridLayout()
+        self.grid_layout.setContentsMargins(10, 10, 10, 10)
+        self.grid_layout.setSpacing(10)
+        self.setLayout(self.grid_layout)
+
+    def bind_config_watcher(self, watcher) -> None:
+        """Keeps the menu in sync with config changes made on disk."""
+        watcher.menuSizeChanged.connect(self.refresh)
+        watcher.enabledToolsChanged.connect(self.refresh)
+        watcher.assetsChanged.connect(self.refresh_icons)
+
+    def refresh_icons(self) -> None:
+        for tool_name, cell_widget in self.cells.items():
+            cell_widget.set_icon(self._get_icon(tool_name))
+
+    def _menu_size(self) -> Tuple[int, int]:
+        app_config = self.state_manager.settings_manager.app_config
+        menu_size_options = app_config.get("menu_size_options",
+            {"small": [250, 350], "medium": [300, 400], "large": [350, 450]})
+        menu_size_key = self.state_manager.settings_manager.get_setting("menu_size", "medium")
+        size_option = menu_size_options.get(menu_size_key, [300, 400])
+        return size_option[0], size_option[1]
+
+    def _tool_list(self) -> List[str]:
+        # Only enabled tools get a cell; "settings" is always the first one.
+        return [spec.name for spec in self.state_manager.tool_registry.enabled_specs()]
+
+    def refresh(self, *_args) -> None:
+        """Brings the menu in line with the current settings, touching only what changed."""
+        menu_width, menu_height = self._menu_size()
+        tools = self._tool_list()
+
+        tools_changed = tools != self.available_tools
+        if tools_changed:
+            self.available_tools = tools
+            self._rebuild_cells()
+        if (menu_width, menu_height) != (self.menu_width, self.menu_height) or tools_changed:
+            self.menu_width, self.menu_height = menu_width, menu_height
+            self._apply_size()
+
+    def _rebuild_cells(self) -> None:
+        for widget in self._cell_widgets:
+            self.grid_layout.removeWidget(widget)
+            widget.deleteLater()
+        self._cell_widgets = []
+        self.cells = {}
+
         total_cells = self.rows * self.columns
         for index in range(total_cells):
             row = index // self.columns
             col = index % self.columns
             if index < len(self.available_tools):
                 tool_name = self.available_tools[index]
-                display_text = tool_name.replace("_", " ").title()
-                icon_path = self._get_icon_path(tool_name)
-                icon = QIcon(icon_path) if icon_path else QIcon()
-                cell_widget = MenuButtonWidget(icon, display_text)
-                cell_width = self.menu_width // self.columns - 20
-                cell_height = self.menu_height // self.rows - 20
-                cell_widget.setFixedSize(cell_width, cell_height)
-                layout.addWidget(cell_widget, row, col)
+                spec = self.state_manager.tool_registry.specs[tool_name]
+                icon = self._get_icon(tool_name)
+                cell_widget = MenuButtonWidget(icon, spec.display_name, self)
+                cell_widget.apply_theme(self._current_theme())
+                cell_widget.clicked.connect(lambda name=tool_name: self.open_tool(name))
+                self.cells[tool_name] = cell_widget
             else:
-                layout.addWidget(QWidget(self), row, col)
-        self.setLayout(layout)
-
-    def _get_icon_path(self, tool_name: str) -> str:
-        asset_config_path = self.state_manager.settings_manager.assets_config_file
-        if not os.path.exists(asset_config_path):
-            return ""
-        try:
-            with open(asset_config_path, "r") as f:
-                asset_config = json.load(f)
-        except Exception:
-            asset_config = {}
-        theme_name : str = self.state_manager.settings_manager.get_setting("theme", "dark-1")
-        if theme_name.__contains__("light"):
-            icon_key = f"{tool_name}_icon_light"
-        else: 
-            icon_key = f"{tool_name}_icon_dark"
-        return asset_config.get(icon_key, "")
+                cell_widget = QWidget(self)
+            self._cell_widgets.append(cell_widget)
+            self.grid_layout.addWidget(cell_widget, row, col)
+
+    def _apply_size(self) -> None:
+        self.setFixedSize(self.menu_width, self.menu_height)
+        cell_width = self.menu_width // self.columns - 20
+        cell_height = self.menu_height // self.rows - 20
+        for cell_widget in self.cells.values():
+            cell_widget.setFixedSize(cell_width, cell_height)
+
+    def _current_theme(self) -> CompiledTheme:
+        return self.theme or self.state_manager.theme_manager.theme()
+
+    def apply_theme(self, theme: CompiledTheme) -> None:
+        """Restyles the menu and its cells in place (called by the ThemeManager)."""
+        icons_changed = self.theme is None or self.theme.icon_variant != theme.icon_variant
+        self.theme = theme
+        self.setStyleSheet(theme.stylesheets["menu"])
+        self.setPalette(theme.palette)
+        for cell_widget in self.cells.values():
+            cell_widget.apply_theme(theme)
+        if icons_changed:
+            self.refresh_icons()
+
+    def _get_icon(self, tool_name: str) -> QIcon:
+        icon_key = self.state_manager.tool_registry.specs[tool_name].icon_key
+        pixmap = self.state_manager.asset_registry.pixmap(
+            icon_key, MenuButtonWidget.ICON_SIZE, self.devicePixelRatioF(), theme=self._current_theme())
+        return QIcon(pixmap) if pixmap else QIcon()
+
+    def open_tool(self, tool_name: str) -> None:
+        """Closes the menu and activates the tool (its module is imported on first use)."""
+        if self.owner:
+            self.hide_menu(self.owner)
+            self.owner.state_manager.menu_open = False
+        self.state_manager.tool_registry.activate(tool_name, self.state_manager)
 
     def show_below_widget(self, floating_widget: QWidget) -> None:
         self.owner = floating_widget  # Store reference to the owning widget
@@ -93,10 +148,7 @@ class MainMenu(QWidget):
         fw_geom = floating_widget.geometry()
         desired_x = fw_geom.left()
         desired_y = fw_geom.bottom()
-        screen = QGuiApplication.screenAt(floating_widget.pos())
-        if not screen:
-            screen = QGuiApplication.primaryScreen()
-        screen_geom = screen.availableGeometry()
+        screen_geom = ScreenLayout.shared().available_geometry_at(floating_widget.x(), floating_widget.y())
         if desired_x + self.menu_width > screen_geom.right():
             desired_x = screen_geom.right() - self.menu_width - 10
         if desired_y + self.menu_height > screen_geom.bottom():
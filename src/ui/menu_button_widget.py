@@ -1,6 +1,8 @@
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
 from PySide6.QtCore import Qt, Signal, QEvent, QRect
-from PySide6.QtGui import QPixmap, QIcon, QFontMetrics, QColor, QPainter
+from PySide6.QtGui import QPixmap, QIcon, QColor, QPainter
+
+from src.ui.text_fitter import TextFitter
 
 class MenuButtonWidget(QWidget):
     """
@@ -11,6 +13,8 @@ class MenuButtonWidget(QWidget):
     """
     clicked = Signal()
 
+    ICON_SIZE = 48
+
     def __init__(self, icon: QIcon, text: str, parent=None):
         super().__init__(parent)
         self._icon_label = QLabel(self)
@@ -20,7 +24,7 @@ class MenuButtonWidget(QWidget):
 
         self._hovered = False
         self._normal_bg = QColor("#00000000")   # fully transparent
-        self._hover_bg = QColor("#444444")        # darker hover color
+        self._hover_bg = QColor("#444444")        # replaced by the theme's hover color
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -34,45 +38,22 @@ class MenuButtonWidget(QWidget):
         self.setMouseTracking(True)
 
     def set_icon(self, icon: QIcon):
-        pixmap = icon.pixmap(48, 48)
+        pixmap = icon.pixmap(self.ICON_SIZE, self.ICON_SIZE)
         if pixmap.isNull():
-            placeholder_pixmap = QPixmap(48, 48)
+            placeholder_pixmap = QPixmap(self.ICON_SIZE, self.ICON_SIZE)
             placeholder_pixmap.fill(QColor("#888888"))
             self._icon_label.setPixmap(placeholder_pixmap)
         else:
             self._icon_label.setPixmap(pixmap)
 
-    def _truncate_to_two_lines(self, text: str, font, max_width: int) -> str:
-        fm = QFontMetrics(font)
-        words = text.split()
-        lines = []
-        current_line = ""
-        for word in words:
-            test_line = (current_line + " " + word).strip()
-            if fm.horizontalAdvance(test_line) > max_width:
-                lines.append(current_line)
-                current_line = word
-                if len(lines) == 2:
-                    truncated = self._force_ellipsis(current_line, fm, max_width)
-                    lines[-1] = truncated
-                    return "\n".join(lines)
-            else:
-                current_line = test_line
-        if current_line:
-            lines.append(current_line)
-        if len(lines) > 2:
-            lines = lines[:2]
-            lines[-1] = self._force_ellipsis(lines[-1], fm, max_width)
-        if len(lines) == 1:
-            if fm.horizontalAdvance(lines[0]) > max_width:
-                lines[0] = self._force_ellipsis(lines[0], fm, max_width)
-        return "\n".join(lines)
+    def apply_theme(self, theme) -> None:
+        """Takes the hover color and text style from a CompiledTheme."""
+        self._hover_bg = theme.color("hover")
+        self._text_label.setStyleSheet(theme.stylesheets["menu_button_text"])
+        self.update()
 
-    def _force_ellipsis(self, text: str, fm: QFontMetrics, max_width: int) -> str:
-        ellipsis = "..."
-        while text and fm.horizontalAdvance(text + ellipsis) > max_width:
-            text = text[:-1]
-        return text + ellipsis
+    def _truncate_to_two_lines(self, text: str, font, max_width: int) -> str:
+        return TextFitter.shared().fit_lines(text, font, max_width, max_lines=2)
 
     def enterEvent(self, event):
         self._hovered = True
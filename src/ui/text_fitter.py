@@ -0,0 +1,136 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Dict, List, Tuple
+
+from PySide6.QtGui import QFont, QFontMetrics
+
+
+class TextFitter:
+    """
+    Fits text into a fixed number of lines of a given pixel width, eliding the end with "...".
+
+    Character advances are measured once per font and cached; line breaks and the
+    ellipsis cut are then found by binary search over the cumulative advances, so fitting
+    a label costs O(n) additions plus O(log n) lookups instead of one full measurement per
+    character. Each cut is verified with a single real measurement, which absorbs kerning.
+    Results are memoized by (text, font, max width, max lines), so rebuilding a menu with
+    the same labels costs nothing. Usable for any long user content (clipboard entries,
+    note previews, ...).
+    """
+    _instance = None
+
+    ELLIPSIS = "..."
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self._metrics: Dict[str, QFontMetrics] = {}
+        self._advances: Dict[str, Dict[str, int]] = {}
+        self._results: "OrderedDict[Tuple[str, str, int, int], str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls) -> "TextFitter":
+        """Returns the process-wide instance, so all widgets share one cache."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def clear(self) -> None:
+        self._metrics.clear()
+        self._advances.clear()
+        self._results.clear()
+
+    def fit_lines(self, text: str, font: QFont, max_width: int, max_lines: int = 2) -> str:
+        """
+        Word-wraps text into at most max_lines lines no wider than max_width pixels and
+        returns them joined with newlines. If the text does not fit, the last line ends
+        with an ellipsis. Words wider than a whole line are broken mid-word.
+        """
+        font_key = font.key()
+        result_key = (text, font_key, max_width, max_lines)
+        result = self._results.get(result_key)
+        if result is not None:
+            self._results.move_to_end(result_key)
+            self.hits += 1
+            return result
+        self.misses += 1
+
+        result = "\n".join(self._wrap(" ".join(text.split()), font, font_key, max_width, max_lines))
+        self._results[result_key] = result
+        if len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        return result
+
+    def elide(self, text: str, font: QFont, max_width: int) -> str:
+        """Returns text cut to a single line of max_width pixels, ending in "..." if it was cut."""
+        return self.fit_lines(text, font, max_width, max_lines=1)
+
+    def _font_state(self, font: QFont, font_key: str) -> Tuple[QFontMetrics, Dict[str, int]]:
+        fm = self._metrics.get(font_key)
+        if fm is None:
+            fm = QFontMetrics(font)
+            self._metrics[font_key] = fm
+            self._advances[font_key] = {}
+        return fm, self._advances[font_key]
+
+    def _prefix_widths(self, text: str, fm: QFontMetrics, advances: Dict[str, int]) -> List[int]:
+        """Returns P where P[i] is the (approximate) width of text[:i]."""
+        widths = []
+        for char in text:
+            advance = advances.get(char)
+            if advance is None:
+                advance = fm.horizontalAdvance(char)
+                advances[char] = advance
+            widths.append(advance)
+        return [0] + list(accumulate(widths))
+
+    def _wrap(self, text: str, font: QFont, font_key: str, max_width: int, max_lines: int) -> List[str]:
+        if not text:
+            return [""]
+        fm, advances = self._font_state(font, font_key)
+        prefix = self._prefix_widths(text, fm, advances)
+        ellipsis_width = fm.horizontalAdvance(self.ELLIPSIS)
+        n = len(text)
+        lines: List[str] = []
+        start = 0
+        while start < n:
+            # Largest end such that text[start:end] fits
+            end = bisect_right(prefix, prefix[start] + max_width) - 1
+            if end >= n and fm.horizontalAdvance(text[start:]) <= max_width:
+                lines.append(text[start:])
+                break
+            if len(lines) == max_lines - 1:
+                lines.append(self._elide_from(text, start, prefix, fm, max_width, ellipsis_width))
+                break
+            end = min(end, n)
+            # Break at the last space that keeps the line within max_width
+            space = text.rfind(" ", start, end + 1)
+            while space > start and fm.horizontalAdvance(text[start:space]) > max_width:
+                space = text.rfind(" ", start, space)
+            if space > start:
+                line_end, next_start = space, space + 1
+            else:
+                # A single word wider than the line: break it
+                line_end = self._shrink_to_fit(text, start, max(end, start + 1), fm, max_width)
+                next_start = line_end
+            lines.append(text[start:line_end])
+            start = next_start
+        return lines
+
+    def _elide_from(self, text: str, start: int, prefix: List[int], fm: QFontMetrics,
+                    max_width: int, ellipsis_width: int) -> str:
+        """Returns text[start:] cut so that it plus the ellipsis fits in max_width."""
+        end = bisect_right(prefix, prefix[start] + max_width - ellipsis_width) - 1
+        end = max(start, min(end, len(text)))
+        while end > start and fm.horizontalAdvance(text[start:end] + self.ELLIPSIS) > max_width:
+            end -= 1
+        return text[start:end].rstrip() + self.ELLIPSIS
+
+    @staticmethod
+    def _shrink_to_fit(text: str, start: int, end: int, fm: QFontMetrics, max_width: int) -> int:
+        """Steps end back while the measured width (with kerning) is still too wide."""
+        while end > start + 1 and fm.horizontalAdvance(text[start:end]) > max_width:
+            end -= 1
+        return end
@@ -1,11 +1,14 @@
-import json
-import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import QPoint, QRect, Qt, QPropertyAnimation, QEasingCurve, Property
-from PySide6.QtGui import QGuiApplication, QImage, QImageReader, QMouseEvent, QPainter, QPen, QPixmap, QIcon
+from PySide6.QtCore import QPoint, QRect, QRectF, Qt, QPropertyAnimation, QEasingCurve, Property, QTimer
+from PySide6.QtGui import QImage, QMouseEvent, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QWidget
 
+from src.core.asset_registry import AssetRegistry
+from src.core.config_watcher import ConfigWatcher
+from src.core.debug_metrics import DebugMetrics
+from src.core.screen_layout import ScreenLayout
 from src.state.state_manager import StateManager
 from src.ui.main_menu import MainMenu
 
@@ -21,6 +24,9 @@ class FloatingWidget(QWidget):
         self.handle_size: int = app_config.get("resize_handle_size", 20)
         self.debug: bool = app_config.get("debug", False)
         self.show_debug_borders: bool = app_config.get("show_debug_borders", False)
+        # While dragging the resize handle, draw from a precomputed mipmap pyramid with a
+        # cheap transform and do the single high-quality rescale on mouse release.
+        self.fast_resize_preview: bool = app_config.get("fast_resize_preview", True)
 
         # From user settings: whether to show the resize icon
         self.show_resize_icon: bool = self.state_manager.settings_manager.get_setting("show_widget_resize_icon", True)
@@ -39,7 +45,23 @@ class FloatingWidget(QWidget):
 
         # Placeholders for original images
         self.original_image: Optional[QImage] = None
-        self.original_handle_icon: Optional[QPixmap] = None
+        self.original_handle_icon: Optional[QImage] = None
+        # Downscaled copies of the originals, largest first (built once at load time)
+        self.icon_pyramid: List[QImage] = []
+        self.handle_pyramid: List[QImage] = []
+
+        # Shared, cached access to assets_config.json images
+        self.asset_registry: AssetRegistry = self.state_manager.asset_registry
+
+        # Cached screen geometries for drag clamping
+        self.screen_layout: ScreenLayout = ScreenLayout.shared()
+
+        # Icon, handle and debug borders pre-composed into one pixmap; see _composite_pixmap()
+        self._composite: Optional[QPixmap] = None
+        self._composite_key: Optional[Tuple[Any, ...]] = None
+        metrics = DebugMetrics.shared()
+        self._paint_stat = metrics.timing("floating_widget.paint")
+        self._composite_stat = metrics.timing("floating_widget.composite")
 
         # Load main icon
         self.selected_icon: Optional[QPixmap] = self.load_main_icon()
@@ -61,8 +83,11 @@ class FloatingWidget(QWidget):
         )
         self.move(last_pos.get("x", 100), last_pos.get("y", 100))
 
-        # Reference to the MainMenu (if open)
+        # The MainMenu is built once (lazily or pre-warmed) and then only shown and hidden
         self.main_menu: Optional[MainMenu] = None
+        self.config_watcher: Optional[ConfigWatcher] = None
+        if app_config.get("prewarm_menu", True):
+            QTimer.singleShot(app_config.get("menu_prewarm_delay_ms", 500), self, self._ensure_menu)
 
         # Set up opacity animation
         self._opacity = 1.0
@@ -82,31 +107,14 @@ class FloatingWidget(QWidget):
     opacity = Property(float, get_opacity, set_opacity)
 
     def load_main_icon(self) -> Optional[QPixmap]:
-        assets_path = self.state_manager.settings_manager.assets_config_file
-        if not os.path.exists(assets_path):
-            if self.debug:
-                print("Assets config file not found:", assets_path)
-            return None
-
-        with open(assets_path, "r") as f:
-            asset_config = json.load(f)
-
         selected_key = self.state_manager.settings_manager.get_setting("selected_widget_icon", "main_icon_1")
-        icon_path = asset_config.get(selected_key)
-        if not icon_path or not os.path.exists(icon_path):
-            if self.debug:
-                print("Icon path not found:", icon_path)
-            return None
-
-        reader = QImageReader(icon_path)
-        reader.setAutoTransform(True)
-        image = reader.read()
-        if image.isNull():
-            if self.debug:
-                print("Failed to load image from:", icon_path)
+        image = self.asset_registry.image(selected_key)
+        if image is None:
             return None
 
         self.original_image = image
+        dpr: float = self.devicePixelRatioF()
+        self.icon_pyramid = self._build_pyramid(image, int(self.max_size * dpr), int(self.min_size * dpr))
         pixmap = QPixmap.fromImage(image)
         pixmap.setDevicePixelRatio(self.devicePixelRatioF())
         return pixmap
@@ -115,28 +123,59 @@ class FloatingWidget(QWidget):
         if not self.show_resize_icon:
             return None
 
-        assets_path = self.state_manager.settings_manager.assets_config_file
-        if not os.path.exists(assets_path):
+        original_handle_icon = self.asset_registry.image("resize_icon_1")
+        if original_handle_icon is None:
             return None
-
-        with open(assets_path, "r") as f:
-            asset_config = json.load(f)
-        resize_icon_path = asset_config.get("resize_icon_1")
-        if resize_icon_path and os.path.exists(resize_icon_path):
-            original_handle_icon = QPixmap(resize_icon_path)
-            self.original_handle_icon = original_handle_icon
-            resize_icon_scale_factor = self.state_manager.app_config.get("resize_icon_scale_factor", 0.2)
-            final_handle_icon_size = max(10, int(self.width() * resize_icon_scale_factor))
-            return original_handle_icon.scaled(final_handle_icon_size, final_handle_icon_size,
-                                               Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        return None
-
-    def _scale_main_icon(self, widget_size: int) -> None:
+        self.original_handle_icon = original_handle_icon
+        resize_icon_scale_factor = self.state_manager.app_config.get("resize_icon_scale_factor", 0.2)
+        self.handle_pyramid = self._build_pyramid(original_handle_icon,
+                                                  max(10, int(self.max_size * resize_icon_scale_factor)), 10)
+        return self.asset_registry.pixmap("resize_icon_1", self._handle_icon_size())
+
+    def _handle_icon_size(self) -> int:
+        resize_icon_scale_factor = self.state_manager.app_config.get("resize_icon_scale_factor", 0.2)
+        return max(10, int(self.width() * resize_icon_scale_factor))
+
+    @staticmethod
+    def _build_pyramid(image: QImage, max_edge: int, min_edge: int) -> List[QImage]:
+        """
+        Builds a mipmap pyramid for an image: the first level fits a max_edge box, every
+        following level is half the previous one, down to the first level below min_edge.
+        """
+        levels: List[QImage] = []
+        level = image
+        if max(level.width(), level.height()) > max_edge:
+            level = level.scaled(max_edge, max_edge, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        levels.append(level)
+        while max(level.width(), level.height()) > max(1, min_edge):
+            level = level.scaled(max(1, level.width() // 2), max(1, level.height() // 2),
+                                 Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            levels.append(level)
+        return levels
+
+    @staticmethod
+    def _nearest_level(pyramid: List[QImage], fallback: QImage, target_size: int) -> QImage:
+        """Returns the smallest pyramid level that still covers target_size, or the original image."""
+        best = fallback
+        for level in pyramid:
+            if max(level.width(), level.height()) < target_size:
+                break
+            best = level
+        return best
+
+    def _scale_main_icon(self, widget_size: int, fast: bool = False) -> None:
+        """
+        Rescales the main icon (and the resize handle) for the given widget size.
+        With fast=True the nearest pyramid level is scaled with Qt.FastTransformation, which is
+        cheap enough to run on every mouse-move while resizing.
+        """
         if not self.original_image:
             return
         dpr: float = self.devicePixelRatioF()
         target_size: int = int(widget_size * dpr)
-        scaled_image = self.original_image.scaled(target_size, target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        transformation = Qt.FastTransformation if fast else Qt.SmoothTransformation
+        source = self._nearest_level(self.icon_pyramid, self.original_image, target_size)
+        scaled_image = source.scaled(target_size, target_size, Qt.KeepAspectRatio, transformation)
         pixmap = QPixmap.fromImage(scaled_image)
         pixmap.setDevicePixelRatio(dpr)
         self.selected_icon = pixmap
@@ -145,10 +184,13 @@ class FloatingWidget(QWidget):
         self.setFixedSize(logical_size)
 
         if self.show_resize_icon and self.original_handle_icon:
-            resize_icon_scale_factor = self.state_manager.app_config.get("resize_icon_scale_factor", 0.2)
-            final_handle_icon_size = max(10, int(self.width() * resize_icon_scale_factor))
-            self.handle_pixmap = self.original_handle_icon.scaled(final_handle_icon_size, final_handle_icon_size,
-                                                                   Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            handle_size = self._handle_icon_size()
+            if fast:
+                source = self._nearest_level(self.handle_pyramid, self.original_handle_icon, handle_size)
+                self.handle_pixmap = QPixmap.fromImage(
+                    source.scaled(handle_size, handle_size, Qt.KeepAspectRatio, Qt.FastTransformation))
+            else:
+                self.handle_pixmap = self.asset_registry.pixmap("resize_icon_1", handle_size)
 
     def _get_handle_rect(self) -> QRect:
         if not self.show_resize_icon or not self.handle_pixmap:
@@ -165,7 +207,48 @@ class FloatingWidget(QWidget):
         return self._get_handle_rect().contains(pos)
 
     def paintEvent(self, event) -> None:
+        started = time.perf_counter()
         painter = QPainter(self)
+        if self.resizing:
+            # The size changes on every move, so a composite would be rebuilt each time anyway
+            self._paint_layers(painter)
+        else:
+            composite = self._composite_pixmap()
+            dpr = composite.devicePixelRatio()
+            target = QRectF(event.rect())
+            source = QRectF(target.x() * dpr, target.y() * dpr, target.width() * dpr, target.height() * dpr)
+            painter.drawPixmap(target, composite, source)
+        painter.end()
+        self._paint_stat.add((time.perf_counter() - started) * 1000.0)
+
+    def _composite_pixmap(self) -> QPixmap:
+        """
+        Returns icon + resize handle + debug borders as one pixmap, so a repaint is a single
+        blit of the exposed rect. It is rebuilt only when size, DPR, icon, handle or the
+        relevant flags change (pixmap cacheKey()s change whenever an icon is replaced).
+        """
+        dpr = self.devicePixelRatioF()
+        handle = self.handle_pixmap if self.show_resize_icon else None
+        key = (self.width(), self.height(), dpr,
+               self.selected_icon.cacheKey() if self.selected_icon else 0,
+               handle.cacheKey() if handle else 0,
+               self.debug and self.show_debug_borders)
+        if self._composite is not None and key == self._composite_key:
+            return self._composite
+
+        started = time.perf_counter()
+        composite = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+        composite.setDevicePixelRatio(dpr)
+        composite.fill(Qt.transparent)
+        painter = QPainter(composite)
+        self._paint_layers(painter)
+        painter.end()
+        self._composite = composite
+        self._composite_key = key
+        self._composite_stat.add((time.perf_counter() - started) * 1000.0)
+        return composite
+
+    def _paint_layers(self, painter: QPainter) -> None:
         if self.selected_icon:
             painter.drawPixmap(0, 0, self.selected_icon)
         else:
@@ -206,13 +289,10 @@ class FloatingWidget(QWidget):
             new_size = max(self.min_size, min(new_size, self.max_size))
             self.setFixedSize(new_size, new_size)
             if self.original_image:
-                self._scale_main_icon(new_size)
+                self._scale_main_icon(new_size, fast=self.fast_resize_preview)
         elif self.dragging and not self.state_manager.menu_open:
             new_pos = event.globalPosition().toPoint() - self.drag_offset
-            screen = QGuiApplication.screenAt(new_pos)
-            if screen is None:
-                screen = self.screen()
-            screen_geom = screen.availableGeometry()
+            screen_geom = self.screen_layout.available_geometry_at(new_pos.x(), new_pos.y(), self.screen())
             margin = 50
             new_x = max(screen_geom.left() + margin,
                         min(new_pos.x(), screen_geom.right() - self.width() - margin))
@@ -233,6 +313,8 @@ class FloatingWidget(QWidget):
             if self.resizing:
                 self.resizing = False
                 new_size = self.width()
+                if self.fast_resize_preview and self.original_image:
+                    self._scale_main_icon(new_size)
                 self.state_manager.settings_manager.update_setting("last_widget_size", new_size)
             elif self.dragging:
                 self.dragging = False
@@ -248,9 +330,58 @@ class FloatingWidget(QWidget):
             self.toggle_menu()
         super().mouseDoubleClickEvent(event)
 
+    def _ensure_menu(self) -> MainMenu:
+        """Returns the menu, building it the first time it is needed."""
+        if self.main_menu is None:
+            self.main_menu = MainMenu(self.state_manager)
+            if self.config_watcher:
+                self.main_menu.bind_config_watcher(self.config_watcher)
+        return self.main_menu
+
+    def bind_config_watcher(self, watcher: ConfigWatcher) -> None:
+        """Applies config changes made on disk while the app is running."""
+        self.config_watcher = watcher
+        watcher.widgetSizeChanged.connect(self._on_widget_size_changed)
+        watcher.settingChanged.connect(self._on_setting_changed)
+        watcher.assetsChanged.connect(self._reload_icons)
+        if self.main_menu:
+            self.main_menu.bind_config_watcher(watcher)
+
+    def _on_widget_size_changed(self, size: int) -> None:
+        if self.resizing:
+            return
+        widget_size = max(self.min_size, min(size, self.max_size))
+        if widget_size == self.width():
+            return
+        if self.original_image:
+            self._scale_main_icon(widget_size)
+        else:
+            self.setFixedSize(widget_size, widget_size)
+        self.update()
+
+    def _on_setting_changed(self, key: str, value: Any) -> None:
+        if key == "selected_widget_icon":
+            self._reload_icons()
+        elif key == "show_widget_resize_icon":
+            # Only the handle corner changes
+            old_rect = self._get_handle_rect()
+            self.show_resize_icon = bool(value)
+            self.handle_pixmap = self.load_resize_icon()
+            self.update(old_rect.united(self._get_handle_rect()))
+        elif key == "last_position" and isinstance(value, dict) and not self.dragging:
+            if not self.state_manager.menu_open:
+                self.move(value.get("x", self.x()), value.get("y", self.y()))
+
+    def _reload_icons(self) -> None:
+        self.selected_icon = self.load_main_icon()
+        self.handle_pixmap = self.load_resize_icon()
+        if self.original_image:
+            self._scale_main_icon(self.width())
+        self.update()
+
     def toggle_menu(self) -> None:
         """
-        If the menu is closed, create and show it below the widget.
+        If the menu is closed, show it below the widget.
         Otherwise, hide the menu and restore the widget position.
         """
         if self.state_manager.menu_open:
@@ -260,8 +391,9 @@ class FloatingWidget(QWidget):
             self.state_manager.menu_open = False
         else:
             # Show the menu
-            self.main_menu = MainMenu(self.state_manager)
-            self.main_menu.show_below_widget(self)
+            main_menu = self._ensure_menu()
+            main_menu.refresh()
+            main_menu.show_below_widget(self)
             self.state_manager.menu_open = True
 
     def enterEvent(self, event: QMouseEvent) -> None: